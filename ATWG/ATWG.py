@@ -23,11 +23,23 @@
 
 #------------------------------------------------------------------------------
 # Standard
+import os                           # file extension
 import argparse                     # argument parser
 import itertools                    # spinning progress bar
-import re                           # regex, needed for number string separation
+import math                         # floor
+import bisect                       # change point lookup
+import json                         # plan output
+import time                         # plan runtime
 # Self
 from ATWG.waves.waves import waves  # waveform generator
+from ATWG.waves import slew         # feasibility check
+from ATWG.waves import units        # time string conversion
+from ATWG.waves import changes      # change point compression
+from ATWG.waves import preview      # downsampled waveform export
+from ATWG.waves import stochastic   # random waveforms follow chamber slew rate
+from ATWG.waves.resample import resampler   # recorded logs
+from ATWG.scheduler.scheduler import scheduler  # overrun policies
+from ATWG.driver.worker import chamberWorker    # background chamber I/O
 #------------------------------------------------------------------------------
 
 
@@ -41,14 +53,26 @@ class ATWG:
         """
         # config
         self.cfg_tsample_sec = 1                    # sample time is 1sec
+        self.cfg_event = False                      # setpoint written on change only
+        self.cfg_tpoll_sec = 10                     # measurement poll time in event mode
+        self.cfg_overrun = "skip"                   # scheduler overrun policy
+        self.cfg_plan = None                        # dry run output format, None runs chamber
+        self.cfg_preview = None                     # preview file of waveform, f.e. 'out.svg'
+        self.cfg_fleet = None                       # chamber list of fleet mode, f.e. 'fleet.yml'
+        self.cfg_worker = False                     # chamber I/O in background thread
+        self.cfg_pipeline = False                   # setpoint written before measurement
         self.avlChambers = ["SIM", "ESPEC_SH641",]  # supported climate chambers
         # storing elements
         self.chamber = None     # class for chamber
         self.wave = None        # waveform
         self.clima = {}         # storage element for last measured clima
+        self.changes = None     # change points of waveform, event mode
+        self.tswap = 0          # time of last waveform swap in seconds since start
+        self.tstart = None      # start value of first waveform, setpoint of stop()
+        self.sched = None       # scheduler of control loop, timing in status
         # time string conversion
-        self.timeToSec = {'s': 1, 'sec': 1, 'm': 60, 'min': 60, 'h': 3600, 'hour': 3600, 'd': 86400, 'day': 86400}   # conversion dictory to seconds
-        self.timeColSep = "d:h:m:s"                                                                                  # colon separated time string prototype
+        self.timeToSec = units.TIME_TO_SEC      # conversion dictory to seconds
+        self.timeColSep = units.TIME_COL_SEP    # colon separated time string prototype
         # Progress Spinner
         # SRC: https://stackoverflow.com/questions/4995733/how-to-create-a-spinning-command-line-cursor
         self.spinner = itertools.cycle(['-', '/', '|', '\\'])
@@ -66,12 +90,27 @@ class ATWG:
         """
         # create object
         parser = argparse.ArgumentParser(description="Arbitrary Temperature Waveform Generator")    # create class
-        # waveform
-        parser.add_argument('--sine',       action='store_true', help="sine waveform")                          # selects used waveform
-        parser.add_argument('--trapezoid',  action='store_true', help="trapezoid waveform")                     #
+        # waveform, options from registered shapes
+        for name, shape in waves.shapes.items():
+            if ( None == shape['cliArg'] ):
+                parser.add_argument('--' + name, action='store_true', help=shape['help'])           # flag selects waveform
+            else:
+                parser.add_argument('--' + name, nargs=1, default=None, help=shape['help'])         # option value is waveform argument
         parser.add_argument('--invert',     action='store_true', help="wave starts with negative slew rate")    # w/o flag starts wave with positive slew, if set with negative slew
+        parser.add_argument('--slewLimit',  action='store_true', help="limits setpoint change to chamber slew rate")    # setpoint follows waveform with chamber slew rate
+        parser.add_argument('--event',      action='store_true', help="setpoint is only written on change at chamber resolution")  # event driven loop
+        parser.add_argument("--pollTime",  nargs=1, default=["10s",], help="measurement poll time in event mode")          # independent measurement
+        parser.add_argument("--resample",  nargs=1, default=None, choices=resampler.METHODS, help="resamples recorded log of arbitrary waveform to sample time")   # field logs
+        parser.add_argument("--gapTime",   nargs=1, default=None, help="log gaps longer than time keep last temperature, f.e. 5m")  # resample gap
+        parser.add_argument("--overrun",   nargs=1, default=["skip",], choices=scheduler.POLICIES, help="policy for update ticks exceeding sample time")  # scheduler
+        parser.add_argument("--preview",   nargs=1, default=None, help="writes downsampled waveform period to .svg or .csv without opening the chamber")   # visual check
+        parser.add_argument("--plan",      nargs='?', default=None, const="text", choices=("text", "json"), help="dry run, prints profile statistics without opening the chamber")   # batch check
+        parser.add_argument("--worker",    action='store_true', help="chamber I/O in background thread, control loop does not wait for chamber")    # decoupled I/O
+        parser.add_argument("--pipeline",  action='store_true', help="setpoint is written at the deadline, measurement afterwards")  # tick order
+        parser.add_argument("--fleet",     nargs=1, default=None, help="drives all chambers of .yml list from one process, waveform per chamber")   # multi chamber
         # waveform parameters
-        parser.add_argument("--period",    nargs=1, default=["1h",],  help="Period duration of selected waveform")    # temperature periodicity
+        parser.add_argument("--period",    nargs=1, default=None,     help="Period duration of selected waveform, default 1h, expressions are endless without") # temperature periodicity
+        parser.add_argument("--sampleTime", nargs=1, default=["1s",], help="update time of chamber setpoint, f.e. 100ms") # sample time
         parser.add_argument("--minTemp",   nargs=1, default=None,     help="waveforms minimal temperature value [C]") # minimal temperature value
         parser.add_argument("--maxTemp",   nargs=1, default=None,     help="waveforms maximal temperature value [C]") # maximal temperature value
         parser.add_argument("--startTemp", nargs=1, default=["25C",], help="start temperature of waveform [C]")       # start temperature value
@@ -82,35 +121,70 @@ class ATWG:
         parser.add_argument("--port",    nargs=1, default="",                  help="System port to climate chamber, f.e. COM1") # interface
         # parse
         args = parser.parse_args(cliArgs)
+        if ( (None != args.preview) and (os.path.splitext(args.preview[0])[1].lower() not in preview.FORMATS) ):
+            parser.error("argument --preview: unsupported format '" + args.preview[0] + "', use " + ", ".join(preview.FORMATS))
         # select climate chamber
         chamberArgs = {}
         chamberArgs['chamber'] = ''.join(args.chamber)  # chamber
         chamberArgs['port'] = ''.join(args.port)        # interface
         # align CLI to wave.py api
         waveArgs = {}                                       # init dict
+        self.cfg_tsample_sec = self.time_to_sec(args.sampleTime[0])
+        if ( 0 >= self.cfg_tsample_sec ):
+            raise ValueError("Positive sample time required")
         waveArgs['ts'] = self.cfg_tsample_sec               # define sample time
-        waveArgs['tp'] = self.time_to_sec(args.period[0])   # cast and align
-        if ( args.sine and args.trapezoid ):                # dispatch waveform switch
-            raise ValueError("Multiple waveform selected")
-        elif ( args.sine ):             # sine selected
-            waveArgs['wave'] = "sine"
-        elif ( args.trapezoid ):        # trapszoid selected
-            waveArgs['wave'] = "trapezoid"
+        profile = False                                     # waveform with own time base, f.e. arbitrary
+        period = False                                      # profile with optional period, f.e. expr
+        for name, shape in waves.shapes.items():            # dispatch waveform switch
+            opt = getattr(args, name.replace("-", "_"))   # argparse dest
+            if ( (False == opt) or (None == opt) ):         # not selected
+                continue
+            if ( 'wave' in waveArgs ):
+                raise ValueError("Multiple waveform selected")
+            waveArgs['wave'] = name
+            profile = shape['profile']
+            period = shape['period']
+            if ( None != shape['cliArg'] ):                 # option value is waveform argument
+                waveArgs[shape['cliArg']] = opt[0]
+        if ( False == profile ):
+            waveArgs['tp'] = self.time_to_sec(args.period[0] if ( None != args.period ) else "1h")  # cast and align
+        elif ( period and (None != args.period) ):
+            waveArgs['tp'] = self.time_to_sec(args.period[0])
+        if ( period and ('tp' not in waveArgs) ):   # batch evaluation of one period
+            for opt, val in (("--plan", args.plan), ("--preview", args.preview)):
+                if ( None != val ):
+                    parser.error("argument " + opt + ": endless waveform '--" + waveArgs['wave'] + "', use --period")
         if ( None != args.minTemp ):    # align low temperature
             waveArgs['lowVal'] = float(args.minTemp[0].replace("C", "").replace("c", ""))
         if ( None != args.maxTemp ):    # align high temperature
              waveArgs['highVal'] = float(args.maxTemp[0].replace("C", "").replace("c", ""))
-        if ( False == (('wave' in waveArgs) and ('lowVal' in waveArgs) and ('highVal' in waveArgs) ) ):  # check for mandatory args
+        self.cfg_fleet = args.fleet[0] if ( None != args.fleet ) else None
+        if ( (None == self.cfg_fleet) and (False == (('wave' in waveArgs) and (profile or (('lowVal' in waveArgs) and ('highVal' in waveArgs))))) ):  # check for mandatory args, fleet waveforms from file
             raise ValueError("Missing mandatory args: wave, lowVal, highVal")
         if ( None != args.startTemp ):
             waveArgs['initVal'] = float(args.startTemp[0].replace("C", "").replace("c", ""))
-            waveArgs['initVal'] = max(min(waveArgs['initVal'], waveArgs['highVal']), waveArgs['lowVal']) # apply upper and lower fence
-        if ( None != args.riseTime ):   # convert risetime
+            waveArgs['initVal'] = max(min(waveArgs['initVal'], waveArgs.get('highVal', float('inf'))), waveArgs.get('lowVal', float('-inf')))   # apply upper and lower fence
+        if ( (None != args.riseTime) and (False == profile) ):  # convert risetime
             waveArgs['tr'] = self.temp_grad_to_time(gradient=args.riseTime[0], deltaTemp=waveArgs['highVal']-waveArgs['lowVal'])
-        if ( None != args.fallTime ):
+        if ( (None != args.fallTime) and (False == profile) ):
             waveArgs['tf'] = self.temp_grad_to_time(gradient=args.fallTime[0], deltaTemp=waveArgs['highVal']-waveArgs['lowVal'])
         if ( args.invert ):
             waveArgs['pSlope'] = False
+        if ( args.slewLimit ):          # limits from chamber info
+            waveArgs['slew'] = True
+        if ( (None != args.resample) or (None != args.gapTime) ):
+            if ( "arbitrary" != waveArgs['wave'] ):
+                raise ValueError("Resampling requires arbitrary waveform")
+            waveArgs['resample'] = {'method': args.resample[0] if ( None != args.resample ) else "linear"}
+            if ( None != args.gapTime ):
+                waveArgs['resample']['gap'] = self.time_to_sec(args.gapTime[0])
+        self.cfg_event = args.event     # control loop
+        self.cfg_worker = args.worker
+        self.cfg_pipeline = args.pipeline
+        self.cfg_tpoll_sec = self.time_to_sec(args.pollTime[0])
+        self.cfg_overrun = args.overrun[0]
+        self.cfg_plan = args.plan       # dry run
+        self.cfg_preview = args.preview[0] if ( None != args.preview ) else None
         # normal end
         return chamberArgs, waveArgs
     #*****************************
@@ -122,69 +196,13 @@ class ATWG:
         @note           detects type of time and converts to seconds in numeric format
                         supported time formats
                           * d:h:m:s
-                          * 1d, 1h, 1m, 1s
+                          * 1d, 1h, 1m, 1s, 100ms
                             
         @param time     time in seconds or time string
         @rtype          float
         @return         time in seconds as numeric value
         """
-        # check empty argument
-        if ( None == time ):
-            raise ValueError("No time string provided")
-        # check if numeric data is provided, treated as seconds    
-        elif ( isinstance(time, float) or isinstance(time, int) ):
-            return time
-        # check for string
-        elif ( isinstance(time, str) ):
-            # check for pure numeric string
-            if ( time.isnumeric() ):
-                return float(time)
-            # check for ':' separated string
-            elif ( -1 != time.find(":") ):
-                # collects converted time
-                secs = 0
-                # prepare for positional to typ conv
-                colSep = self.timeColSep.split(":") # make to list
-                colSep.reverse()                    # alignment from seconds
-                # iterate over segments in reversed order. last element is always sec
-                for idx,item in enumerate(reversed(time.split(":"))):
-                    # skip empty element
-                    if ( 0 == len(item) ): continue
-                    # convert to sec
-                    try:
-                        secs = secs + float(item) * self.timeToSec[colSep[idx]]     # accumulate and convert
-                    except:
-                        raise Warning("Skipping positional element " + str(idx) + " with value '" + str(item) + "'")
-                # release result
-                return secs
-            # check if string contents elements from 'toSec'
-            elif ( time.replace(" ", "").replace(".", "").isalnum() ):
-                # prepare time
-                secs = 0
-                # separate into time substrings
-                for timePart in time.split(" "):    # split at blank at iterate
-                    # https://stackoverflow.com/questions/12409894/fast-way-to-split-alpha-and-numeric-chars-in-a-python-string/12411196
-                    # https://stackoverflow.com/questions/4703390/how-to-extract-a-floating-number-from-a-string
-                    digUnit = re.findall(r"[a-zA-Z_]+|[-+]?\d*\.\d+|\d+", timePart)   # split number from unit
-                    if ( 1 == len(digUnit) ):       # handle time w/o numeric multiplier
-                        digUnit.append(digUnit[0])  # save base time
-                        digUnit[0] = 1              # complete non time base part
-                    elif ( 2 < len(digUnit) ):
-                        raise Warning("Time string part '" + timePart + "' not convertable, skip...")
-                        continue
-                    # convert to seconds
-                    try:
-                        secs = secs + float(digUnit[0]) * self.timeToSec[digUnit[1]]
-                    except:
-                        raise Warning ("Time unit '" + digUnit[1] + "' unknown")
-                # release result
-                return secs
-            # unrecognized time string
-            else:
-                raise ValueError("Unrecognized time string '" + time + "'")
-        # unkown data type
-        else:
-            raise TypeError("Unsupported data type '" + str(type(time)) + "'")
+        return units.time_to_sec(time=time)
     #*****************************
     
     
@@ -215,15 +233,18 @@ class ATWG:
         timeStr = ""
         # extract base unit and split
         for unitDiv in list(reversed(sorted(secToTime.keys()))):
+            # sub-second units are fracs of seconds
+            if ( 1 > unitDiv ):
+                continue
             # split base unit
             q, r = divmod(secIter, int(unitDiv))
-            if (q > 0):
+            if ( (q > 0) or ((1 == unitDiv) and (secIter > 0)) ):
                 # base not achieved
                 if ( unitDiv > 1 ):
                     timeStr = timeStr + str(int(q))
                 # base resolution achieved, take also fracs
                 else:
-                    timeStr = timeStr + str(secIter)
+                    timeStr = timeStr + "{:.6g}".format(secIter)    # drops float noise of remainder, ms resolution below 1m
                 # dispatch separator
                 if ( sep == " " ):
                     timeStr = timeStr + secToTime[unitDiv][0] + " "
@@ -254,28 +275,7 @@ class ATWG:
         @rtype              float
         @return             slew time from min to max
         """
-        # check for gradient
-        if ( None == gradient ):
-            raise ValueError("No temperature gradient given")
-        # check for gradient
-        if ( -1 != gradient.find("/") ):
-            # check
-            if ( None == deltaTemp ):
-                raise ValueError("Low/High Temperature value for total slew time required")
-            # split time and temp
-            temperature = gradient.split("/")[0]
-            timeVal = gradient.split("/")[1]
-            # prepare
-            timeVal = self.time_to_sec(time=timeVal)                        # convert to seconds
-            temperature = temperature.replace("C", "").replace("c", "")     # filter celsius
-            temperature = temperature.replace("K", "").replace("k", "")     # filter kelvin
-            # calc slew time
-            slewTime = (abs(deltaTemp) / float(temperature)) * timeVal
-        # slew time over complete range
-        else:
-            slewTime = self.time_to_sec(time=gradient)
-        # normal end
-        return slewTime
+        return units.temp_grad_to_time(gradient=gradient, deltaTemp=deltaTemp)
     #*****************************
     
     
@@ -297,6 +297,8 @@ class ATWG:
             return {'val': grad_sec, 'base': 's'}
         # determine timebase to once digit
         for tb in self.timeToSec.values():
+            if ( 1 > tb ):  # no gradient per sub-second
+                continue
             digit = float(grad_sec) * float(tb)
             base = tb
             if ( abs(digit) >= 1.0 ):
@@ -309,6 +311,55 @@ class ATWG:
     #*****************************
     
     
+    #*****************************
+    def select(self, chamberArg=None):
+        """
+        @note               creates chamber driver, interface is not opened
+
+        @param chamberArg   climate chamber setting
+        @rtype              boolean
+        @return             successful
+        """
+        if ( None == chamberArg ):
+            raise ValueError("Missing args")
+        if ( "sim" == chamberArg['chamber'].lower() ):
+            from ATWG.driver.sim.simChamber import simChamber   # import if required
+            self.chamber = simChamber()
+        elif ( "espec_sh641" == chamberArg['chamber'].lower() ):
+            from ATWG.driver.espec.sh641 import especShSu       # import if required
+            self.chamber = especShSu()                          # init driver
+        else:
+            raise ValueError("Unsupported climate chmaber '" + chamberArg['chamber'] +"' selected")
+        return True
+    #*****************************
+
+
+    #*****************************
+    def init_wave(self, waveArg=None):
+        """
+        @note               initializes waveform, chamber limits from driver info
+
+        @param waveArg      waveform settings
+        @rtype              boolean
+        @return             successful
+        """
+        if ( (None == self.chamber) or (None == waveArg) ):
+            raise ValueError("Missing args")
+        waveArg = dict(waveArg)
+        if ( True == waveArg.get('slew', False) ):
+            waveArg['slew'] = self.slew_limits()
+        if ( (waveArg.get('wave') in stochastic.SHAPES) and ('lowVal' in waveArg) and ('highVal' in waveArg) ):
+            limits = self.slew_limits()     # random slopes within chamber capability
+            waveArg.setdefault('tr', (waveArg['highVal']-waveArg['lowVal']) / (limits['rise']*stochastic.MARGIN))
+            waveArg.setdefault('tf', (waveArg['highVal']-waveArg['lowVal']) / (-limits['fall']*stochastic.MARGIN))
+        wave = waves()              # create class
+        wave.set(**waveArg)         # init waveform
+        self.wave = wave            # active waveform replaced on success only
+        self.changes = None         # built on first use
+        return True
+    #*****************************
+
+
     #*****************************
     def open(self, chamberArg=None, waveArg=None):
         """
@@ -325,22 +376,184 @@ class ATWG:
         if ( None == chamberArg or None == waveArg ):
             raise ValueError("Missing args")
         # select chamber
-        if ( "sim" == chamberArg['chamber'].lower() ):
-            from ATWG.driver.sim.simChamber import simChamber   # import if required
-            self.chamber = simChamber()
-        elif ( "espec_sh641" == chamberArg['chamber'].lower() ):
-            from ATWG.driver.espec.sh641 import especShSu       # import if required
-            self.chamber = especShSu()                          # init driver
-        else:
-            raise ValueError("Unsupported climate chmaber '" + chamberArg['chamber'] +"' selected")
+        self.select(chamberArg)
+        if ( self.cfg_worker ):
+            self.chamber = chamberWorker(driver=self.chamber)   # control loop posts requests
         # open chamber interface
         self.chamber.open(port = chamberArg['port'])
         # init waveform
-        self.wave = waves()         # create class
-        self.wave.set(**waveArg)    # init waveform
+        self.init_wave(waveArg)
+        self.tswap = 0
+        self.tstart = self.wave.waveArgs.get('initVal', self.wave.at(idx=0)['val'])
         # normal end
         return True
     #*****************************
+
+
+    #*****************************
+    def swap(self, waveArg=None, t=0):
+        """
+        @note               replaces the active waveform of a running generator,
+                            the new waveform starts at the current setpoint and
+                            slope direction, see initVal/pSlope of waves.
+                            Waveforms which can not continue at the setpoint
+                            are rejected. The chamber is not requested
+
+        @param waveArg      waveform settings, initVal/pSlope are overwritten
+        @param t            time of swap in seconds since start, time base of
+                            setpoint_at() and next_change()
+        @rtype              boolean
+        @return             successful
+        """
+        # check for successfull opening
+        if ( (None == self.chamber) or (None == self.wave) ):
+            raise ValueError("Interfaces not opened, call methode 'open'")
+        if ( None == waveArg ):
+            raise ValueError("Missing args")
+        # current setpoint and following sample, last written or waveform before first update
+        setpoint = self.clima.get('set', None)
+        if ( None == setpoint ):
+            setpoint = self.wave.at(t=max(t-self.tswap, 0))
+            follow = self.wave.at(t=max(t-self.tswap, 0) + self.wave.waveDescr['x']['ts'])['val']
+        else:
+            follow = self.wave.block(count=1)['val'][0]     # next() without state change
+        # enter new waveform at same value and slope
+        waveArg = dict(waveArg)
+        waveArg['initVal'] = setpoint['val']
+        if ( 0 != setpoint['grad'] ):
+            waveArg['pSlope'] = (0 < setpoint['grad'])
+        (wave, changes) = (self.wave, self.changes)
+        self.init_wave(waveArg)     # keeps active waveform on error
+        # jump at swap within one sample step of old or new waveform, °C per sample
+        start = self.wave.at(idx=0)
+        step = max(abs(follow - setpoint['val']), abs(self.wave.at(idx=1)['val'] - start['val']))
+        if ( abs(start['val'] - setpoint['val']) > step + 1e-9 * max(abs(start['val']), abs(setpoint['val']), step) ):
+            (self.wave, self.changes) = (wave, changes)     # setpoint outside of new waveform
+            raise ValueError("Swap jumps from " + "{:.2f}".format(setpoint['val']) + " to " + "{:.2f}".format(start['val']) + " °C, setpoint outside of waveform")
+        if ( None != self.wave.limit ):
+            self.wave.limit.reset(val=setpoint['val'])
+        self.tswap = t
+        return True
+    #*****************************
+
+
+    #*****************************
+    def plan(self, chamberArg=None, waveArg=None):
+        """
+        @note               dry run, evaluates one waveform period in batch
+                            without opening the chamber interface
+                              * setpoint changes at chamber resolution
+                              * expected serial commands of the control loop
+                              * peak gradients and range vs. chamber info
+
+        @param chamberArg   climate chamber setting
+        @param waveArg      waveform settings
+        @rtype              dict
+        @return             report, gradients in 1/sec, times in sec
+        """
+        # init without interface
+        tstart = time.perf_counter()
+        self.select(chamberArg)
+        self.init_wave(waveArg)
+        info = self.chamber.info()
+        ratings = info['temperature']['ratings']
+        limits = self.slew_limits()
+        # batch evaluation
+        rpt = slew.check(wave=self.wave, low=ratings['min'], high=ratings['max'], **limits)
+        self.changes = self.compress()
+        # chamber calls of control loop, set_clima writes on change only
+        ts = self.wave.waveDescr['x']['ts']
+        duration = rpt['samples'] * ts
+        if ( self.cfg_event ):
+            calls = {'get': math.ceil(duration / self.cfg_tpoll_sec), 'set': len(self.changes)}
+        else:
+            calls = {'get': rpt['samples'], 'set': rpt['samples']}
+        commands = {'get': calls['get'] * info['commands']['get'], 'set': len(self.changes) * info['commands']['set']}
+        commands['total'] = commands['get'] + commands['set']
+        # build report
+        plan = {}
+        plan['chamber'] = info['name']
+        plan['wave'] = self.wave.waveArgs['wave']
+        plan['mode'] = "event" if ( self.cfg_event ) else "cyclic"
+        plan['duration'] = duration
+        plan['samples'] = rpt['samples']
+        plan['changes'] = len(self.changes)
+        plan['ratio'] = self.changes.ratio()
+        plan['calls'] = calls
+        plan['commands'] = commands
+        plan['gradient'] = {'rise': rpt['rise']['max'], 'fall': rpt['fall']['min']}
+        plan['limits'] = limits
+        plan['violations'] = {'rise': rpt['rise']['violations'], 'fall': rpt['fall']['violations'], 'first': {'rise': rpt['rise']['first'], 'fall': rpt['fall']['first']}}
+        plan['range'] = {'min': rpt['min'], 'max': rpt['max']}
+        plan['ratings'] = {'min': ratings['min'], 'max': ratings['max']}
+        plan['below'] = rpt['below']
+        plan['above'] = rpt['above']
+        plan['feasible'] = rpt['feasible']
+        plan['runtime'] = time.perf_counter() - tstart
+        return plan
+    #*****************************
+
+
+    #*****************************
+    def preview(self, chamberArg=None, waveArg=None, file=None, points=2000):
+        """
+        @note               writes downsampled waveform period without opening
+                            the chamber interface, see waves.preview
+
+        @param chamberArg   climate chamber setting
+        @param waveArg      waveform settings
+        @param file         path to .svg or .csv
+        @param points       max. number of preview points
+        @rtype              int
+        @return             number of written points
+        """
+        if ( None == file ):
+            raise ValueError("Missing preview file")
+        self.select(chamberArg)
+        self.init_wave(waveArg)
+        return preview.write(wave=self.wave, file=file, points=points, title=self.wave.waveArgs['wave'] + " @ " + self.chamber.info()['name'])
+    #*****************************
+
+
+    #*****************************
+    def plan_text(self, plan=None, fmt="text"):
+        """
+        @note               formats plan() report
+
+        @param plan         report, see plan()
+        @param fmt          output format { text | json }, json with null for infinite values
+        @rtype              string
+        @return             formatted report
+        """
+        # machine readable
+        if ( "json" == fmt ):
+            def finite(obj):
+                if ( isinstance(obj, dict) ):
+                    return {key: finite(val) for key, val in obj.items()}
+                if ( isinstance(obj, float) and (False == math.isfinite(obj)) ):
+                    return None
+                return obj
+            return json.dumps(finite(plan), indent=2)
+        if ( "text" != fmt ):
+            raise ValueError("Unsupported plan format '" + str(fmt) + "'")
+        # human readable
+        def num(val, unit):
+            return ("{num:+.2f} ".format(num=val) + unit) if ( math.isfinite(val) ) else "none"
+        txt = ""
+        txt += "Arbitrary Temperature Waveform Generator - Plan\n"
+        txt += "\n"
+        txt += "  Chamber    : " + plan['chamber'] + "\n"
+        txt += "  Shape      : " + plan['wave'] + " (" + plan['mode'] + ")\n"
+        txt += "  Duration   : " + self.sec_to_time(sec=plan['duration']) + " (" + "{:d}".format(plan['samples']) + " samples)\n"
+        txt += "  Changes    : " + "{:d}".format(plan['changes']) + " (" + "{:.1f}".format(plan['ratio']) + " samples/change)\n"
+        txt += "  Commands   : " + "{:d}".format(plan['commands']['total']) + " (get " + "{:d}".format(plan['commands']['get']) + ", set " + "{:d}".format(plan['commands']['set']) + ")\n"
+        for key in ('rise', 'fall'):
+            txt += "  " + "{:<11s}".format(key.capitalize()) + ": " + num(60*plan['gradient'][key], "°C/min") + " (limit " + num(60*plan['limits'][key], "°C/min") + ", " + "{:d}".format(plan['violations'][key]) + " violations)\n"
+        txt += "  Range      : [" + num(plan['range']['min'], "°C") + ", " + num(plan['range']['max'], "°C") + "] (ratings [" + num(plan['ratings']['min'], "°C") + ", " + num(plan['ratings']['max'], "°C") + "])\n"
+        txt += "  Feasible   : " + ("yes" if ( plan['feasible'] ) else "no") + "\n"
+        txt += "  Runtime    : " + "{:.3f}".format(plan['runtime']) + "s\n"
+        return txt
+    #*****************************
     
     
     #*****************************
@@ -356,7 +569,11 @@ class ATWG:
         if ( (None == self.chamber) or (None == self.wave) ):
             raise ValueError("Interfaces not opened, call methode 'open'")
         # set current clima as target clima
-        self.chamber.set_clima(clima=self.chamber.get_clima())
+        clima = self.chamber.get_clima()
+        self.chamber.set_clima(clima=clima)
+        # limited setpoint starts at current temperature
+        if ( None != self.wave.limit ):
+            self.wave.limit.reset(val=clima['temperature'])
         # start chamber
         self.chamber.start()
         # graceful end
@@ -367,13 +584,14 @@ class ATWG:
     #*****************************
     def stop(self):
         """
-        @note               stops chamber operation and set temperature to waveform start value
+        @note               stops chamber operation and set temperature to start
+                            value of first waveform, swap() does not change it
                             
         @rtype              boolean
         @return             successful
         """
         # set chamber to start value
-        self.chamber.set_clima(clima={'temperature': self.wave.waveArgs['initVal']})
+        self.chamber.set_clima(clima={'temperature': self.tstart})
         # stop chamber
         self.chamber.stop()
         # graceful end
@@ -381,12 +599,60 @@ class ATWG:
     #*****************************
     
     
+    #*****************************
+    def slew_limits(self):
+        """
+        @note               chamber slew rates in 1/sec
+
+        @rtype              dict
+        @return             {'rise': , 'fall': }
+        """
+        slewrate = self.chamber.info()['temperature']['slewrate']
+        unit = self.timeToSec[slewrate['unit'].split("/")[1]]   # f.e. 'c/min'
+        return {'rise': slewrate['rise'] / unit, 'fall': slewrate['fall'] / unit}
+    #*****************************
+
+
+    #*****************************
+    def preflight(self):
+        """
+        @note               checks one waveform period against chamber slew rates
+                            and temperature ratings
+
+        @rtype              dict
+        @return             report, see waves.slew.check(), gradients in 1/sec
+        """
+        # check for successfull opening
+        if ( (None == self.chamber) or (None == self.wave) ):
+            raise ValueError("Interfaces not opened, call methode 'open'")
+        ratings = self.chamber.info()['temperature']['ratings']
+        return slew.check(wave=self.wave, low=ratings['min'], high=ratings['max'], **self.slew_limits())
+    #*****************************
+
+
+    #*****************************
+    def compress(self):
+        """
+        @note               compresses one waveform period to setpoint changes
+                            at chamber resolution
+
+        @rtype              changeTable
+        @return             change points, see waves.changes.compress()
+        """
+        # check for successfull opening
+        if ( (None == self.chamber) or (None == self.wave) ):
+            raise ValueError("Interfaces not opened, call methode 'open'")
+        return changes.compress(wave=self.wave, fracs=self.chamber.info()['fracs']['temperature'])
+    #*****************************
+
+
     #*****************************
     def chamber_update(self):
         """
         @note               updates chamber settings
                               * reads from chamber current clima conditions
                               * set new temperture values
+                              * cfg_pipeline: setpoint first, measurement afterwards
                             
         @rtype              boolean
         @return             successful
@@ -395,16 +661,85 @@ class ATWG:
         if ( (None == self.chamber) or (None == self.wave) ):
             raise ValueError("Interfaces not opened, call methode 'open'")
         # acquire current clima
-        self.clima['get'] = self.chamber.get_clima();
+        if ( False == self.cfg_pipeline ):
+            self.clima['get'] = self.chamber.get_clima();
         # calc next clima value
         self.clima['set'] = self.wave.next();
         # set chamber value
         self.chamber.set_clima(clima={'temperature': self.clima['set']['val']})
+        # pipelined, setpoint does not wait for measurement
+        if ( self.cfg_pipeline ):
+            self.clima['get'] = self.chamber.get_clima();
         # graceful end
         return True
     #*****************************
     
     
+    #*****************************
+    def measure(self):
+        """
+        @note               reads current clima conditions from chamber
+
+        @rtype              dict
+        @return             measured clima
+        """
+        # check for successfull opening
+        if ( None == self.chamber ):
+            raise ValueError("Interfaces not opened, call methode 'open'")
+        self.clima['get'] = self.chamber.get_clima()
+        return self.clima['get']
+    #*****************************
+
+
+    #*****************************
+    def next_change(self, t=0):
+        """
+        @note               time of next setpoint change at chamber resolution,
+                            endless waveforms change every sample
+
+        @param t            time in seconds since start
+        @rtype              float
+        @return             time of next change in seconds since start
+        """
+        ts = self.wave.waveDescr['x']['ts']
+        t = t - self.tswap          # waveform time
+        if ( None == self.changes ):
+            try:
+                self.changes = self.compress()
+            except ValueError:
+                self.changes = False    # endless waveform
+        if ( False == self.changes ):
+            return self.tswap + (math.floor(t/ts) + 1) * ts
+        period = self.wave.waveDescr['x']['n'] * ts   # fractional period, see waves.samples()
+        tmod = t % period
+        i = bisect.bisect_right(self.changes.time, tmod)
+        if ( i < len(self.changes) ):
+            return self.tswap + t - tmod + self.changes.time[i]
+        return self.tswap + t - tmod + period + self.changes.time[0]
+    #*****************************
+
+
+    #*****************************
+    def setpoint_at(self, t=0):
+        """
+        @note               writes setpoint of waveform at time, event mode
+
+        @param t            time in seconds since start, waveform time after swap()
+        @rtype              float
+        @return             time of next setpoint change in seconds since start
+        """
+        # check for successfull opening
+        if ( (None == self.chamber) or (None == self.wave) ):
+            raise ValueError("Interfaces not opened, call methode 'open'")
+        if ( None != self.wave.limit ):
+            raise ValueError("Event mode not supported with slew limit")
+        # write
+        self.clima['set'] = self.wave.at(idx=math.floor((t-self.tswap)/self.wave.waveDescr['x']['ts']))
+        self.chamber.set_clima(clima={'temperature': self.clima['set']['val']})
+        return self.next_change(t)
+    #*****************************
+
+
     #*****************************
     def status(self):
         """
@@ -431,11 +766,27 @@ class ATWG:
         str += "\n"
         str += "  Waveform\n"
         str += "    Shape    : " + self.wave.waveArgs['wave'] + "\n"
-        str += "    Tmin     : " + "{num:+.{frac}f} °C\n".format(num=self.wave.waveArgs['lowVal'], frac=numFracs)
-        str += "    Tmax     : " + "{num:+.{frac}f} °C\n".format(num=self.wave.waveArgs['highVal'], frac=numFracs)
-        str += "    Period   : " + self.sec_to_time(sec=self.wave.waveArgs['tp']) + "\n"
+        if ( 'lowVal' in self.wave.waveArgs ):
+            str += "    Tmin     : " + "{num:+.{frac}f} °C\n".format(num=self.wave.waveArgs['lowVal'], frac=numFracs)
+        if ( 'highVal' in self.wave.waveArgs ):
+            str += "    Tmax     : " + "{num:+.{frac}f} °C\n".format(num=self.wave.waveArgs['highVal'], frac=numFracs)
+        str += "    Period   : " + self.sec_to_time(sec=self.wave.waveArgs.get('tp', self.wave.waveDescr['x']['tp'])) + "\n"
         str += "    Gradient : " + "{num:+.{frac}f} °C".format(num=grad_norm['val'], frac=numFracs+1) + "/" + grad_norm['base'] + "\n"
         str += "\n"
+        if ( None != self.sched ):
+            timing = self.sched.stats
+            str += "  Timing\n"
+            str += "    Sample   : " + self.sec_to_time(sec=timing['period']) + ("" if ( timing['period'] == self.sched.period ) else " (adapted from " + self.sec_to_time(sec=self.sched.period) + ")") + "\n"
+            str += "    Cost     : " + "{:.1f}".format(1000*timing['cost']['last']) + " ms (mean " + "{:.1f}".format(1000*timing['cost']['mean']) + ", max " + "{:.1f}".format(1000*timing['cost']['max']) + ")\n"
+            str += "    Overruns : " + "{:d}".format(timing['overruns']) + " (skipped " + "{:d}".format(timing['skipped']) + " ticks)\n"
+            str += "\n"
+        if ( isinstance(self.chamber, chamberWorker) ):
+            io = self.chamber.stats()
+            str += "  Interface\n"
+            str += "    Queue    : " + "{:d}".format(io['depth']['requests']) + "/" + "{:d}".format(io['depth']['max']) + " requests, " + "{:d}".format(io['depth']['responses']) + " responses\n"
+            str += "    Latency  : " + "{:.1f}".format(1000*io['latency']['last']) + " ms (mean " + "{:.1f}".format(1000*io['latency']['mean']) + ", max " + "{:.1f}".format(1000*io['latency']['max']) + ")\n"
+            str += "    Age      : " + "{:.1f}".format(io['age']) + " s\n"
+            str += "\n"
         str += "\n"
         str += "Press 'CTRL + C' for exit\n"
         # return
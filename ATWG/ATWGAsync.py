@@ -0,0 +1,207 @@
+# -*- coding: utf-8 -*-
+"""
+@author:        Andreas Kaeberlein
+@copyright:     Copyright 2026
+@credits:       AKAE
+
+@license:       GPLv3
+@maintainer:    Andreas Kaeberlein
+@email:         andreas.kaeberlein@web.de
+
+@file:          ATWGAsync.py
+@date:          2026-10-17
+
+@note           asyncio variant of the Arbitrary Temperature Waveform Generator
+                  - chamber calls are awaited, many generators share one event loop
+                  - drivers implement async open/close/start/stop/get_clima/set_clima
+                  - waveform, preflight, plan and status are inherited from ATWG
+"""
+
+
+
+#------------------------------------------------------------------------------
+# Standard
+import math                                     # floor
+# Self
+from ATWG.ATWG import ATWG                      # waveform and configuration
+from ATWG.scheduler.scheduler import scheduler  # isochron update
+#------------------------------------------------------------------------------
+
+
+
+#------------------------------------------------------------------------------
+class ATWGAsync(ATWG):
+
+    #*****************************
+    def select(self, chamberArg=None):
+        """
+        @note               creates async chamber driver, interface is not opened
+
+        @param chamberArg   climate chamber setting, optional 'latency' of SIM in seconds
+        @rtype              boolean
+        @return             successful
+        """
+        if ( None == chamberArg ):
+            raise ValueError("Missing args")
+        if ( "sim" == chamberArg['chamber'].lower() ):
+            from ATWG.driver.sim.simChamberAsync import simChamberAsync  # import if required
+            self.chamber = simChamberAsync(latency=chamberArg.get('latency', 0))
+        elif ( "espec_sh641" == chamberArg['chamber'].lower() ):
+            from ATWG.driver.espec.sh641Async import especShSuAsync      # import if required
+            self.chamber = especShSuAsync()
+        else:
+            raise ValueError("Unsupported climate chmaber '" + chamberArg['chamber'] +"' selected")
+        return True
+    #*****************************
+
+
+    #*****************************
+    async def open(self, chamberArg=None, waveArg=None):
+        """
+        @note               opens chamber interface and initializes waveform
+
+        @param chamberArg   climate chamber setting
+        @param waveArg      waveform settings
+        @rtype              boolean
+        @return             successful
+        """
+        if ( None == chamberArg or None == waveArg ):
+            raise ValueError("Missing args")
+        self.select(chamberArg)
+        await self.chamber.open(port=chamberArg['port'])
+        self.init_wave(waveArg)
+        self.tswap = 0
+        self.tstart = self.wave.waveArgs.get('initVal', self.wave.at(idx=0)['val'])
+        return True
+    #*****************************
+
+
+    #*****************************
+    async def start(self):
+        """
+        @note               starts chamber with current temperature as setpoint
+
+        @rtype              boolean
+        @return             successful
+        """
+        if ( (None == self.chamber) or (None == self.wave) ):
+            raise ValueError("Interfaces not opened, call methode 'open'")
+        clima = await self.chamber.get_clima()
+        await self.chamber.set_clima(clima=clima)
+        if ( None != self.wave.limit ):
+            self.wave.limit.reset(val=clima['temperature'])
+        await self.chamber.start()
+        return True
+    #*****************************
+
+
+    #*****************************
+    async def stop(self):
+        """
+        @note               stops chamber operation and set temperature to start
+                            value of first waveform, swap() does not change it
+
+        @rtype              boolean
+        @return             successful
+        """
+        await self.chamber.set_clima(clima={'temperature': self.tstart})
+        await self.chamber.stop()
+        return True
+    #*****************************
+
+
+    #*****************************
+    async def chamber_update(self):
+        """
+        @note               reads clima, calculates and writes next setpoint,
+                            cfg_pipeline writes setpoint first
+
+        @rtype              boolean
+        @return             successful
+        """
+        if ( (None == self.chamber) or (None == self.wave) ):
+            raise ValueError("Interfaces not opened, call methode 'open'")
+        if ( False == self.cfg_pipeline ):
+            self.clima['get'] = await self.chamber.get_clima()
+        self.clima['set'] = self.wave.next()
+        await self.chamber.set_clima(clima={'temperature': self.clima['set']['val']})
+        if ( self.cfg_pipeline ):
+            self.clima['get'] = await self.chamber.get_clima()  # setpoint does not wait for measurement
+        return True
+    #*****************************
+
+
+    #*****************************
+    async def measure(self):
+        """
+        @note               reads current clima conditions from chamber
+
+        @rtype              dict
+        @return             measured clima
+        """
+        if ( None == self.chamber ):
+            raise ValueError("Interfaces not opened, call methode 'open'")
+        self.clima['get'] = await self.chamber.get_clima()
+        return self.clima['get']
+    #*****************************
+
+
+    #*****************************
+    async def setpoint_at(self, t=0):
+        """
+        @note               writes setpoint of waveform at time, event mode
+
+        @param t            time in seconds since start, waveform time after swap()
+        @rtype              float
+        @return             time of next setpoint change in seconds since start
+        """
+        if ( (None == self.chamber) or (None == self.wave) ):
+            raise ValueError("Interfaces not opened, call methode 'open'")
+        if ( None != self.wave.limit ):
+            raise ValueError("Event mode not supported with slew limit")
+        self.clima['set'] = self.wave.at(idx=math.floor((t-self.tswap)/self.wave.waveDescr['x']['ts']))
+        await self.chamber.set_clima(clima={'temperature': self.clima['set']['val']})
+        return self.next_change(t)
+    #*****************************
+
+
+    #*****************************
+    async def run(self, ticks=None, tick=None):
+        """
+        @note               control loop, cyclic update on the time grid of
+                            cfg_tsample_sec with cfg_overrun policy
+
+        @param ticks        number of updates, None runs endless
+        @param tick         optional callback after each update, f.e. UI
+        @rtype              dict
+        @return             scheduler statistic
+        """
+        self.sched = scheduler(period=self.cfg_tsample_sec, policy=self.cfg_overrun)
+        last = -1
+        done = 0
+        while ( (None == ticks) or (done < ticks) ):
+            step = await self.sched.wait_async()    # other chambers run meanwhile
+            if ( step != last+1 ):              # skipped ticks, waveform follows time
+                self.wave.seek(t=max(step*self.cfg_tsample_sec - self.tswap, 0))
+            last = step
+            await self.chamber_update()
+            if ( None != tick ):
+                tick(self)
+            done += 1
+        return self.sched.stats
+    #*****************************
+
+
+    #*****************************
+    async def close(self):
+        """
+        @note               closes hw handle to chamber
+
+        @rtype              boolean
+        @return             successful
+        """
+        await self.chamber.close()
+        return True
+    #*****************************
+
+#------------------------------------------------------------------------------
@@ -0,0 +1,362 @@
+# -*- coding: utf-8 -*-
+"""
+@author:        Andreas Kaeberlein
+@copyright:     Copyright 2026
+@credits:       AKAE
+
+@license:       GPLv3
+@maintainer:    Andreas Kaeberlein
+@email:         andreas.kaeberlein@web.de
+
+@file:          ATWGFleet.py
+@date:          2026-10-17
+
+@note           drives many climate chambers from one process
+                  - chambers and waveforms from one .yml file
+                  - one ATWGAsync per chamber, all updated from one scheduler
+                  - chambers are opened concurrently, a failing chamber is
+                    stopped and dropped, the others continue
+                  - serial round trips per tick from driver request counters
+"""
+
+
+
+#------------------------------------------------------------------------------
+# Standard
+import asyncio                                  # event loop
+import shlex                                    # cli string of waveform
+# Self
+from ATWG.ATWG import ATWG                      # time string conversion
+from ATWG.ATWGAsync import ATWGAsync            # generator per chamber
+from ATWG.scheduler.scheduler import scheduler  # isochron update
+#------------------------------------------------------------------------------
+
+
+
+#------------------------------------------------------------------------------
+class ATWGFleet:
+    """
+    @note:  chamber list, f.e.
+              sampleTime: 1s                  # optional, one time grid for all chambers
+              overrun: skip                   # optional, scheduler policy
+              chambers:
+                - name: oven1                 # optional, unique
+                  chamber: ESPEC_SH641
+                  port: /dev/ttyUSB0
+                  wave: --sine --minTemp=10 --maxTemp=60 --period=1h
+                - chamber: SIM
+                  latency: 20ms               # optional, emulated round trip
+                  wave: {wave: trapezoid, lowVal: -10, highVal: 80, tp: 7200, tr: 1800, tf: 1800}
+            wave is a string with atwg-cli waveform options or a dict of waves.set
+    """
+
+    #*****************************
+    def __init__(self, tsample=1, overrun="skip"):
+        """
+        @note           initializes fleet
+
+        @param tsample  update time of all chambers in seconds
+        @param overrun  scheduler overrun policy
+        """
+        self.cfg_tsample_sec = tsample
+        self.cfg_overrun = overrun
+        self.members = []       # {'name': , 'chamberArg': , 'waveArg': , 'atwg': , 'state': , 'error': , 'requests': , 'trips': }
+        self.sched = None       # scheduler of run()
+        self.stats = {}
+        self.reset()
+    #*****************************
+
+
+    #*****************************
+    def reset(self):
+        """
+        @note           clears round trip statistic
+        """
+        self.stats = {'ticks': 0, 'failed': 0, 'trips': {'last': 0, 'max': 0, 'mean': 0.0, 'total': 0}}
+    #*****************************
+
+
+    #*****************************
+    def load(self, file=None):
+        """
+        @note           loads chamber list from yaml file, see class note
+
+        @param file     path to .yml
+        @rtype          int
+        @return         number of chambers
+        """
+        import yaml     # import if required
+        if ( None == file ):
+            raise ValueError("Missing fleet file")
+        with open(file, 'r') as fH:
+            cfg = yaml.load(fH, Loader=yaml.SafeLoader)
+        return self.configure(cfg=cfg)
+    #*****************************
+
+
+    #*****************************
+    def configure(self, cfg=None):
+        """
+        @note           creates one generator per chamber, configuration errors
+                        are raised, chamber is not opened
+
+        @param cfg      chamber list, see class note
+        @rtype          int
+        @return         number of chambers
+        """
+        # check
+        if ( (False == isinstance(cfg, dict)) or (False == isinstance(cfg.get('chambers'), list)) or (0 == len(cfg['chambers'])) ):
+            raise ValueError("Fleet requires list of chambers")
+        # fleet settings
+        conv = ATWG()   # time string conversion
+        self.cfg_tsample_sec = conv.time_to_sec(cfg.get('sampleTime', self.cfg_tsample_sec))
+        if ( 0 >= self.cfg_tsample_sec ):
+            raise ValueError("Positive sample time required")
+        self.cfg_overrun = cfg.get('overrun', self.cfg_overrun)
+        if ( self.cfg_overrun not in scheduler.POLICIES ):
+            raise ValueError("Unsupported overrun policy '" + str(self.cfg_overrun) + "'")
+        # chambers
+        self.members = []
+        for idx, entry in enumerate(cfg['chambers']):
+            name = str(entry.get('name', str(entry.get('chamber', "chamber")) + str(idx)))
+            if ( name in [member['name'] for member in self.members] ):
+                raise ValueError("Duplicate chamber name '" + name + "'")
+            if ( False == ('wave' in entry) ):
+                raise ValueError("Missing wave of chamber '" + name + "'")
+            atwg = ATWGAsync()
+            atwg.cfg_tsample_sec = self.cfg_tsample_sec
+            atwg.cfg_overrun = self.cfg_overrun
+            # waveform
+            if ( isinstance(entry['wave'], str) ):
+                try:
+                    (chamberArg, waveArg) = atwg.parse_cli(cliArgs=shlex.split(entry['wave']))
+                except SystemExit:
+                    raise ValueError("Invalid wave of chamber '" + name + "'")    # argparse error
+            else:
+                (chamberArg, waveArg) = ({'chamber': atwg.avlChambers[0], 'port': ""}, dict(entry['wave']))
+            waveArg['ts'] = self.cfg_tsample_sec    # one time grid
+            # interface
+            chamberArg['chamber'] = str(entry.get('chamber', chamberArg['chamber']))
+            chamberArg['port'] = str(entry.get('port', chamberArg['port']))
+            if ( 'latency' in entry ):
+                chamberArg['latency'] = conv.time_to_sec(entry['latency'])
+            self.members.append({'name': name, 'chamberArg': chamberArg, 'waveArg': waveArg, 'atwg': atwg, 'state': "init", 'error': None, 'requests': 0, 'trips': 0})
+        return len(self.members)
+    #*****************************
+
+
+    #*****************************
+    def active(self):
+        """
+        @note           running chambers
+
+        @rtype          list
+        @return         members in state run
+        """
+        return [member for member in self.members if ( "run" == member['state'] )]
+    #*****************************
+
+
+    #*****************************
+    def requests(self):
+        """
+        @note           counts round trips of all chambers since last call,
+                        updates trips of members
+
+        @rtype          int
+        @return         round trips since last call
+        """
+        trips = 0
+        for member in self.members:
+            chamber = member['atwg'].chamber
+            num = chamber.requests if ( None != chamber ) else 0
+            member['trips'] = num - member['requests']
+            member['requests'] = num
+            trips += member['trips']
+        return trips
+    #*****************************
+
+
+    #*****************************
+    async def fail(self, member=None, err=None):
+        """
+        @note           drops chamber from fleet, stops and closes it as far as possible
+
+        @param member   failed chamber
+        @param err      cause
+        """
+        member['state'] = "failed"
+        member['error'] = str(err) if ( 0 < len(str(err)) ) else type(err).__name__
+        self.stats['failed'] += 1
+        for proc in ("stop", "close"):
+            try:
+                await getattr(member['atwg'], proc)()
+            except Exception:
+                pass    # interface lost
+    #*****************************
+
+
+    #*****************************
+    async def open_member(self, member=None):
+        """
+        @note           opens chamber, initializes waveform and starts chamber
+
+        @param member   chamber of fleet
+        @rtype          boolean
+        @return         successful
+        """
+        try:
+            await member['atwg'].open(chamberArg=member['chamberArg'], waveArg=member['waveArg'])
+            await member['atwg'].start()
+        except Exception as err:
+            await self.fail(member=member, err=err)
+            return False
+        member['state'] = "run"
+        return True
+    #*****************************
+
+
+    #*****************************
+    async def open(self):
+        """
+        @note           opens and starts all chambers concurrently
+
+        @rtype          int
+        @return         number of running chambers
+        """
+        if ( 0 == len(self.members) ):
+            raise ValueError("No chambers configured, call methode 'load'")
+        self.reset()
+        await asyncio.gather(*[self.open_member(member) for member in self.members])
+        self.requests()     # round trips of open are not tick statistic
+        return len(self.active())
+    #*****************************
+
+
+    #*****************************
+    async def update(self, step=0, seek=False):
+        """
+        @note           updates all running chambers concurrently, failed
+                        chambers are dropped
+
+        @param step     tick number since start
+        @param seek     waveforms follow time, ticks were skipped
+        @rtype          int
+        @return         serial round trips of tick
+        """
+        active = self.active()
+        if ( seek ):
+            for member in active:
+                member['atwg'].wave.seek(t=max(step*self.cfg_tsample_sec - member['atwg'].tswap, 0))
+        rsp = await asyncio.gather(*[member['atwg'].chamber_update() for member in active], return_exceptions=True)
+        await asyncio.gather(*[self.fail(member=member, err=err) for member, err in zip(active, rsp) if ( isinstance(err, Exception) )])
+        # statistic
+        trips = self.requests()
+        stats = self.stats
+        stats['ticks'] += 1
+        stats['trips']['last'] = trips
+        stats['trips']['max'] = max(stats['trips']['max'], trips)
+        stats['trips']['total'] += trips
+        stats['trips']['mean'] = stats['trips']['total'] / stats['ticks']
+        return trips
+    #*****************************
+
+
+    #*****************************
+    async def run(self, ticks=None, tick=None):
+        """
+        @note           control loop of all chambers on one time grid,
+                        ends when no chamber is running
+
+        @param ticks    number of updates, None runs endless
+        @param tick     optional callback after each update, f.e. UI
+        @rtype          dict
+        @return         fleet statistic
+        """
+        self.sched = scheduler(period=self.cfg_tsample_sec, policy=self.cfg_overrun)
+        last = -1
+        done = 0
+        while ( ((None == ticks) or (done < ticks)) and (0 < len(self.active())) ):
+            step = await self.sched.wait_async()
+            await self.update(step=step, seek=(step != last+1))
+            last = step
+            if ( None != tick ):
+                tick(self)
+            done += 1
+        return self.stats
+    #*****************************
+
+
+    #*****************************
+    async def close(self):
+        """
+        @note           stops and closes all running chambers
+
+        @rtype          int
+        @return         number of closed chambers
+        """
+        async def close_member(member):
+            try:
+                await member['atwg'].stop()
+                await member['atwg'].close()
+            except Exception as err:
+                await self.fail(member=member, err=err)
+                return False
+            member['state'] = "closed"
+            return True
+        done = await asyncio.gather(*[close_member(member) for member in self.active()])
+        return sum(done)
+    #*****************************
+
+
+    #*****************************
+    async def main(self, ticks=None, tick=None):
+        """
+        @note           opens, runs and closes fleet
+
+        @param ticks    number of updates, None runs endless
+        @param tick     optional callback after each update, f.e. UI
+        @rtype          dict
+        @return         fleet statistic
+        """
+        await self.open()
+        try:
+            return await self.run(ticks=ticks, tick=tick)
+        finally:
+            await self.close()
+    #*****************************
+
+
+    #*****************************
+    def status(self):
+        """
+        @note       state of all chambers and round trips as formated text string
+
+        @rtype      string
+        @return     current status
+        """
+        def temp(clima, key):
+            return "{num:+7.2f} °C".format(num=clima[key]) if ( None != clima ) else "{:>10s}".format("-")
+        txt = ""
+        txt += "\x1b[2J\n"  # delete complete output
+        txt += "Arbitrary Temperature Waveform Generator - Fleet\n"
+        txt += "\n"
+        txt += "  {:<16s} {:<12s} {:<7s} {:>10s} {:>10s} {:>5s}\n".format("Chamber", "Type", "State", "Tmeas", "Tset", "Trips")
+        for member in self.members:
+            clima = member['atwg'].clima
+            txt += "  {:<16s} {:<12s} {:<7s} ".format(member['name'][:16], member['chamberArg']['chamber'][:12], member['state'])
+            txt += temp(clima.get('get'), 'temperature') + " " + temp(clima.get('set'), 'val') + " {:>5d}\n".format(member['trips'])
+            if ( None != member['error'] ):
+                txt += "    Error: " + member['error'] + "\n"
+        txt += "\n"
+        txt += "  Running    : " + "{:d}".format(len(self.active())) + " of " + "{:d}".format(len(self.members)) + "\n"
+        txt += "  Round trips: " + "{:d}".format(self.stats['trips']['last']) + " last tick (mean " + "{:.1f}".format(self.stats['trips']['mean']) + ", max " + "{:d}".format(self.stats['trips']['max']) + ")\n"
+        if ( None != self.sched ):
+            txt += "  Ticks      : " + "{:d}".format(self.sched.stats['ticks']) + " (overruns " + "{:d}".format(self.sched.stats['overruns']) + ", jitter max " + "{:.1f}".format(1000*self.sched.stats['jitter']['max']) + " ms)\n"
+            txt += "  Sample     : " + "{:g}".format(self.sched.stats['period']) + " s (cost " + "{:.1f}".format(1000*self.sched.stats['cost']['last']) + " ms, max " + "{:.1f}".format(1000*self.sched.stats['cost']['max']) + " ms)\n"
+        txt += "\n"
+        txt += "Press 'CTRL + C' for exit\n"
+        return txt
+    #*****************************
+
+#------------------------------------------------------------------------------
@@ -58,6 +58,7 @@ class especShSu:
         self.sim_rd = ""        # stores answer of next read request
         # managment flags
         self.isOpen = False;    # interface is open
+        self.tiout_sec = sh641Const.MSC_TIOUT_RS232_MSEC / 1000 # read timeout, from interface config
         # internal
         self.last_write_temp = float("nan") # stores last written value, used for reduction
     #*****************************
@@ -69,6 +70,28 @@ class especShSu:
         Opens COM port and try to recognize the climate chamber
         SRC: http://www.varesano.net/blog/fabio/serial%20rs232%20connections%20python
         """
+        # open interface or dialog file
+        self.connect(port=port, simFile=simFile)
+        # try to indentify chamber
+        self.write(sh641Const.CMD_GET_TYPE)                 # request type
+        self.identify(self.read())                          # read chamber repsonse
+        # end
+        return True
+    #*****************************
+
+
+    #*****************************
+    def connect(self, port="", simFile="", timeout=None):
+        """
+        @note           opens COM port with interface defaults or loads dialog file
+                        in simulation mode, chamber is not requested
+
+        @param port     system port, empty uses default of interface config
+        @param simFile  dialog file, enables simulation mode
+        @param timeout  read timeout in seconds, None uses interface config, 0 non-blocking
+        @rtype          boolean
+        @return         successful
+        """
         # Clima chamber interface mode
         if ( 0 == len(simFile) ):
             # default interface config
@@ -82,6 +105,7 @@ class especShSu:
             # user specifies path to chamber
             if ( 0 < len(port) ):
                 itfConfig['rs232'][os.name] = port
+            self.tiout_sec = itfConfig['tiout_sec']
             # open interface
             #   https://pyserial.readthedocs.io/en/latest/
             try:
@@ -91,7 +115,7 @@ class especShSu:
                              stopbits=itfConfig['stopbit'],
                              parity=itfConfig['parity'],           # see 'serial.PARITY_NONE' for proper definition
                              bytesize=itfConfig['databit'],
-                             timeout=itfConfig['tiout_sec']
+                             timeout=itfConfig['tiout_sec'] if ( None == timeout ) else timeout
                            )
             except:
                 raise ValueError("Failed open port '" + itfConfig['rs232'][os.name] + "' for " + self.info()['name'])
@@ -108,12 +132,21 @@ class especShSu:
             fH.close();                                         # close file handle
         # mark interface/sim as open
         self.isOpen = True
-        # try to indentify chamber
-        self.write(sh641Const.CMD_GET_TYPE)                 # request type
-        chamberID = self.read()                             # read chamber repsonse
-        if (False == (sh641Const.RSP_CH_ID in chamberID) ): # known type?
-            raise ValueError("Error: Chamber '" + chamberID + "' unknown")
-        # end
+        return True
+    #*****************************
+
+
+    #*****************************
+    def identify(self, msg):
+        """
+        @note           checks response of type request
+
+        @param msg      chamber response
+        @rtype          boolean
+        @return         known chamber
+        """
+        if (False == (sh641Const.RSP_CH_ID in msg) ):    # known type?
+            raise ValueError("Error: Chamber '" + msg + "' unknown")
         return True
     #*****************************
 
@@ -289,19 +322,13 @@ class especShSu:
         # acquire temperature
         try:
             self.write(sh641Const.CMD_GET_TEMP)             # write temperature request to chamber
-            rsp = self.parse(self.read())                   # read/parse; dict: measured, setpoint, upalarm, lowalarm
-            if not ( (sh641Const.RSP_OK == rsp['state']) and ("MEAS" == rsp['parm']) ):
-                raise ValueError("Get temperaure request not succesfull completeted by chamber")
-            clima['temperature'] = rsp['val']['measured']   # extract current temp values
+            clima['temperature'] = self.measured(self.read(), err="Get temperaure request not succesfull completeted by chamber")
         except:
             raise ValueError("Failed to get temperature not proper handled")
         # acquire humidity
         try:
             self.write(sh641Const.CMD_GET_HUMI)         #  write temperature request to chamber
-            rsp = self.parse(self.read())               # read/parse; dict: measured, setpoint, upalarm, lowalarm
-            if not ( (sh641Const.RSP_OK == rsp['state']) and ("MEAS" == rsp['parm']) ):
-                raise ValueError("Get humidity request not succesfull completeted by chamber")
-            clima['humidity'] = rsp['val']['measured']  # extract humidity values
+            clima['humidity'] = self.measured(self.read(), err="Get humidity request not succesfull completeted by chamber")
         except:
             raise ValueError("Get humidity request not proper handled")
         # release result
@@ -309,6 +336,23 @@ class especShSu:
     #*****************************
 
 
+    #*****************************
+    def measured(self, msg, err=""):
+        """
+        @note           extracts measured value from measurement response
+
+        @param msg      chamber response
+        @param err      exception message of failed request
+        @rtype          float
+        @return         measured value
+        """
+        rsp = self.parse(msg)   # read/parse; dict: measured, setpoint, upalarm, lowalarm
+        if not ( (sh641Const.RSP_OK == rsp['state']) and ("MEAS" == rsp['parm']) ):
+            raise ValueError(err)
+        return rsp['val']['measured']
+    #*****************************
+
+
     #*****************************
     def set_clima(self, clima=None):
         """
@@ -326,13 +370,9 @@ class especShSu:
         # try to set temperature
         try:
             # check if update is necessary
-            if ( False == math.isnan(self.last_write_temp) ):
-                if ( sh641Const.MSC_TEMP_RESOLUTION >= abs(self.last_write_temp-clima['temperature']) ):
-                    return True
-            # prepare
-            numDigs = len(str(sh641Const.MSC_TEMP_RESOLUTION).split(".")[1])            # determine number of digits in fracs based on resulotion
-            self.last_write_temp = clima['temperature']                                 # write only new value, if change is bigger then resulotion
-            setTemp = '{temp:.{frac}f}'.format(temp=clima['temperature'], frac=numDigs) # build temp string based  on chambers fraction settings
+            setTemp = self.setpoint(clima)
+            if ( None == setTemp ):
+                return True
             # request chamber
             try:
                 self.write(sh641Const.CMD_SET_TEMP + setTemp)   # set new temperature
@@ -341,7 +381,7 @@ class especShSu:
                 raise ValueError("Request chamber failed")
             # check setting of new temperature
             #   rsp['val']: S35 -> 35
-            if not ( (sh641Const.RSP_OK == rsp['state']) and ("TEMP" == rsp['parm']) and (float(setTemp) == float(rsp['val'][1:])) ):
+            if not ( self.confirm(rsp, parm="TEMP", val=setTemp) ):
                 raise Warning("Temperature set check failed")
         except:
             raise ValueError("Failed to set clima")
@@ -350,6 +390,44 @@ class especShSu:
     #*****************************
 
 
+    #*****************************
+    def setpoint(self, clima=None):
+        """
+        @note           builds temperature string of set command, updates are
+                        skipped if the change is within chamber resolution
+
+        @param clima    new clima value
+        @rtype          string
+        @return         temperature string, None if no update is necessary
+        """
+        if ( False == math.isnan(self.last_write_temp) ):
+            if ( sh641Const.MSC_TEMP_RESOLUTION >= abs(self.last_write_temp-clima['temperature']) ):
+                return None
+        numDigs = len(str(sh641Const.MSC_TEMP_RESOLUTION).split(".")[1])     # determine number of digits in fracs based on resulotion
+        self.last_write_temp = clima['temperature']                          # write only new value, if change is bigger then resulotion
+        return '{temp:.{frac}f}'.format(temp=clima['temperature'], frac=numDigs) # build temp string based  on chambers fraction settings
+    #*****************************
+
+
+    #*****************************
+    def confirm(self, rsp, parm="", val=""):
+        """
+        @note           checks acknowledge of set command
+
+        @param rsp      parsed chamber response, see parse()
+        @param parm     expected parameter, f.e. 'POWER'
+        @param val      expected value, temperature is compared numerical
+        @rtype          boolean
+        @return         command accepted
+        """
+        if not ( (sh641Const.RSP_OK == rsp['state']) and (parm == rsp['parm']) ):
+            return False
+        if ( "TEMP" == parm ):
+            return float(val) == float(rsp['val'][1:])  # S35 -> 35
+        return val == rsp['val']
+    #*****************************
+
+
     #*****************************
     def set_power(self, pwr=sh641Const.PWR_OFF):
         """
@@ -374,7 +452,7 @@ class especShSu:
         except:
             raise ValueError("Request chamber failed")
         # check response
-        if not ( (sh641Const.RSP_OK == rsp['state']) and ("POWER" == rsp['parm']) and (pwr == rsp['val']) ):
+        if not ( self.confirm(rsp, parm="POWER", val=pwr) ):
             raise ValueError("Failed to set new power state")
         # graceful end
         return True
@@ -403,7 +481,7 @@ class especShSu:
         except:
             raise ValueError("Request chamber failed")
         # check response
-        if not ( (sh641Const.RSP_OK == rsp['state']) and ("MODE" == rsp['parm']) and (mode == rsp['val']) ):
+        if not ( self.confirm(rsp, parm="MODE", val=mode) ):
             raise ValueError("Failed to set new mode")
         # graceful end
         return True
@@ -475,6 +553,8 @@ class especShSu:
         info['temperature']['slewrate']['rise'] = sh641Const.TEMP_GRAD_RISE # temperature increasing rate
         info['temperature']['slewrate']['fall'] = sh641Const.TEMP_GRAD_FALL # temperature decreasing rate
         info['temperature']['slewrate']['unit'] = "c/min"                   # change rate in Celsius per minute
+        # serial commands per driver call
+        info['commands'] = {'get': 2, 'set': 1}   # get_clima: temperature + humidity, set_clima: on change only
         # Name
         info['name'] = "ESPEC_SH641"
         # release
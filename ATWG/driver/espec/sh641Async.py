@@ -0,0 +1,292 @@
+# -*- coding: utf-8 -*-
+"""
+@author:        Andreas Kaeberlein
+@copyright:     Copyright 2026
+@credits:       AKAE
+
+@license:       GPLv3
+@maintainer:    Andreas Kaeberlein
+@email:         andreas.kaeberlein@web.de
+
+@file:          sh641Async.py
+@date:          2026-10-17
+
+@note           asyncio driver for ESPEC CORP. SH-641 chamber
+                  - same commands and checks as especShSu
+                  - serial port opened non-blocking, reads wait for the
+                    port file descriptor on the event loop, no thread
+                  - event loops without reader support poll the port
+                  - request/response pairs are serialized per chamber, bytes
+                    of timed out responses are dropped before the next request
+"""
+
+
+
+#------------------------------------------------------------------------------
+import asyncio                  # event loop
+import time                     # read timeout
+from .sh641 import especShSu    # commands, parser, checks
+from . import sh641Const        # ESPEC SH641 constants
+#------------------------------------------------------------------------------
+
+
+
+#------------------------------------------------------------------------------
+class especShSuAsync(especShSu):
+
+    POLL_SEC = 0.01     # port poll time without event loop reader support
+
+    #*****************************
+    def __init__(self):
+        """
+        Initialization of class
+        """
+        super().__init__()
+        self.lock = asyncio.Lock()  # one transaction at a time
+        self.rxbuf = b""            # received bytes of next response
+        self.requests = 0           # request/response round trips
+    #*****************************
+
+
+    #*****************************
+    async def open(self, port="", simFile=""):
+        """
+        @note           opens COM port non-blocking and identifies the chamber
+
+        @param port     system port, empty uses default of interface config
+        @param simFile  dialog file, enables simulation mode
+        @rtype          boolean
+        @return         successful
+        """
+        self.connect(port=port, simFile=simFile, timeout=0)
+        self.identify(await self.transaction(sh641Const.CMD_GET_TYPE))
+        return True
+    #*****************************
+
+
+    #*****************************
+    async def close(self):
+        """
+        @note           closes handle
+
+        @rtype          boolean
+        @return         successful
+        """
+        if ( None == self.sim ):
+            self.com.close()
+        self.isOpen = False
+        return True
+    #*****************************
+
+
+    #*****************************
+    async def read(self):
+        """
+        @note           reads one response line, waits on event loop until
+                        port is readable
+
+        @rtype          string
+        @return         chamber reponse in ASCII text
+        """
+        # interface open or sim mode?
+        if ( (False == self.isOpen) or (None != self.sim) ):
+            return super().read()
+        # collect until line end
+        end = sh641Const.MSC_LINE_END.encode()
+        deadline = time.monotonic() + self.tiout_sec
+        while ( False == (end in self.rxbuf) ):
+            self.rxbuf += self.com.read(max(self.com.in_waiting, 1))    # non-blocking
+            if ( end in self.rxbuf ):
+                break
+            remain = deadline - time.monotonic()
+            if ( 0 >= remain ):
+                raise ValueError("Chamber response timeout")
+            await self.readable(timeout=remain)
+        # split line, keep following bytes
+        (msg, self.rxbuf) = self.rxbuf.split(end, 1)
+        return msg.decode().strip()
+    #*****************************
+
+
+    #*****************************
+    async def readable(self, timeout=None):
+        """
+        @note           sleeps until port has data or timeout expired
+
+        @param timeout  max. wait time in seconds
+        """
+        loop = asyncio.get_running_loop()
+        ready = loop.create_future()
+        try:
+            fd = self.com.fileno()
+            loop.add_reader(fd, lambda: ready.done() or ready.set_result(True))
+        except (AttributeError, NotImplementedError, OSError, ValueError):
+            await asyncio.sleep(min(self.POLL_SEC, timeout))    # f.e. windows proactor loop
+            return
+        try:
+            await asyncio.wait_for(ready, timeout)
+        except asyncio.TimeoutError:
+            pass
+        finally:
+            loop.remove_reader(fd)
+    #*****************************
+
+
+    #*****************************
+    async def transaction(self, msg):
+        """
+        @note           writes command and waits for response
+
+        @param msg      command for chamber
+        @rtype          string
+        @return         chamber reponse in ASCII text
+        """
+        async with self.lock:
+            self.requests += 1
+            self.discard()              # late response of timed out request
+            self.write(msg)             # small command, fits into OS buffer
+            return await self.read()
+    #*****************************
+
+
+    #*****************************
+    def discard(self):
+        """
+        @note           drops received bytes which belong to no request, f.e.
+                        partial or late response after a timeout
+        """
+        self.rxbuf = b""
+        if ( (True == self.isOpen) and (None == self.sim) ):
+            self.com.reset_input_buffer()
+    #*****************************
+
+
+    #*****************************
+    async def get_clima(self):
+        """
+        @note           Current measured clima
+
+        @rtype          dict
+        @return         humidity/temperature vals
+        """
+        clima = {'temperature': float('nan'), 'humidity': float('nan')}
+        try:
+            clima['temperature'] = self.measured(await self.transaction(sh641Const.CMD_GET_TEMP), err="Get temperaure request not succesfull completeted by chamber")
+        except:
+            raise ValueError("Failed to get temperature not proper handled")
+        try:
+            clima['humidity'] = self.measured(await self.transaction(sh641Const.CMD_GET_HUMI), err="Get humidity request not succesfull completeted by chamber")
+        except:
+            raise ValueError("Get humidity request not proper handled")
+        return clima
+    #*****************************
+
+
+    #*****************************
+    async def set_clima(self, clima=None):
+        """
+        @note           set chambers new clima value, only written if change
+                        exceeds chamber resolution
+
+        @param clima    new clima value, {'temperature': myVal}
+        @rtype          boolean
+        @return         successful
+        """
+        if ( clima == None ):
+            raise ValueError("No new data provided")
+        try:
+            setTemp = self.setpoint(clima)
+            if ( None == setTemp ):
+                return True
+            try:
+                rsp = self.parse(await self.transaction(sh641Const.CMD_SET_TEMP + setTemp))
+            except:
+                raise ValueError("Request chamber failed")
+            if not ( self.confirm(rsp, parm="TEMP", val=setTemp) ):
+                raise Warning("Temperature set check failed")
+        except:
+            raise ValueError("Failed to set clima")
+        return True
+    #*****************************
+
+
+    #*****************************
+    async def set_power(self, pwr=sh641Const.PWR_OFF):
+        """
+        @note           enables/disables power of climate chamber
+
+        @param pwr      PWR_ON or PWR_OFF
+        @rtype          boolean
+        @return         successful
+        """
+        if ( False == (pwr in (sh641Const.PWR_OFF, sh641Const.PWR_ON)) ):
+            raise ValueError("unsupported power mode '" + pwr + "'")
+        try:
+            rsp = self.parse(await self.transaction(sh641Const.CMD_SET_PWR + pwr))
+        except:
+            raise ValueError("Request chamber failed")
+        if not ( self.confirm(rsp, parm="POWER", val=pwr) ):
+            raise ValueError("Failed to set new power state")
+        return True
+    #*****************************
+
+
+    #*****************************
+    async def set_mode(self, mode=sh641Const.MODE_STANDBY):
+        """
+        @note           selects chamber mode
+
+        @param mode     MODE_CONSTANT, MODE_STANDBY or MODE_OFF
+        @rtype          boolean
+        @return         successful
+        """
+        if ( False == (mode in (sh641Const.MODE_CONSTANT, sh641Const.MODE_STANDBY, sh641Const.MODE_OFF)) ):
+            raise ValueError("unsupported operating mode '" + mode + "'")
+        try:
+            rsp = self.parse(await self.transaction(sh641Const.CMD_SET_MODE + mode))
+        except:
+            raise ValueError("Request chamber failed")
+        if not ( self.confirm(rsp, parm="MODE", val=mode) ):
+            raise ValueError("Failed to set new mode")
+        return True
+    #*****************************
+
+
+    #*****************************
+    async def start(self, temperature=None):
+        """
+        @note           starts temperature chamber
+
+        @param temperature  start temperature, None uses current temperature
+        @rtype          boolean
+        @return         successful
+        """
+        if ( None == temperature ):
+            temperature = (await self.get_clima())['temperature']
+        try:
+            await self.set_clima(clima={'temperature': temperature})    # set start temp
+            await self.set_power(sh641Const.PWR_ON)                     # enable chamber
+            await self.set_mode(sh641Const.MODE_CONSTANT)               # run in constant mode
+        except:
+            raise ValueError("Failed to start chamber")
+        return True
+    #*****************************
+
+
+    #*****************************
+    async def stop(self):
+        """
+        @note           stops temperature chamber
+
+        @rtype          boolean
+        @return         successful
+        """
+        try:
+            await self.set_mode(sh641Const.MODE_STANDBY)    # bring to standby
+            await self.set_power(sh641Const.PWR_OFF)        # disable
+        except:
+            raise ValueError("Failed to stop chamber")
+        return True
+    #*****************************
+
+#------------------------------------------------------------------------------
@@ -102,6 +102,8 @@ class simChamber:
         info['temperature']['slewrate']['rise'] = float('+inf')     # positiv slewrate
         info['temperature']['slewrate']['fall'] = float('-inf')     # negativ slewrate
         info['temperature']['slewrate']['unit'] = "c/min"           # change rate in Celsius per minute
+        # serial commands per driver call
+        info['commands'] = {'get': 0, 'set': 0}   # simulation without interface
         # Name
         info['name'] = "SIM"
         # release
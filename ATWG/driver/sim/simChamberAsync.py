@@ -0,0 +1,128 @@
+# -*- coding: utf-8 -*-
+"""
+@author:        Andreas Kaeberlein
+@copyright:     Copyright 2026
+@credits:       AKAE
+
+@license:       GPLv3
+@maintainer:    Andreas Kaeberlein
+@email:         andreas.kaeberlein@web.de
+
+@file:          simChamberAsync.py
+@date:          2026-10-17
+
+@note           asyncio virtual climate chamber, optional latency per
+                request emulates a serial chamber on the event loop
+"""
+
+
+
+#------------------------------------------------------------------------------
+import asyncio                      # event loop
+from .simChamber import simChamber  # virtual chamber
+#------------------------------------------------------------------------------
+
+
+
+#------------------------------------------------------------------------------
+class simChamberAsync(simChamber):
+
+    #*****************************
+    def __init__(self, latency=0):
+        """
+        @note           initializes chamber
+
+        @param latency  emulated round trip time per request in seconds
+        """
+        super().__init__()
+        self.latency = latency
+        self.requests = 0       # emulated round trips
+    #*****************************
+
+
+    #*****************************
+    async def request(self):
+        """
+        @note           emulates one request/response round trip
+        """
+        self.requests += 1
+        await asyncio.sleep(self.latency)
+    #*****************************
+
+
+    #*****************************
+    async def open(self, port=""):
+        """
+        @note           opens physical interface to chamber, dummy in sim
+
+        @rtype          boolean
+        @return         successfull opened
+        """
+        return super().open(port=port)
+    #*****************************
+
+
+    #*****************************
+    async def close(self):
+        """
+        @note           closes physical interface, dummy in sim
+
+        @rtype          boolean
+        @return         successfull closed
+        """
+        return super().close()
+    #*****************************
+
+
+    #*****************************
+    async def start(self, temperature=None):
+        """
+        @note           starts chamber, dummy in sim
+
+        @rtype          boolean
+        @return         successfull started
+        """
+        await self.request()
+        return super().start(temperature=temperature)
+    #*****************************
+
+
+    #*****************************
+    async def stop(self):
+        """
+        @note           stops chamber, dummy in sim
+
+        @rtype          boolean
+        @return         successfull stopped
+        """
+        await self.request()
+        return super().stop()
+    #*****************************
+
+
+    #*****************************
+    async def get_clima(self):
+        """
+        @note           Current measured clima
+
+        @rtype          dict
+        @return         hudidity/temperature vals
+        """
+        await self.request()
+        return super().get_clima()
+    #*****************************
+
+
+    #*****************************
+    async def set_clima(self, clima=None):
+        """
+        @note           sets new clima
+
+        @rtype          boolean
+        @return         successful
+        """
+        await self.request()
+        return super().set_clima(clima=clima)
+    #*****************************
+
+#------------------------------------------------------------------------------
@@ -0,0 +1,322 @@
+# -*- coding: utf-8 -*-
+"""
+@author:        Andreas Kaeberlein
+@copyright:     Copyright 2026
+@credits:       AKAE
+
+@license:       GPLv3
+@maintainer:    Andreas Kaeberlein
+@email:         andreas.kaeberlein@web.de
+
+@file:          worker.py
+@date:          2026-10-17
+
+@note           background I/O thread for blocking chamber drivers
+                  - same procedures as the driver, all port access in one thread
+                  - get_clima returns the latest measurement and requests the next one
+                  - set_clima posts the setpoint, unwritten setpoints are replaced
+                  - open/close/start/stop wait for the chamber
+                  - bounded request and response queues
+                  - errors of posted requests are raised with the next call
+"""
+
+
+
+#------------------------------------------------------------------------------
+import queue        # bounded fifo
+import threading    # I/O thread
+import time         # latency
+#------------------------------------------------------------------------------
+
+
+
+#------------------------------------------------------------------------------
+class chamberWorker:
+
+    #*****************************
+    def __init__(self, driver=None, depth=8):
+        """
+        @note           wraps chamber driver, thread is started on open
+
+        @param driver   blocking chamber driver, f.e. especShSu
+        @param depth    max. entries of request and response queue
+        """
+        if ( None == driver ):
+            raise ValueError("Missing chamber driver")
+        if ( 2 > depth ):
+            raise ValueError("Queue depth of at least two required")
+        self.driver = driver
+        self.requests = queue.Queue(maxsize=depth)      # (proc, args, done), None ends thread
+        self.responses = queue.Queue(maxsize=depth)     # (clima, timestamp) of measurements
+        self.thread = None
+        self.lock = threading.Lock()                    # shared with I/O thread
+        self.pending = {'get': False, 'set': False}     # posted, not yet taken by thread
+        self.setpoint = None                            # latest posted setpoint
+        self.latest = None                              # latest measurement
+        self.tmeas = None                               # timestamp of latest measurement
+        self.error = None                               # failure of posted request
+        self.latency = {'last': 0.0, 'max': 0.0, 'mean': 0.0, 'num': 0}
+        self.dropped = 0                                # measurements not collected
+    #*****************************
+
+
+    #*****************************
+    def open(self, port="", **args):
+        """
+        @note           opens chamber interface and starts I/O thread
+
+        @param port     system port
+        @param args     further driver arguments, f.e. simFile
+        @rtype          boolean
+        @return         successful
+        """
+        self.driver.open(port=port, **args)
+        self.thread = threading.Thread(target=self.loop, name="chamberWorker", daemon=True)
+        self.thread.start()
+        return True
+    #*****************************
+
+
+    #*****************************
+    def close(self):
+        """
+        @note           finishes posted requests, ends I/O thread and closes interface
+
+        @rtype          boolean
+        @return         successful
+        """
+        if ( None != self.thread ):
+            self.requests.put(None)     # after posted requests
+            self.thread.join()
+            self.thread = None
+        return self.driver.close()
+    #*****************************
+
+
+    #*****************************
+    def info(self):
+        """
+        @note           chamber info, static data without I/O
+
+        @rtype          dict
+        @return         see driver
+        """
+        return self.driver.info()
+    #*****************************
+
+
+    #*****************************
+    def loop(self):
+        """
+        @note           I/O thread, executes requests in order
+        """
+        while True:
+            req = self.requests.get()
+            if ( None == req ):
+                self.requests.task_done()
+                return
+            (proc, args, done) = req
+            # posted requests, latest value at execution
+            with self.lock:
+                if ( ("get_clima" == proc) and (None == done) ):
+                    self.pending['get'] = False
+                elif ( ("set_clima" == proc) and (None == done) ):
+                    self.pending['set'] = False
+                    args = {'clima': self.setpoint}
+            # chamber request
+            (rsp, err) = (None, None)
+            tstart = time.monotonic()
+            try:
+                rsp = getattr(self.driver, proc)(**args)
+            except Exception as exc:
+                err = exc
+            tend = time.monotonic()
+            with self.lock:
+                lat = self.latency
+                lat['num'] += 1
+                lat['last'] = tend - tstart
+                lat['max'] = max(lat['max'], lat['last'])
+                lat['mean'] += (lat['last'] - lat['mean']) / lat['num']
+                if ( (None != err) and (None == done) and (None == self.error) ):
+                    self.error = err    # raised with next call
+            # release
+            if ( None != done ):
+                done['rsp'] = rsp
+                done['err'] = err
+                done['event'].set()
+            elif ( (None == err) and ("get_clima" == proc) ):
+                self.respond((rsp, tend))
+            self.requests.task_done()
+    #*****************************
+
+
+    #*****************************
+    def respond(self, item=None):
+        """
+        @note           queues measurement, oldest is dropped on full queue
+
+        @param item     (clima, timestamp)
+        """
+        while True:
+            try:
+                self.responses.put_nowait(item)
+                return
+            except queue.Full:
+                try:
+                    self.responses.get_nowait()
+                    with self.lock:
+                        self.dropped += 1
+                except queue.Empty:
+                    pass
+    #*****************************
+
+
+    #*****************************
+    def post(self, proc=None, args=None, done=None):
+        """
+        @note           queues request without waiting
+
+        @param proc     driver procedure
+        @param args     procedure arguments
+        @param done     completion of waiting caller, None for posted requests
+        """
+        if ( None == self.thread ):
+            raise ValueError("Interface not opened, call methode 'open'")
+        try:
+            self.requests.put_nowait((proc, args if ( None != args ) else {}, done))
+        except queue.Full:
+            raise ValueError("Chamber request queue full")
+    #*****************************
+
+
+    #*****************************
+    def call(self, proc=None, **args):
+        """
+        @note           queues request and waits for chamber response
+
+        @param proc     driver procedure
+        @param args     procedure arguments
+        @return         driver response
+        """
+        done = {'event': threading.Event(), 'rsp': None, 'err': None}
+        self.post(proc=proc, args=args, done=done)
+        done['event'].wait()
+        if ( None != done['err'] ):
+            raise done['err']
+        return done['rsp']
+    #*****************************
+
+
+    #*****************************
+    def collect(self):
+        """
+        @note           takes measurements of I/O thread, raises failure of
+                        posted request
+        """
+        with self.lock:
+            (err, self.error) = (self.error, None)
+        if ( None != err ):
+            raise ValueError("Chamber request failed: " + str(err))
+        while True:
+            try:
+                (self.latest, self.tmeas) = self.responses.get_nowait()
+            except queue.Empty:
+                return
+    #*****************************
+
+
+    #*****************************
+    def flush(self):
+        """
+        @note           waits until all requests are executed
+        """
+        self.requests.join()
+        self.collect()
+    #*****************************
+
+
+    #*****************************
+    def start(self, temperature=None):
+        """
+        @note           starts chamber, waits for completion
+
+        @rtype          boolean
+        @return         successful
+        """
+        self.collect()
+        return self.call("start", temperature=temperature)
+    #*****************************
+
+
+    #*****************************
+    def stop(self):
+        """
+        @note           stops chamber after posted setpoints, waits for completion
+
+        @rtype          boolean
+        @return         successful
+        """
+        self.collect()
+        return self.call("stop")
+    #*****************************
+
+
+    #*****************************
+    def get_clima(self):
+        """
+        @note           latest measurement and requests the next one,
+                        only the first measurement waits for the chamber
+
+        @rtype          dict
+        @return         humidity/temperature vals
+        """
+        self.collect()
+        if ( None == self.latest ):
+            self.latest = self.call("get_clima")
+            self.tmeas = time.monotonic()
+            return dict(self.latest)
+        with self.lock:
+            if ( False == self.pending['get'] ):
+                self.post(proc="get_clima")     # non-blocking
+                self.pending['get'] = True
+        return dict(self.latest)
+    #*****************************
+
+
+    #*****************************
+    def set_clima(self, clima=None):
+        """
+        @note           posts new setpoint, replaces setpoint not yet written
+
+        @param clima    new clima value, {'temperature': myVal}
+        @rtype          boolean
+        @return         successful
+        """
+        if ( None == clima ):
+            raise ValueError("No new data provided")
+        self.collect()
+        with self.lock:
+            self.setpoint = dict(clima)
+            if ( False == self.pending['set'] ):
+                self.post(proc="set_clima")     # non-blocking
+                self.pending['set'] = True
+        return True
+    #*****************************
+
+
+    #*****************************
+    def stats(self):
+        """
+        @note           queue depth and I/O latency for monitoring
+
+        @rtype          dict
+        @return         depth of queues, latency in sec, age of latest measurement in sec
+        """
+        with self.lock:
+            stats = {'latency': dict(self.latency), 'dropped': self.dropped}
+        stats['depth'] = {'requests': self.requests.qsize(), 'responses': self.responses.qsize(), 'max': self.requests.maxsize}
+        stats['age'] = (time.monotonic() - self.tmeas) if ( None != self.tmeas ) else float('nan')
+        return stats
+    #*****************************
+
+#------------------------------------------------------------------------------
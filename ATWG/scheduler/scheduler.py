@@ -0,0 +1,202 @@
+# -*- coding: utf-8 -*-
+"""
+@author:        Andreas Kaeberlein
+@copyright:     Copyright 2026
+@credits:       AKAE
+
+@license:       GPLv3
+@maintainer:    Andreas Kaeberlein
+@email:         andreas.kaeberlein@web.de
+
+@file:          scheduler.py
+@date:          2026-10-17
+
+@note           periodic deadline scheduler, sleeps to absolute deadlines on a
+                monotonic clock. Deadlines are multiples of the period since
+                start, so tick runtime does not accumulate as drift
+"""
+
+
+
+#------------------------------------------------------------------------------
+import math     # ceil
+import time     # monotonic clock
+import asyncio  # event loop sleep
+#------------------------------------------------------------------------------
+
+
+
+#------------------------------------------------------------------------------
+class scheduler:
+    """
+    @note:  overrun policies, previous tick ended after the deadline
+              * skip:     missed ticks are dropped, continues on the time grid
+              * catchup:  missed ticks run without sleep until the grid is reached
+              * stretch:  grid restarts at current time, all following ticks are delayed
+              * adapt:    effective period is raised to a multiple of the period
+                          which covers the tick cost, tick numbers jump by this
+                          stride, missed ticks are dropped like skip. The cost
+                          estimate decays, so the period is lowered again
+    """
+
+    POLICIES = ('skip', 'catchup', 'stretch', 'adapt')
+    DECAY = 0.1     # cost estimate decay per tick, adapt policy
+
+    #*****************************
+    def __init__(self, period=1, policy="skip", clock=time.monotonic, sleep=time.sleep):
+        """
+        @note           initializes scheduler
+
+        @param period   tick period in seconds
+        @param policy   overrun policy, see class note
+        @param clock    monotonic time source in seconds
+        @param sleep    sleep function in seconds
+        """
+        # check
+        if ( 0 >= period ):
+            raise ValueError("Positive period required")
+        if ( policy not in scheduler.POLICIES ):
+            raise ValueError("Unsupported overrun policy '" + str(policy) + "'")
+        # assign
+        self.period = period
+        self.policy = policy
+        self.clock = clock
+        self.sleep = sleep
+        self.origin = None      # time of tick zero
+        self.tick = -1          # last released tick
+        self.released = None    # release time of last tick
+        self.stride = 1         # ticks per update, adapt policy
+        self.estimate = 0       # tick cost estimate in seconds, adapt policy
+        self.stats = {}
+        self.reset()
+    #*****************************
+
+
+    #*****************************
+    def reset(self):
+        """
+        @note           restarts time grid with next wait()
+        """
+        self.origin = None
+        self.tick = -1
+        self.released = None
+        self.stride = 1
+        self.estimate = 0
+        self.stats = {'ticks': 0, 'overruns': 0, 'skipped': 0, 'period': self.period, 'jitter': {'last': 0.0, 'max': 0.0, 'mean': 0.0}, 'cost': {'last': 0.0, 'max': 0.0, 'mean': 0.0}}
+    #*****************************
+
+
+    #*****************************
+    def deadline(self, tick=0):
+        """
+        @note           absolute deadline of tick
+
+        @param tick     tick number
+        @rtype          float
+        @return         clock time
+        """
+        return self.origin + tick*self.period
+    #*****************************
+
+
+    #*****************************
+    def due(self):
+        """
+        @note           next tick and its deadline, applies overrun policy,
+                        first call starts time grid
+
+        @rtype          tuple
+        @return         (tick, deadline)
+        """
+        now = self.clock()
+        # first tick
+        if ( None == self.origin ):
+            self.origin = now
+        # cost of previous tick, release until now
+        if ( None != self.released ):
+            cost = self.stats['cost']
+            cost['last'] = now - self.released
+            cost['max'] = max(cost['max'], cost['last'])
+            cost['mean'] += (cost['last'] - cost['mean']) / self.stats['ticks']
+        tick = self.tick + self.stride
+        # overrun, previous tick ended after this deadline
+        late = now - self.deadline(tick)
+        if ( 0 < late ):
+            self.stats['overruns'] += 1
+        # effective period covers tick cost
+        if ( ("adapt" == self.policy) and (None != self.released) ):
+            last = self.stats['cost']['last']
+            self.estimate = last if ( last > self.estimate ) else (self.estimate + scheduler.DECAY*(last-self.estimate))
+            self.stride = max(math.ceil(self.estimate/self.period), 1)
+            self.stats['period'] = self.stride * self.period
+            tick = self.tick + self.stride
+            late = now - self.deadline(tick)
+        if ( 0 < late ):
+            if ( self.policy in ("skip", "adapt") ):
+                missed = math.floor(late/self.period) + 1   # first deadline after now
+                self.stats['skipped'] += missed
+                tick += missed
+            elif ( "stretch" == self.policy ):
+                self.origin = now - tick*self.period        # tick is due now
+        return (tick, self.deadline(tick))
+    #*****************************
+
+
+    #*****************************
+    def release(self, tick=0, target=0, now=0):
+        """
+        @note           releases tick after sleep, updates statistic
+
+        @param tick     tick number
+        @param target   deadline of tick
+        @param now      wakeup time
+        @rtype          int
+        @return         tick number
+        """
+        jitter = now - target
+        stats = self.stats
+        stats['ticks'] += 1
+        stats['jitter']['last'] = jitter
+        stats['jitter']['max'] = max(stats['jitter']['max'], jitter)
+        stats['jitter']['mean'] += (jitter - stats['jitter']['mean']) / stats['ticks']
+        self.tick = tick
+        self.released = now
+        return tick
+    #*****************************
+
+
+    #*****************************
+    def wait(self):
+        """
+        @note           sleeps until deadline of next tick, first call starts time grid
+
+        @rtype          int
+        @return         tick number since start, jumps with skip policy
+        """
+        (tick, target) = self.due()
+        # sleep to deadline, repeat on early wakeup
+        now = self.clock()
+        while ( now < target ):
+            self.sleep(target - now)
+            now = self.clock()
+        return self.release(tick=tick, target=target, now=now)
+    #*****************************
+
+
+    #*****************************
+    async def wait_async(self):
+        """
+        @note           wait() on the event loop, other tasks run until deadline
+
+        @rtype          int
+        @return         tick number since start, jumps with skip policy
+        """
+        (tick, target) = self.due()
+        now = self.clock()
+        while ( now < target ):
+            await asyncio.sleep(target - now)
+            now = self.clock()
+        return self.release(tick=tick, target=target, now=now)
+    #*****************************
+
+#------------------------------------------------------------------------------
@@ -0,0 +1,301 @@
+# -*- coding: utf-8 -*-
+"""
+@author:        Andreas Kaeberlein
+@copyright:     Copyright 2026
+@credits:       AKAE
+
+@license:       GPLv3
+@maintainer:    Andreas Kaeberlein
+@email:         andreas.kaeberlein@web.de
+
+@file:          arbitrary.py
+@date:          2026-10-17
+
+@note           arbitrary waveform, linear interpolation between (time, temperature)
+                breakpoints loaded from file
+                  * .csv:        'time,temp' per line, ',', ';' or blank separated, non-numeric lines are skipped
+                  * .yml/.yaml:  {'time': [...], 'temp': [...]} or [[time, temp], ...], parsed as event stream
+                  * .bin/.dat:   little-endian float64 pairs time, temp
+                time in seconds, the profile is repeated after the last breakpoint.
+                recorded logs with irregular time stamps are resampled to ts, see resample.py
+"""
+
+
+
+#------------------------------------------------------------------------------
+import os                           # file extension
+import sys                          # byte order
+import math                         # isnan
+from array import array             # compact storage
+from .segments import segmentTable  # interpolation
+from .segments import gridTable     # resampled logs
+try:
+    import numpy                    # optional, vectorized blocks
+except ImportError:
+    numpy = None
+#------------------------------------------------------------------------------
+
+
+
+#------------------------------------------------------------------------------
+def load(file=None):
+    """
+    @note           loads breakpoints, format selected by file extension
+
+    @param file     path to breakpoint file
+    @rtype          tuple
+    @return         (time, temp) as array('d')
+    """
+    # check
+    if ( None == file ):
+        raise ValueError("No breakpoint file provided")
+    if ( False == os.path.isfile(file) ):
+        raise FileNotFoundError("Breakpoint file '" + file + "' not found")
+    # dispatch
+    ext = os.path.splitext(file)[1].lower()
+    if ( ".csv" == ext ):
+        return load_csv(file)
+    elif ( ext in (".yml", ".yaml") ):
+        return load_yaml(file)
+    elif ( ext in (".bin", ".dat") ):
+        return load_bin(file)
+    raise ValueError("Unsupported breakpoint file format '" + ext + "'")
+#------------------------------------------------------------------------------
+
+
+#------------------------------------------------------------------------------
+def load_csv(file):
+    """
+    @note           streams csv file line by line into arrays
+
+    @param file     path to csv file
+    @rtype          tuple
+    @return         (time, temp) as array('d')
+    """
+    time = array('d')
+    temp = array('d')
+    with open(file, 'r') as fH:
+        for line in fH:
+            col = line.replace(";", " ").replace(",", " ").split()
+            if ( 2 > len(col) ):
+                continue
+            try:
+                t = float(col[0])
+                v = float(col[1])
+            except ValueError:
+                continue    # header or comment
+            time.append(t)
+            temp.append(v)
+    return (time, temp)
+#------------------------------------------------------------------------------
+
+
+#------------------------------------------------------------------------------
+def load_yaml(file):
+    """
+    @note           streams yaml file event by event into arrays, the document
+                    is not built in memory
+
+    @param file     path to yaml file
+    @rtype          tuple
+    @return         (time, temp) as array('d')
+    """
+    import yaml     # import if required
+    Loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    cols = {'time': array('d'), 'temp': array('d')}
+    nest = []       # open collections, 'map' or 'seq'
+    key = None      # mapping key of current column
+    row = []        # values of current [time, temp] pair
+    with open(file, 'r') as fH:
+        for event in yaml.parse(fH, Loader=Loader):
+            if ( isinstance(event, yaml.MappingStartEvent) ):
+                nest.append("map")
+            elif ( isinstance(event, yaml.SequenceStartEvent) ):
+                nest.append("seq")
+            elif ( isinstance(event, yaml.ScalarEvent) ):
+                if ( ["map"] == nest ):     # {'time': [...], 'temp': [...]}
+                    key = event.value if ( None == key ) else None
+                    continue
+                if ( (["map", "seq"] == nest) and (key not in cols) ):
+                    continue                # other entries
+                try:
+                    num = float(event.value)
+                except ValueError:
+                    raise ValueError("Non-numeric breakpoint '" + event.value + "' in yaml file")
+                if ( ["map", "seq"] == nest ):
+                    cols[key].append(num)
+                elif ( ["seq", "seq"] == nest ):    # [[time, temp], ...]
+                    row.append(num)
+            elif ( isinstance(event, (yaml.MappingEndEvent, yaml.SequenceEndEvent)) ):
+                if ( ["map", "seq"] == nest ):
+                    key = None
+                elif ( ["seq", "seq"] == nest ):
+                    if ( 2 > len(row) ):
+                        raise ValueError("Breakpoint with less than two values in yaml file")
+                    cols['time'].append(row[0])
+                    cols['temp'].append(row[1])
+                    row = []
+                nest.pop()
+    if ( len(cols['time']) != len(cols['temp']) ):
+        raise ValueError("Different number of time and temp values in yaml file")
+    return (cols['time'], cols['temp'])
+#------------------------------------------------------------------------------
+
+
+#------------------------------------------------------------------------------
+def load_bin(file):
+    """
+    @note           loads raw binary file
+
+    @param file     path to binary file
+    @rtype          tuple
+    @return         (time, temp) as array('d')
+    """
+    raw = array('d')
+    size = os.path.getsize(file)
+    if ( 0 != size % 16 ):
+        raise ValueError("Binary breakpoint file size is not a multiple of 16 bytes")
+    with open(file, 'rb') as fH:
+        raw.fromfile(fH, size // 8)
+    if ( "big" == sys.byteorder ):
+        raw.byteswap()
+    return (raw[0::2], raw[1::2])
+#------------------------------------------------------------------------------
+
+
+#------------------------------------------------------------------------------
+def save_bin(file, time, temp):
+    """
+    @note           writes breakpoints as raw binary file
+
+    @param file     path to binary file
+    @param time     breakpoint times
+    @param temp     breakpoint temperatures
+    """
+    raw = array('d', bytes(16*len(time)))
+    raw[0::2] = array('d', time)
+    raw[1::2] = array('d', temp)
+    if ( "big" == sys.byteorder ):
+        raw.byteswap()
+    with open(file, 'wb') as fH:
+        raw.tofile(fH)
+#------------------------------------------------------------------------------
+
+
+#------------------------------------------------------------------------------
+def init(self, file=None, ts=1, lowVal=float("nan"), highVal=float("nan"), initVal=float("nan"), pSlope=True, points=None, resample=None):
+    """
+    @note           initializes arbitrary waveform
+
+    @param self     waves instance
+    @param file     breakpoint file
+    @param ts       Sample/Update time of waveform in seconds
+    @param lowVal   optional lower fence of breakpoint temperatures
+    @param highVal  optional upper fence of breakpoint temperatures
+    @param initVal  start with first crossing of this value
+    @param pSlope   start on rising/falling part of profile, only evaluated with initVal
+    @param points   breakpoints as tuple (time, temp), alternative to file
+    @param resample True or resampler settings {'method': , 'gap': , 'fill': , 'decimate': },
+                    file is streamed in chunks and resampled to ts, only the
+                    resampled values are stored
+    @rtype          tuple
+    @return         (iterator, wave descriptor)
+    """
+    # load
+    stats = None
+    time = None     # uniform resampled log
+    if ( (None != resample) and (False != resample) ):
+        from .resample import resample as resampleLog   # import if required
+        (t0, tsLog, temp, stats) = resampleLog(file=file, ts=ts, points=points, **({} if ( True == resample ) else resample))
+    elif ( None == points ):
+        (time, temp) = load(file)
+    else:
+        (time, temp) = (array('d', points[0]), array('d', points[1]))
+    if ( 2 > len(temp) ):
+        raise ValueError("At least two breakpoints required")
+    if ( None == time ):
+        at = lambda i: t0 + i*tsLog         # breakpoint time
+    else:
+        at = time.__getitem__               #
+    # apply fences
+    if ( (False == math.isnan(lowVal)) or (False == math.isnan(highVal)) ):
+        low = float('-inf') if ( math.isnan(lowVal) ) else lowVal
+        high = float('+inf') if ( math.isnan(highVal) ) else highVal
+        for i in range(len(temp)):
+            temp[i] = max(min(temp[i], high), low)
+    # time behaviour
+    x = {}
+    x['ts'] = ts                            # sample rate
+    x['t0'] = at(0)                         # profile start
+    x['tp'] = at(len(temp)-1) - at(0)       # period
+    x['n'] = max(self.samples(x['tp'], ts), 1)  # number of steps for full period
+    # start position
+    iterator = 0
+    if ( False == math.isnan(initVal) ):
+        for i in range(len(temp)-1):
+            dv = temp[i+1] - temp[i]
+            if ( ((True == pSlope) and (0 < dv) and (temp[i] <= initVal <= temp[i+1])) or
+                 ((False == pSlope) and (0 > dv) and (temp[i+1] <= initVal <= temp[i])) ):
+                tcross = at(i) + (initVal-temp[i]) / dv * (at(i+1)-at(i))      # linear crossing
+                iterator = round((tcross-x['t0']) / x['ts'])
+                if ( iterator > x['n']-1 ):
+                    iterator -= x['n']
+                break
+    # interpolation table, time in seconds
+    if ( None == time ):
+        seg = gridTable(x0=t0, dx=tsLog, val=temp)
+    else:
+        seg = segmentTable(ts=1)
+        seg.points(x=time, val=temp)
+    # build waveform
+    wave = {}
+    wave['x'] = x
+    wave['seg'] = seg
+    wave['resample'] = stats
+    return (iterator, wave)
+#------------------------------------------------------------------------------
+
+
+#------------------------------------------------------------------------------
+def step(self, iterator, wave):
+    """
+    @note           calculates interpolated value at iterator
+
+    @param self     waves instance
+    @param iterator waveform iterator
+    @param wave     wave descriptor, see init()
+    @rtype          tuple
+    @return         (next iterator, {'val': , 'grad': })
+    """
+    # calc waveform
+    new = {}
+    pos = iterator if ( 0 <= iterator ) else iterator + wave['x']['n']      # fractional iterator from random access
+    (new['val'], new['grad']) = wave['seg'].eval(wave['x']['t0'] + pos*wave['x']['ts'])
+    # inc wave iterator, prepare for next calc
+    iterator += 1
+    # jump to start
+    if ( iterator > wave['x']['n']-1 ):
+        iterator -= wave['x']['n']
+    # assign to release tupple
+    return (iterator, new)
+#------------------------------------------------------------------------------
+
+
+
+#------------------------------------------------------------------------------
+def block(self, iterator, wave, count):
+    """
+    @note           vectorized step(), block function of waves registry
+
+    @param self     waves instance
+    @param iterator waveform iterator of first sample
+    @param wave     wave descriptor, see init()
+    @param count    number of samples
+    @rtype          tuple
+    @return         (iterator after block, {'val': buffer, 'grad': buffer})
+    """
+    idx = self.indices(iterator, count)
+    idx = numpy.where(0 > idx, idx + wave['x']['n'], idx)    # fractional iterator from random access
+    (val, grad) = wave['seg'].block(wave['x']['t0'] + idx*wave['x']['ts'])
+    return (self.advance(iterator, count), {'val': val, 'grad': grad})
+#------------------------------------------------------------------------------
@@ -0,0 +1,143 @@
+# -*- coding: utf-8 -*-
+"""
+@author:        Andreas Kaeberlein
+@copyright:     Copyright 2026
+@credits:       AKAE
+
+@license:       GPLv3
+@maintainer:    Andreas Kaeberlein
+@email:         andreas.kaeberlein@web.de
+
+@file:          changes.py
+@date:          2026-10-17
+
+@note           change point compression, one waveform period is quantized to the
+                chamber resolution and only samples with a new setpoint are kept
+"""
+
+
+
+#------------------------------------------------------------------------------
+import bisect               # lookup
+import math                 # isfinite
+from array import array     # compact storage
+try:
+    import numpy            # optional, vectorized quantization
+except ImportError:
+    numpy = None
+#------------------------------------------------------------------------------
+
+
+
+#------------------------------------------------------------------------------
+class changeTable:
+    """
+    @note:  setpoint val[i] is valid in [time[i], time[i+1]), the last setpoint
+            until end of period
+    """
+
+    __slots__ = ('time', 'val', 'samples', 'ts', 'tp', 'fracs')
+
+    #*****************************
+    def __init__(self, ts=1, tp=0, fracs=1):
+        """
+        @note           initializes empty table
+
+        @param ts       sample time in seconds
+        @param tp       period in seconds
+        @param fracs    number of fractional digits of setpoint
+        """
+        self.time = array('d')  # time of change since waveform init
+        self.val = array('d')   # new setpoint
+        self.samples = 0        # number of compressed samples
+        self.ts = ts
+        self.tp = tp
+        self.fracs = fracs
+    #*****************************
+
+
+    #*****************************
+    def __len__(self):
+        """
+        @note           number of change points
+        """
+        return len(self.time)
+    #*****************************
+
+
+    #*****************************
+    def ratio(self):
+        """
+        @note           compression ratio
+
+        @rtype          float
+        @return         samples per change point
+        """
+        return self.samples / max(len(self.time), 1)
+    #*****************************
+
+
+    #*****************************
+    def lookup(self, t=0):
+        """
+        @note           setpoint at time, repeated after period
+
+        @param t        time in seconds since waveform init
+        @rtype          float
+        @return         setpoint
+        """
+        if ( 0 == len(self.time) ):
+            raise ValueError("Empty change table")
+        i = bisect.bisect_right(self.time, t % self.tp if ( 0 < self.tp ) else t) - 1
+        return self.val[max(i, 0)]
+    #*****************************
+
+#------------------------------------------------------------------------------
+
+
+
+#------------------------------------------------------------------------------
+def compress(wave=None, fracs=1, chunk=1<<16):
+    """
+    @note           quantizes one period to resolution 10**-fracs and keeps
+                    change points only
+
+    @param wave     initialized waves instance
+    @param fracs    number of fractional digits, f.e. chamber info()['fracs']['temperature']
+    @param chunk    samples per block
+    @rtype          changeTable
+    @return         change points
+    """
+    # check
+    x = wave.waveDescr['x']
+    if ( False == math.isfinite(x['n']) ):
+        raise ValueError("Compression requires finite waveform")
+    # prepare
+    n = int(x['n'])
+    scale = 10**fracs
+    tbl = changeTable(ts=x['ts'], tp=x['tp'], fracs=fracs)
+    tbl.samples = n
+    iterator = wave.iterInit
+    last = None     # quantized setpoint
+    done = 0
+    # blockwise
+    while ( done < n ):
+        count = min(chunk, n-done)
+        (iterator, new) = wave.render_block(start=iterator, count=count)
+        if ( None != numpy ):
+            code = numpy.rint(numpy.asarray(new['val'], dtype=float) * scale)
+            diff = numpy.diff(code, prepend=(code[0]+1) if ( None == last ) else last)
+            idx = numpy.flatnonzero(diff)
+            tbl.time.extend((done + idx) * x['ts'])
+            tbl.val.extend(code[idx] / scale)
+            last = code[-1]
+        else:
+            for i, v in enumerate(new['val']):
+                code = round(v * scale)
+                if ( code != last ):
+                    tbl.time.append((done+i) * x['ts'])
+                    tbl.val.append(code / scale)
+                    last = code
+        done += count
+    return tbl
+#------------------------------------------------------------------------------
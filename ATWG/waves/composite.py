@@ -0,0 +1,360 @@
+# -*- coding: utf-8 -*-
+"""
+@author:        Andreas Kaeberlein
+@copyright:     Copyright 2026
+@credits:       AKAE
+
+@license:       GPLv3
+@maintainer:    Andreas Kaeberlein
+@email:         andreas.kaeberlein@web.de
+
+@file:          composite.py
+@date:          2026-10-17
+
+@note           composite waveform, combines waves instances in a node tree
+                  * {'wave': 'sine', 'tp': '1d', ...}                 child waveform, args of waves.set()
+                  * {'const': 5}                                      constant value
+                  * {'op': 'sum'|'product'|'min'|'max', 'args': [...]}  combines child nodes
+                  * {'op': 'clamp', 'low': 10, 'high': 60, 'args': [node]}
+                the tree is evaluated blockwise, every node combines complete
+                sample blocks of its child nodes
+"""
+
+
+
+#------------------------------------------------------------------------------
+import math                 # lcm
+import fractions            # fractional child periods
+from array import array     # numpy free sample buffers
+from . import units         # time strings
+try:
+    import numpy            # optional, vectorized node operations
+except ImportError:
+    numpy = None
+#------------------------------------------------------------------------------
+
+
+
+#------------------------------------------------------------------------------
+MAXPERIOD = 10**7   # limit of common period in samples, f.e. 115 days with 1s
+#------------------------------------------------------------------------------
+
+
+
+#------------------------------------------------------------------------------
+class node:
+    """
+    @note:  node of composite tree
+    """
+
+    __slots__ = ('op', 'args', 'wave', 'const', 'low', 'high')
+
+    OPS = ('sum', 'product', 'min', 'max', 'clamp')
+
+    #*****************************
+    def __init__(self, descr=None, ts=1):
+        """
+        @note           builds node and child nodes from description
+
+        @param descr    node description, see module note
+        @param ts       sample time, default for child waveforms
+        """
+        from .waves import waves    # import if required, waves registers this module
+        # prepare
+        self.op = None
+        self.args = []
+        self.wave = None
+        self.const = 0
+        self.low = float('-inf')
+        self.high = float('+inf')
+        # dispatch
+        if ( isinstance(descr, (int, float)) ):
+            self.op = "const"
+            self.const = descr
+        elif ( False == isinstance(descr, dict) ):
+            raise ValueError("Unsupported composite node '" + str(descr) + "'")
+        elif ( 'const' in descr ):
+            self.op = "const"
+            self.const = descr['const']
+        elif ( 'wave' in descr ):
+            self.op = "wave"
+            waveArgs = dict(descr)
+            waveArgs.setdefault('ts', ts)
+            for key in ('ts', 'tp', 'tr', 'tf'):    # time strings, f.e. '1d'
+                if ( isinstance(waveArgs.get(key), str) ):
+                    waveArgs[key] = units.time_to_sec(waveArgs[key])
+            self.wave = waves()
+            self.wave.set(**waveArgs)
+            if ( self.wave.waveDescr['x']['ts'] != ts ):
+                raise ValueError("Composite child requires sample time " + str(ts) + "s")
+        elif ( descr.get('op') in node.OPS ):
+            self.op = descr['op']
+            self.args = [node(descr=arg, ts=ts) for arg in descr.get('args', [])]
+            if ( 0 == len(self.args) ):
+                raise ValueError("Composite node '" + self.op + "' without args")
+            if ( "clamp" == self.op ):
+                if ( 1 != len(self.args) ):
+                    raise ValueError("Composite node 'clamp' requires one arg")
+                self.low = descr.get('low', self.low)
+                self.high = descr.get('high', self.high)
+        else:
+            raise ValueError("Unsupported composite node '" + str(descr) + "'")
+    #*****************************
+
+
+    #*****************************
+    def period(self):
+        """
+        @note           common period of all child waveforms in samples, a
+                        fractional child period p/q repeats after p samples
+
+        @rtype          int, float
+        @return         number of samples, 1 for constant trees, inf for endless childs
+        """
+        if ( "const" == self.op ):
+            return 1
+        if ( "wave" == self.op ):
+            n = self.wave.waveDescr['x'].get('n', 1)
+            if ( False == math.isfinite(n) ):
+                return n
+            frac = fractions.Fraction(n).limit_denominator(1000)   # fractional period, see waves.samples()
+            if ( False == math.isclose(frac, n, rel_tol=1e-9) ):
+                raise ValueError("Composite child period of " + str(n) + " samples is not periodic on sample grid")
+            return frac.numerator
+        n = 1
+        for arg in self.args:
+            p = arg.period()
+            if ( False == math.isfinite(p) ):
+                return p
+            n = n * p // math.gcd(n, p)
+        return n
+    #*****************************
+
+
+    #*****************************
+    def at(self, idx=0):
+        """
+        @note           value of single sample
+
+        @param idx      sample index since waveform init
+        @rtype          tuple
+        @return         (value, gradient)
+        """
+        # leafs
+        if ( "const" == self.op ):
+            return (self.const, 0)
+        if ( "wave" == self.op ):
+            new = self.wave.at(idx=idx)
+            return (new['val'], new['grad'])
+        # combine
+        vals = [arg.at(idx=idx) for arg in self.args]
+        (val, grad) = vals[0]
+        if ( "clamp" == self.op ):
+            if ( val < self.low ):
+                return (self.low, 0)
+            if ( val > self.high ):
+                return (self.high, 0)
+            return (val, grad)
+        for (v, g) in vals[1:]:
+            if ( "sum" == self.op ):
+                (val, grad) = (val + v, grad + g)
+            elif ( "product" == self.op ):
+                (val, grad) = (val * v, val * g + grad * v)
+            elif ( "min" == self.op ):
+                (val, grad) = (val, grad) if ( val <= v ) else (v, g)
+            elif ( "max" == self.op ):
+                (val, grad) = (val, grad) if ( val >= v ) else (v, g)
+        return (val, grad)
+    #*****************************
+
+
+    #*****************************
+    def block(self, idx=0, count=1):
+        """
+        @note           values of sample block, each node combines the
+                        complete blocks of its childs
+
+        @param idx      sample index of first sample since waveform init
+        @param count    number of samples
+        @rtype          tuple
+        @return         (value buffer, gradient buffer)
+        """
+        # leafs
+        if ( "const" == self.op ):
+            if ( None != numpy ):
+                return (numpy.full(count, float(self.const)), numpy.zeros(count))
+            return (array('d', [self.const])*count, array('d', [0])*count)
+        if ( "wave" == self.op ):
+            new = self.wave.block(start=self.wave.position(idx=idx), count=count)
+            return (new['val'], new['grad'])
+        # combine
+        blocks = [arg.block(idx=idx, count=count) for arg in self.args]
+        (val, grad) = blocks[0]
+        if ( "clamp" == self.op ):
+            if ( None != numpy ):
+                low = val < self.low
+                high = val > self.high
+                return (numpy.clip(val, self.low, self.high), numpy.where(low | high, 0.0, grad))
+            return (array('d', [self.low if ( v < self.low ) else self.high if ( v > self.high ) else v for v in val]),
+                    array('d', [0 if ( (v < self.low) or (v > self.high) ) else g for v, g in zip(val, grad)]))
+        for (v, g) in blocks[1:]:
+            if ( None != numpy ):
+                if ( "sum" == self.op ):
+                    (val, grad) = (val + v, grad + g)
+                elif ( "product" == self.op ):
+                    (val, grad) = (val * v, val * g + grad * v)
+                elif ( "min" == self.op ):
+                    sel = val <= v
+                    (val, grad) = (numpy.where(sel, val, v), numpy.where(sel, grad, g))
+                elif ( "max" == self.op ):
+                    sel = val >= v
+                    (val, grad) = (numpy.where(sel, val, v), numpy.where(sel, grad, g))
+            else:
+                if ( "sum" == self.op ):
+                    (val, grad) = (array('d', [a + b for a, b in zip(val, v)]), array('d', [a + b for a, b in zip(grad, g)]))
+                elif ( "product" == self.op ):
+                    grad = array('d', [a * gb + ga * b for a, b, ga, gb in zip(val, v, grad, g)])
+                    val = array('d', [a * b for a, b in zip(val, v)])
+                elif ( self.op in ("min", "max") ):
+                    sel = [(a <= b) if ( "min" == self.op ) else (a >= b) for a, b in zip(val, v)]
+                    grad = array('d', [ga if s else gb for s, ga, gb in zip(sel, grad, g)])
+                    val = array('d', [a if s else b for s, a, b in zip(sel, val, v)])
+        return (val, grad)
+    #*****************************
+
+#------------------------------------------------------------------------------
+
+
+
+#------------------------------------------------------------------------------
+def load(file=None):
+    """
+    @note           loads node tree from yaml file
+
+    @param file     path to yaml file
+    @rtype          dict
+    @return         node description
+    """
+    import yaml     # import if required
+    with open(file, 'r') as fH:
+        return yaml.safe_load(fH)
+#------------------------------------------------------------------------------
+
+
+#------------------------------------------------------------------------------
+def init(self, nodes=None, file=None, ts=1, block=4096, lowVal=float("nan"), highVal=float("nan"), initVal=float("nan"), pSlope=True):
+    """
+    @note           initializes composite waveform
+
+    @param self     waves instance
+    @param nodes    node tree description, see module note
+    @param file     yaml file with node tree, alternative to nodes
+    @param ts       Sample/Update time of waveform in seconds
+    @param block    samples per block of next()
+    @param lowVal   optional lower fence, adds clamp node
+    @param highVal  optional upper fence, adds clamp node
+    @param initVal  start with first crossing of this value, requires finite period
+    @param pSlope   start on rising/falling part of profile, only evaluated with initVal
+    @rtype          tuple
+    @return         (iterator, wave descriptor)
+    """
+    # load tree
+    if ( None == nodes ):
+        if ( None == file ):
+            raise ValueError("Composite waveform requires nodes or file")
+        nodes = load(file)
+    if ( (False == math.isnan(lowVal)) or (False == math.isnan(highVal)) ):
+        nodes = {'op': "clamp", 'low': float('-inf') if math.isnan(lowVal) else lowVal, 'high': float('+inf') if math.isnan(highVal) else highVal, 'args': [nodes]}
+    root = node(descr=nodes, ts=ts)
+    # time behaviour
+    x = {}
+    x['ts'] = ts                # sample time
+    x['n'] = root.period()      # common period
+    x['tp'] = x['n'] * ts       #
+    if ( math.isfinite(x['n']) and (x['n'] > MAXPERIOD) ):
+        raise ValueError("Composite period of " + str(x['n']) + " samples exceeds limit of " + str(MAXPERIOD) + ", align child periods")
+    # start position
+    iterator = 0
+    if ( False == math.isnan(initVal) ):
+        if ( False == math.isfinite(x['n']) ):
+            raise ValueError("Composite start value requires finite period")
+        cross = None
+        idx = 0
+        while ( (None == cross) and (idx < x['n']) ):
+            (val, grad) = root.block(idx=idx, count=min(block, x['n']-idx)+1)     # one sample overlap
+            for i in range(len(val)-1):
+                (v0, v1) = (float(val[i]), float(val[i+1]))
+                if ( ((True == pSlope) and (v0 < v1) and (v0 <= initVal <= v1)) or
+                     ((False == pSlope) and (v0 > v1) and (v1 <= initVal <= v0)) ):
+                    cross = idx + i + round((initVal-v0) / (v1-v0))     # nearest sample of crossing
+                    break
+            idx += block
+        if ( None != cross ):
+            iterator = cross if ( cross <= x['n']-1 ) else cross - x['n']
+    # next() is served from blocks
+    wave = {}
+    wave['x'] = x
+    wave['root'] = root
+    wave['block'] = {'idx': 0, 'count': 0, 'size': block, 'val': None, 'grad': None}
+    return (iterator, wave)
+#------------------------------------------------------------------------------
+
+
+#------------------------------------------------------------------------------
+def step(self, iterator, wave):
+    """
+    @note           value at sample index, sequential indices are served from
+                    a block rendered in advance
+
+    @param self     waves instance
+    @param iterator sample index since waveform init
+    @param wave     wave descriptor, see init()
+    @rtype          tuple
+    @return         (next iterator, {'val': , 'grad': })
+    """
+    blk = wave['block']
+    i = iterator - blk['idx']
+    if ( (i != int(i)) ):                               # between samples
+        (val, grad) = wave['root'].at(idx=iterator)
+        return (iterator+1, {'val': val, 'grad': grad})
+    if ( False == (0 <= i < blk['count']) ):            # render next block
+        (blk['val'], blk['grad']) = wave['root'].block(idx=iterator, count=blk['size'])
+        blk['idx'] = iterator
+        blk['count'] = blk['size']
+        i = 0
+    i = int(i)
+    return (iterator+1, {'val': float(blk['val'][i]), 'grad': float(blk['grad'][i])})
+#------------------------------------------------------------------------------
+
+
+#------------------------------------------------------------------------------
+def render(self, iterator, wave, count):
+    """
+    @note           block function of waves registry
+
+    @param self     waves instance
+    @param iterator sample index of first sample
+    @param wave     wave descriptor, see init()
+    @param count    number of samples
+    @rtype          tuple
+    @return         (iterator after block, {'val': buffer, 'grad': buffer})
+    """
+    (val, grad) = wave['root'].block(idx=iterator, count=count)
+    return (iterator+count, {'val': val, 'grad': grad})
+#------------------------------------------------------------------------------
+
+
+#------------------------------------------------------------------------------
+def advance(self, iterator, steps, wave):
+    """
+    @note           iterator is the sample index, no wrap
+
+    @param self     waves instance
+    @param iterator sample index
+    @param steps    number of steps
+    @param wave     wave descriptor
+    @rtype          int
+    @return         sample index
+    """
+    return iterator + steps
+#------------------------------------------------------------------------------
@@ -0,0 +1,240 @@
+# -*- coding: utf-8 -*-
+"""
+@author:        Andreas Kaeberlein
+@copyright:     Copyright 2026
+@credits:       AKAE
+
+@license:       GPLv3
+@maintainer:    Andreas Kaeberlein
+@email:         andreas.kaeberlein@web.de
+
+@file:          expr.py
+@date:          2026-10-17
+
+@note           waveform from expression of time 't' in seconds
+                  * f.e. '25 + 10*sin(2*pi*t/1h) + 3*sin(2*pi*t/15m)'
+                  * time literals: 1d, 1h, 15m, 15min, 30s, 100ms
+                  * operators: + - * / // % **, powers are calculated in float and
+                    raise on overflow, f.e. '9**9**9**9'
+                  * constants: pi, e, tau
+                  * functions: sin, cos, tan, tanh, exp, log, sqrt, abs, floor, min, max
+                the expression is validated against a whitelist and compiled once
+                into a scalar function and, if numpy is available, a vectorized one
+                for blocks. numpy blocks can differ from next() in the last bit
+"""
+
+
+
+#------------------------------------------------------------------------------
+import ast                  # expression parser
+import re                   # time literals
+import math                 # scalar functions
+import functools            # compile cache
+from array import array     # numpy free sample buffers
+from . import units         # time literals
+try:
+    import numpy            # optional, vectorized evaluation
+except ImportError:
+    numpy = None
+#------------------------------------------------------------------------------
+
+
+
+#------------------------------------------------------------------------------
+# whitelist
+NODES = (ast.Expression, ast.BinOp, ast.UnaryOp, ast.Call, ast.Name, ast.Load, ast.Constant,
+         ast.Add, ast.Sub, ast.Mult, ast.Div, ast.FloorDiv, ast.Mod, ast.Pow, ast.USub, ast.UAdd)
+SCALAR = {'sin': math.sin, 'cos': math.cos, 'tan': math.tan, 'tanh': math.tanh, 'exp': math.exp, 'log': math.log,
+          'sqrt': math.sqrt, 'abs': abs, 'floor': math.floor, 'min': min, 'max': max,
+          'pi': math.pi, 'e': math.e, 'tau': math.tau}
+VECTOR = None if ( None == numpy ) else \
+         {'sin': numpy.sin, 'cos': numpy.cos, 'tan': numpy.tan, 'tanh': numpy.tanh, 'exp': numpy.exp, 'log': numpy.log,
+          'sqrt': numpy.sqrt, 'abs': numpy.abs, 'floor': numpy.floor,
+          'min': lambda *args: functools.reduce(numpy.minimum, args), 'max': lambda *args: functools.reduce(numpy.maximum, args),
+          'pi': math.pi, 'e': math.e, 'tau': math.tau}
+POW = {'scalar': math.pow, 'vector': None if ( None == numpy ) else numpy.float_power}   # '**', no unbounded integer powers
+UNITS = units.TIME_TO_SEC
+LITERAL = re.compile(r"(?<![\w.])(\d+\.?\d*|\.\d+)(" + "|".join(sorted(UNITS, key=len, reverse=True)) + r")\b")
+#------------------------------------------------------------------------------
+
+
+
+#------------------------------------------------------------------------------
+class powerCall(ast.NodeTransformer):
+    """
+    @note:  replaces 'a ** b' with '__pow(a, b)', integer powers like
+            '9**9**9**9' would not terminate
+    """
+    def visit_BinOp(self, node):
+        self.generic_visit(node)
+        if ( isinstance(node.op, ast.Pow) ):
+            return ast.copy_location(ast.Call(func=ast.Name(id="__pow", ctx=ast.Load()), args=[node.left, node.right], keywords=[]), node)
+        return node
+#------------------------------------------------------------------------------
+
+
+#------------------------------------------------------------------------------
+@functools.lru_cache(maxsize=64)
+def compile_expr(source=None):
+    """
+    @note           parses, validates and compiles expression, cached by source text
+
+    @param source   expression string
+    @rtype          tuple
+    @return         (scalar function, vector function or None), f(t)
+    """
+    # check
+    if ( (None == source) or (0 == len(source.strip())) ):
+        raise ValueError("No expression provided")
+    # time literals to seconds
+    text = LITERAL.sub(lambda m: "(" + m.group(1) + "*" + str(UNITS[m.group(2)]) + ")", source)
+    # parse and validate
+    try:
+        tree = ast.parse(text.strip(), mode='eval')
+    except SyntaxError:
+        raise ValueError("Invalid expression '" + source + "'")
+    for node in ast.walk(tree):
+        if ( False == isinstance(node, NODES) ):
+            raise ValueError("Unsupported element '" + type(node).__name__ + "' in expression")
+        if ( isinstance(node, ast.Name) and (node.id not in SCALAR) and ("t" != node.id) ):
+            raise ValueError("Unsupported name '" + node.id + "' in expression")
+        if ( isinstance(node, ast.Call) and ((False == isinstance(node.func, ast.Name)) or (False == callable(SCALAR.get(node.func.id))) or (0 != len(node.keywords))) ):
+            raise ValueError("Unsupported call in expression")
+        if ( isinstance(node, ast.Constant) and (False == isinstance(node.value, (int, float))) ):
+            raise ValueError("Unsupported constant '" + str(node.value) + "' in expression")
+    # powers as float function call, name not reachable from expression
+    tree = powerCall().visit(tree)
+    # compile into 'lambda t: <expression>'
+    func = ast.Expression(body=ast.Lambda(args=ast.arguments(posonlyargs=[], args=[ast.arg(arg="t")], kwonlyargs=[], kw_defaults=[], defaults=[]), body=tree.body))
+    code = compile(ast.fix_missing_locations(func), "<expr>", "eval")
+    scalar = eval(code, {'__builtins__': {}, **SCALAR, '__pow': POW['scalar']})
+    vector = None if ( None == VECTOR ) else eval(code, {'__builtins__': {}, **VECTOR, '__pow': POW['vector']})
+    return (scalar, vector)
+#------------------------------------------------------------------------------
+
+
+#------------------------------------------------------------------------------
+def init(self, expr=None, ts=1, tp=None, dt=1e-3, lowVal=float("nan"), highVal=float("nan"), initVal=float("nan"), pSlope=True):
+    """
+    @note           initializes expression waveform
+
+    @param self     waves instance
+    @param expr     expression string, see module note
+    @param ts       Sample/Update time of waveform in seconds
+    @param tp       optional period, t restarts with zero after period
+    @param dt       time step of central difference gradient in seconds
+    @param lowVal   optional lower fence
+    @param highVal  optional upper fence
+    @param initVal  unused, expression starts with t=0
+    @param pSlope   unused
+    @rtype          tuple
+    @return         (iterator, wave descriptor)
+    """
+    (scalar, vector) = compile_expr(expr)
+    # time behaviour
+    x = {}
+    x['ts'] = ts
+    if ( None != tp ):
+        x['tp'] = tp                        # periodic
+        x['n'] = max(self.samples(tp, ts), 1)   #
+    else:
+        x['tp'] = float('inf')              # endless
+        x['n'] = float('inf')               #
+    # fences
+    y = {}
+    y['low'] = float('-inf') if ( math.isnan(lowVal) ) else lowVal
+    y['high'] = float('+inf') if ( math.isnan(highVal) ) else highVal
+    y['dt'] = dt
+    # check once
+    try:
+        scalar(0.0)
+    except (ArithmeticError, ValueError, TypeError) as e:
+        raise ValueError("Expression not evaluable at t=0: " + str(e))
+    # build waveform
+    wave = {}
+    wave['x'] = x
+    wave['y'] = y
+    wave['scalar'] = scalar
+    wave['vector'] = vector
+    return (0, wave)
+#------------------------------------------------------------------------------
+
+
+#------------------------------------------------------------------------------
+def step(self, iterator, wave):
+    """
+    @note           evaluates expression at iterator
+
+    @param self     waves instance
+    @param iterator sample index since waveform init, modulo period
+    @param wave     wave descriptor, see init()
+    @rtype          tuple
+    @return         (next iterator, {'val': , 'grad': })
+    """
+    f = wave['scalar']
+    y = wave['y']
+    t = iterator * wave['x']['ts']
+    val = f(t)
+    grad = (f(t+y['dt']) - f(t-y['dt'])) / (2*y['dt'])
+    if ( val < y['low'] ):
+        (val, grad) = (y['low'], 0)
+    elif ( val > y['high'] ):
+        (val, grad) = (y['high'], 0)
+    iterator += 1
+    if ( iterator > wave['x']['n']-1 ):
+        iterator -= wave['x']['n']
+    return (iterator, {'val': val, 'grad': grad})
+#------------------------------------------------------------------------------
+
+
+#------------------------------------------------------------------------------
+def render(self, iterator, wave, count):
+    """
+    @note           block function of waves registry, vectorized with numpy
+
+    @param self     waves instance
+    @param iterator sample index of first sample, modulo period
+    @param wave     wave descriptor, see init()
+    @param count    number of samples
+    @rtype          tuple
+    @return         (iterator after block, {'val': buffer, 'grad': buffer})
+    """
+    x = wave['x']
+    y = wave['y']
+    # vectorized
+    if ( None != wave['vector'] ):
+        f = wave['vector']
+        t = self.indices(iterator, count) * x['ts']     # wrapped as next()
+        val = numpy.broadcast_to(numpy.asarray(f(t), dtype=float), t.shape)  # constant expressions are scalar
+        grad = numpy.broadcast_to((numpy.asarray(f(t+y['dt']), dtype=float) - f(t-y['dt'])) / (2*y['dt']), t.shape)
+        clip = (val < y['low']) | (val > y['high'])
+        return (self.advance(iterator, count), {'val': numpy.clip(val, y['low'], y['high']), 'grad': numpy.where(clip, 0.0, grad)})
+    # closure per sample
+    val = array('d')
+    grad = array('d')
+    for i in range(count):
+        (iterator, new) = step(self, iterator, wave)
+        val.append(new['val'])
+        grad.append(new['grad'])
+    return (iterator, {'val': val, 'grad': grad})
+#------------------------------------------------------------------------------
+
+
+#------------------------------------------------------------------------------
+def advance(self, iterator, steps, wave):
+    """
+    @note           sample index, wrapped with period if given
+
+    @param self     waves instance
+    @param iterator sample index
+    @param steps    number of steps
+    @param wave     wave descriptor
+    @rtype          int
+    @return         sample index
+    """
+    n = wave['x']['n']
+    iterator = iterator + steps
+    if ( math.isfinite(n) and (iterator > n-1) ):
+        iterator -= n * math.ceil((iterator-(n-1))/n)
+    return iterator
+#------------------------------------------------------------------------------
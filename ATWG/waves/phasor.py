@@ -0,0 +1,116 @@
+# -*- coding: utf-8 -*-
+"""
+@author:        Andreas Kaeberlein
+@copyright:     Copyright 2026
+@credits:       AKAE
+
+@license:       GPLv3
+@maintainer:    Andreas Kaeberlein
+@email:         andreas.kaeberlein@web.de
+
+@file:          phasor.py
+@date:          2026-10-17
+
+@note           incremental sine oscillator, rotates a phasor by a constant
+                angle instead of calling sin/cos for every sample
+"""
+
+
+
+#------------------------------------------------------------------------------
+import math     # sine
+#------------------------------------------------------------------------------
+
+
+
+#------------------------------------------------------------------------------
+class phasor:
+    """
+    @note:  steps a sine descriptor of waves.sine(), the oscillator is synchronized
+            to the closed form at every period start, after a jump of the iterator
+            and the magnitude is renormalized every 'renorm' steps
+    """
+
+    __slots__ = ('n', 'ofs', 'amp', 'kGrad', 'rotCos', 'rotSin', 'cos', 'sin', 'iterator', 'renorm', 'cnt')
+
+    #*****************************
+    def __init__(self, wave=None, renorm=256):
+        """
+        @note           initializes oscillator from sine descriptor
+
+        @param wave     sine wave descriptor, see waves.sine()
+        @param renorm   number of steps between magnitude correction
+        """
+        # check
+        if ( None == wave ):
+            raise ValueError("No sine descriptor provided")
+        # precompute constants
+        self.n = wave['x']['n']                                 # steps per period
+        self.ofs = wave['y']['ofs']                             # sine offset
+        self.amp = wave['y']['amp']                             # sine amplitude
+        self.kGrad = self.amp*(2*math.pi*(float(1)/self.n))/wave['x']['ts']    # gradient amplitude per sec
+        self.rotCos = math.cos(2*math.pi*(float(1)/self.n))     # rotation per step
+        self.rotSin = math.sin(2*math.pi*(float(1)/self.n))     #
+        self.renorm = renorm
+        # oscillator state, synchronized with first step
+        self.cos = 1.0
+        self.sin = 0.0
+        self.iterator = None
+        self.cnt = 0
+    #*****************************
+
+
+    #*****************************
+    def sync(self, iterator=0):
+        """
+        @note           sets oscillator to closed form value at iterator
+
+        @param iterator sine iterator
+        """
+        phi = 2*math.pi*((iterator)*(float(1)/self.n))
+        self.cos = math.cos(phi)
+        self.sin = math.sin(phi)
+        self.iterator = iterator
+        self.cnt = 0
+    #*****************************
+
+
+    #*****************************
+    def step(self, iterator=0, wave=None):
+        """
+        @note           calculates value at iterator and rotates to next step
+
+        @param iterator sine iterator
+        @param wave     unused, interface of waves step functions
+        @rtype          tuple
+        @return         (next iterator, {'val': , 'grad': })
+        """
+        # jump in waveform, fall back to closed form
+        if ( iterator != self.iterator ):
+            self.sync(iterator)
+        # current value
+        new = {}
+        new['val'] = self.ofs + self.amp*self.sin
+        new['grad'] = self.kGrad*self.cos
+        # next iterator
+        iterator += 1
+        if ( iterator > self.n-1 ):
+            iterator -= self.n
+            self.sync(iterator) # period start, exact
+            return (iterator, new)
+        # rotate phasor
+        c = self.cos*self.rotCos - self.sin*self.rotSin
+        s = self.sin*self.rotCos + self.cos*self.rotSin
+        self.cnt += 1
+        if ( self.cnt >= self.renorm ):
+            r = 1.5 - 0.5*(c*c + s*s)   # first order 1/sqrt(c*c+s*s), magnitude is close to one
+            c *= r
+            s *= r
+            self.cnt = 0
+        self.cos = c
+        self.sin = s
+        self.iterator = iterator
+        return (iterator, new)
+    #*****************************
+
+#------------------------------------------------------------------------------
@@ -0,0 +1,185 @@
+# -*- coding: utf-8 -*-
+"""
+@author:        Andreas Kaeberlein
+@copyright:     Copyright 2026
+@credits:       AKAE
+
+@license:       GPLv3
+@maintainer:    Andreas Kaeberlein
+@email:         andreas.kaeberlein@web.de
+
+@file:          preview.py
+@date:          2026-10-17
+
+@note           downsampled preview of one waveform period
+                  - min/max per bucket, keeps peaks and edges
+                  - streamed over render_block(), memory bounded by chunk
+                  - .csv or .svg output without plotting library
+"""
+
+
+
+#------------------------------------------------------------------------------
+import os                   # file extension
+import math                 # isfinite
+from array import array     # compact storage
+try:
+    import numpy            # optional, vectorized buckets
+except ImportError:
+    numpy = None
+#------------------------------------------------------------------------------
+
+
+
+#------------------------------------------------------------------------------
+FORMATS = ('.csv', '.svg')  # supported preview files
+SVG = {'width': 1000, 'height': 400, 'margin': 60, 'ticks': 5}  # svg geometry in px
+UNITS = ((86400, "d"), (3600, "h"), (60, "min"), (1, "s"))      # time axis
+#------------------------------------------------------------------------------
+
+
+
+#------------------------------------------------------------------------------
+def downsample(wave=None, points=2000, chunk=1<<16):
+    """
+    @note           reduces one period to min and max of equally sized buckets,
+                    both in time order. Periods with less samples are kept
+
+    @param wave     initialized waves instance
+    @param points   max. number of preview points, two per bucket
+    @param chunk    samples per block, rounded to full buckets
+    @rtype          tuple
+    @return         (time, val) as array('d'), time in seconds since waveform init
+    """
+    # check
+    x = wave.waveDescr['x']
+    if ( False == math.isfinite(x['n']) ):
+        raise ValueError("Preview requires finite waveform")
+    if ( 2 > points ):
+        raise ValueError("At least two preview points required")
+    # prepare
+    n = int(x['n'])
+    ts = x['ts']
+    bucket = max(math.ceil(n / (points // 2)), 1)   # samples per bucket
+    chunk = max(chunk // bucket, 1) * bucket        # full buckets per block
+    time = array('d')
+    val = array('d')
+    iterator = wave.iterInit
+    done = 0
+    # blockwise
+    while ( done < n ):
+        count = min(chunk, n-done)
+        (iterator, new) = wave.render_block(start=iterator, count=count)
+        if ( 1 == bucket ):
+            time.extend([(done+i) * ts for i in range(count)])
+            val.extend(new['val'])
+        elif ( None != numpy ):
+            blk = numpy.asarray(new['val'], dtype=float)
+            full = count // bucket
+            groups = [(blk[:full*bucket].reshape(full, bucket), 0)]
+            if ( count > full*bucket ):
+                groups.append((blk[full*bucket:].reshape(1, -1), full*bucket))  # last bucket of period
+            for grp, ofs in groups:
+                imin = numpy.argmin(grp, axis=1)
+                imax = numpy.argmax(grp, axis=1)
+                idx = numpy.stack((numpy.minimum(imin, imax), numpy.maximum(imin, imax)), axis=1)  # time order
+                idx = (idx + (numpy.arange(len(grp)) * bucket)[:, None]).ravel() + ofs
+                time.extend((done + idx) * ts)
+                val.extend(blk[idx])
+        else:
+            blk = new['val']
+            for start in range(0, count, bucket):
+                seg = blk[start:start+bucket]
+                imin = seg.index(min(seg))      # first extreme as argmin/argmax
+                imax = seg.index(max(seg))      #
+                for i in sorted((imin, imax)):
+                    time.append((done+start+i) * ts)
+                    val.append(seg[i])
+        done += count
+    return (time, val)
+#------------------------------------------------------------------------------
+
+
+
+#------------------------------------------------------------------------------
+def write_csv(file=None, time=None, val=None):
+    """
+    @note           writes preview as csv, same format as arbitrary waveform input
+
+    @param file     path to output
+    @param time     time in seconds
+    @param val      temperature
+    """
+    with open(file, 'w') as fH:
+        fH.write("# time [s], temperature [C]\n")
+        for t, v in zip(time, val):
+            fH.write(repr(float(t)) + "," + repr(float(v)) + "\n")
+#------------------------------------------------------------------------------
+
+
+
+#------------------------------------------------------------------------------
+def write_svg(file=None, time=None, val=None, title=""):
+    """
+    @note           writes preview as svg line chart with grid and axis labels
+
+    @param file     path to output
+    @param time     time in seconds
+    @param val      temperature
+    @param title    chart title
+    """
+    # scale
+    (width, height, margin, ticks) = (SVG['width'], SVG['height'], SVG['margin'], SVG['ticks'])
+    (t0, t1) = (time[0], max(time[-1], time[0]+1))
+    (v0, v1) = (min(val), max(val))
+    if ( v0 == v1 ):
+        (v0, v1) = (v0-1, v1+1)     # flat waveform
+    (scale, unit) = next(((sec, name) for sec, name in UNITS if (t1-t0) >= 2*sec), UNITS[-1])
+    px = lambda t: margin + (t-t0) / (t1-t0) * (width-2*margin)
+    py = lambda v: height - margin - (v-v0) / (v1-v0) * (height-2*margin)
+    # build
+    svg = []
+    svg.append('<svg xmlns="http://www.w3.org/2000/svg" width="{w}" height="{h}" viewBox="0 0 {w} {h}" font-family="sans-serif" font-size="12">'.format(w=width, h=height))
+    svg.append('<rect width="100%" height="100%" fill="white"/>')
+    svg.append('<text x="{x}" y="{y}" text-anchor="middle" font-size="14">{txt}</text>'.format(x=width/2, y=margin/2, txt=title))
+    for i in range(ticks+1):
+        v = v0 + (v1-v0) * i / ticks
+        t = t0 + (t1-t0) * i / ticks
+        svg.append('<line x1="{x1:.1f}" y1="{y:.1f}" x2="{x2:.1f}" y2="{y:.1f}" stroke="#ddd"/>'.format(x1=margin, x2=width-margin, y=py(v)))
+        svg.append('<text x="{x:.1f}" y="{y:.1f}" text-anchor="end">{txt:+.1f}</text>'.format(x=margin-5, y=py(v)+4, txt=v))
+        svg.append('<line x1="{x:.1f}" y1="{y1:.1f}" x2="{x:.1f}" y2="{y2:.1f}" stroke="#ddd"/>'.format(x=px(t), y1=margin, y2=height-margin))
+        svg.append('<text x="{x:.1f}" y="{y:.1f}" text-anchor="middle">{txt:.4g}</text>'.format(x=px(t), y=height-margin+16, txt=(t-t0)/scale))
+    svg.append('<text x="{x}" y="{y}" text-anchor="middle">time [{unit}]</text>'.format(x=width/2, y=height-margin/4, unit=unit))
+    svg.append('<text x="{x}" y="{y}" text-anchor="middle" transform="rotate(-90 {x} {y})">temperature [C]</text>'.format(x=margin/4, y=height/2))
+    svg.append('<rect x="{m}" y="{m}" width="{w}" height="{h}" fill="none" stroke="black"/>'.format(m=margin, w=width-2*margin, h=height-2*margin))
+    svg.append('<polyline fill="none" stroke="#c00" stroke-width="1" points="' + " ".join("{:.1f},{:.1f}".format(px(t), py(v)) for t, v in zip(time, val)) + '"/>')
+    svg.append('</svg>')
+    # write
+    with open(file, 'w') as fH:
+        fH.write("\n".join(svg) + "\n")
+#------------------------------------------------------------------------------
+
+
+
+#------------------------------------------------------------------------------
+def write(wave=None, file=None, points=2000, title=""):
+    """
+    @note           downsamples one period and writes preview, format from file extension
+
+    @param wave     initialized waves instance
+    @param file     path to .csv or .svg
+    @param points   max. number of preview points
+    @param title    svg chart title
+    @rtype          int
+    @return         number of written points
+    """
+    ext = os.path.splitext(file)[1].lower()
+    if ( ext not in FORMATS ):
+        raise ValueError("Unsupported preview format '" + ext + "', use " + ", ".join(FORMATS))
+    (time, val) = downsample(wave=wave, points=points)
+    if ( ".csv" == ext ):
+        write_csv(file=file, time=time, val=val)
+    else:
+        write_svg(file=file, time=time, val=val, title=title)
+    return len(time)
+#------------------------------------------------------------------------------
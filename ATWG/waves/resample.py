@@ -0,0 +1,365 @@
+# -*- coding: utf-8 -*-
+"""
+@author:        Andreas Kaeberlein
+@copyright:     Copyright 2026
+@credits:       AKAE
+
+@license:       GPLv3
+@maintainer:    Andreas Kaeberlein
+@email:         andreas.kaeberlein@web.de
+
+@file:          resample.py
+@date:          2026-10-17
+
+@note           streaming resampler for recorded temperature logs with irregular
+                time stamps, output is uniform with sample time ts
+                  * linear:     linear interpolation
+                  * cubic:      monotone piecewise cubic (Fritsch-Carlson), no overshoot
+                  * decimation: mean over one sample time, exact integral of the
+                                interpolated log, suppresses aliasing of fast logs
+                  * gaps:       segments longer than 'gap' are held or bridged linear
+                non-finite values and non-increasing time stamps are dropped. The log
+                is read in chunks, only a few points are carried between chunks
+"""
+
+
+
+#------------------------------------------------------------------------------
+import os                   # file extension
+import sys                  # byte order
+import math                 # isfinite
+import bisect               # segment lookup
+from array import array     # numpy free buffers
+try:
+    import numpy            # optional, vectorized resampling
+except ImportError:
+    numpy = None
+#------------------------------------------------------------------------------
+
+
+
+#------------------------------------------------------------------------------
+class resampler:
+    """
+    @note:  resamples pushed chunks of (time, value) to the grid t0 + k*ts, every
+            segment between two log points is a polynomial in the distance to its
+            start point: a + b*d + c*d**2 + e*d**3
+    """
+
+    __slots__ = ('ts', 'method', 'gap', 'fill', 'decimate', 'width', 't0', 'k', 'time', 'val', 'stats')
+
+    METHODS = ('linear', 'cubic')
+    FILLS = ('hold', 'linear')
+
+    #*****************************
+    def __init__(self, ts=1, method="linear", gap=float('inf'), fill="hold", decimate=None):
+        """
+        @note           initializes empty stream
+
+        @param ts       output sample time in seconds
+        @param method   interpolation, see METHODS
+        @param gap      log segments longer than gap seconds are gaps
+        @param fill     gap handling, 'hold' keeps last value, 'linear' bridges the gap
+        @param decimate mean over one sample time, None enables if the log is faster than ts
+        """
+        # check
+        if ( method not in resampler.METHODS ):
+            raise ValueError("Unsupported resample method '" + str(method) + "'")
+        if ( fill not in resampler.FILLS ):
+            raise ValueError("Unsupported gap fill '" + str(fill) + "'")
+        if ( 0 >= ts ):
+            raise ValueError("Positive sample time required")
+        # assign
+        self.ts = ts
+        self.method = method
+        self.gap = gap
+        self.fill = fill
+        self.decimate = decimate
+        self.width = None       # averaging window, decided with first chunk
+        self.t0 = None          # time of first output sample
+        self.k = 0              # next output sample
+        self.time = array('d')  # carried and pushed log points
+        self.val = array('d')   #
+        self.stats = {'input': 0, 'dropped': 0, 'gaps': 0, 'output': 0}
+        if ( None != numpy ):
+            self.time = numpy.empty(0)
+            self.val = numpy.empty(0)
+    #*****************************
+
+
+    #*****************************
+    def push(self, time=None, val=None):
+        """
+        @note           appends chunk of log points and resamples all output
+                        samples covered by the log
+
+        @param time     log time stamps in seconds
+        @param val      log values
+        @rtype          numpy array or array('d')
+        @return         new output samples
+        """
+        self.stats['input'] += len(time)
+        # clean and append
+        last = self.time[-1] if ( 0 < len(self.time) ) else float('-inf')
+        if ( None != numpy ):
+            time = numpy.asarray(time, dtype=float)
+            val = numpy.asarray(val, dtype=float)
+            count = len(time)
+            keep = numpy.isfinite(time) & numpy.isfinite(val)
+            (time, val) = (time[keep], val[keep])
+            keep = time > numpy.maximum.accumulate(numpy.concatenate(([last], time)))[:-1]   # strictly increasing
+            (time, val) = (time[keep], val[keep])
+            self.stats['dropped'] += count - len(time)
+            if ( 0 < len(time) ):
+                self.stats['gaps'] += int(numpy.count_nonzero(numpy.diff(time, prepend=max(last, time[0])) > self.gap))
+            self.time = numpy.concatenate((self.time, time))
+            self.val = numpy.concatenate((self.val, val))
+        else:
+            for t, v in zip(time, val):
+                if ( (False == math.isfinite(t)) or (False == math.isfinite(v)) or (t <= last) ):
+                    self.stats['dropped'] += 1
+                    continue
+                if ( (0 < len(self.time)) and (t - last > self.gap) ):
+                    self.stats['gaps'] += 1
+                self.time.append(t)
+                self.val.append(v)
+                last = t
+        # averaging window
+        if ( (None == self.width) and (2 < len(self.time)) ):
+            if ( None == self.decimate ):
+                span = self.time[-1] - self.time[0]
+                self.decimate = (span / (len(self.time)-1)) < (self.ts / 2)     # mean log interval
+            self.width = self.ts if ( self.decimate ) else 0
+        return self.emit(final=False)
+    #*****************************
+
+
+    #*****************************
+    def flush(self):
+        """
+        @note           resamples until last log point, ends stream
+
+        @rtype          numpy array or array('d')
+        @return         remaining output samples
+        """
+        if ( None == self.width ):
+            self.width = self.ts if ( True == self.decimate ) else 0
+        return self.emit(final=True)
+    #*****************************
+
+
+    #*****************************
+    def coefficients(self, time, val):
+        """
+        @note           polynomial coefficients of all segments
+
+        @param time     log time stamps
+        @param val      log values
+        @rtype          tuple
+        @return         (a, b, c, e) per segment
+        """
+        # numpy
+        if ( None != numpy ):
+            h = numpy.diff(time)
+            delta = numpy.diff(val) / h
+            zero = numpy.zeros(len(h))
+            (a, b, c, e) = (val[:-1], delta, zero, zero)
+            if ( "cubic" == self.method ):
+                m = numpy.empty(len(val))
+                (m[0], m[-1]) = (delta[0], delta[-1])   # one sided at ends
+                (h0, h1, d0, d1) = (h[:-1], h[1:], delta[:-1], delta[1:])
+                (w1, w2) = (2*h1 + h0, h1 + 2*h0)
+                with numpy.errstate(divide='ignore', invalid='ignore'):
+                    m[1:-1] = numpy.where(d0*d1 > 0, (w1+w2) / (w1/d0 + w2/d1), 0.0)
+                    c = (3*delta - 2*m[:-1] - m[1:]) / h
+                    e = (m[:-1] + m[1:] - 2*delta) / (h*h)
+                b = m[:-1]
+            gap = h > self.gap
+            if ( numpy.any(gap) ):
+                b = numpy.where(gap, 0.0 if ( "hold" == self.fill ) else delta, b)
+                c = numpy.where(gap, 0.0, c)
+                e = numpy.where(gap, 0.0, e)
+            return (a, b, c, e)
+        # python
+        h = [t1 - t0 for t0, t1 in zip(time, time[1:])]
+        delta = [(v1 - v0) / dt for v0, v1, dt in zip(val, val[1:], h)]
+        (a, b, c, e) = (list(val[:-1]), list(delta), [0.0]*len(h), [0.0]*len(h))
+        if ( "cubic" == self.method ):
+            m = [delta[0]] + [0.0]*(len(h)-1) + [delta[-1]]
+            for i in range(1, len(h)):
+                if ( 0 < delta[i-1]*delta[i] ):
+                    (w1, w2) = (2*h[i] + h[i-1], h[i] + 2*h[i-1])
+                    m[i] = (w1+w2) / (w1/delta[i-1] + w2/delta[i])
+            for i in range(len(h)):
+                b[i] = m[i]
+                c[i] = (3*delta[i] - 2*m[i] - m[i+1]) / h[i]
+                e[i] = (m[i] + m[i+1] - 2*delta[i]) / (h[i]*h[i])
+        for i in range(len(h)):
+            if ( h[i] > self.gap ):
+                (b[i], c[i], e[i]) = (0.0 if ( "hold" == self.fill ) else delta[i], 0.0, 0.0)
+        return (a, b, c, e)
+    #*****************************
+
+
+    #*****************************
+    def emit(self, final=False):
+        """
+        @note           output samples with complete log support, carries the
+                        log points required for the next samples
+
+        @param final    resample until last log point
+        @rtype          numpy array or array('d')
+        @return         output samples
+        """
+        time = self.time
+        val = self.val
+        out = numpy.empty(0) if ( None != numpy ) else array('d')
+        if ( 2 > len(time) ):
+            return out
+        if ( None == self.t0 ):
+            self.t0 = time[0]
+        # output samples, slopes of cubic segments up to the second last point are final
+        w = self.width / 2
+        limit = time[-1] if ( final ) else time[-2] - w
+        kend = math.floor((limit - self.t0) / self.ts + 1e-9) + 1
+        if ( kend <= self.k ):
+            return out
+        (a, b, c, e) = self.coefficients(time, val)
+        last = len(time) - 2    # last segment
+        # numpy
+        if ( None != numpy ):
+            t = self.t0 + numpy.arange(self.k, kend) * self.ts
+            if ( 0 == w ):
+                i = numpy.clip(numpy.searchsorted(time, t, side='right') - 1, 0, last)
+                d = t - time[i]
+                out = a[i] + d*(b[i] + d*(c[i] + d*e[i]))
+            else:
+                h = numpy.diff(time)
+                area = numpy.concatenate(([0.0], numpy.cumsum(h*(a + h*(b/2 + h*(c/3 + h*e/4))))))
+                lo = numpy.clip(t - w, time[0], time[-1])
+                hi = numpy.clip(t + w, time[0], time[-1])
+                F = []
+                for x in (lo, hi):
+                    i = numpy.clip(numpy.searchsorted(time, x, side='right') - 1, 0, last)
+                    d = x - time[i]
+                    F.append(area[i] + d*(a[i] + d*(b[i]/2 + d*(c[i]/3 + d*e[i]/4))))
+                out = (F[1] - F[0]) / (hi - lo)
+        # python
+        else:
+            area = [0.0]
+            if ( 0 != w ):
+                for i in range(last+1):
+                    h = time[i+1] - time[i]
+                    area.append(area[-1] + h*(a[i] + h*(b[i]/2 + h*(c[i]/3 + h*e[i]/4))))
+            for k in range(self.k, kend):
+                t = self.t0 + k*self.ts
+                if ( 0 == w ):
+                    i = min(max(bisect.bisect_right(time, t) - 1, 0), last)
+                    d = t - time[i]
+                    out.append(a[i] + d*(b[i] + d*(c[i] + d*e[i])))
+                    continue
+                F = []
+                for x in (min(max(t - w, time[0]), time[-1]), min(max(t + w, time[0]), time[-1])):
+                    i = min(max(bisect.bisect_right(time, x) - 1, 0), last)
+                    d = x - time[i]
+                    F.append((x, area[i] + d*(a[i] + d*(b[i]/2 + d*(c[i]/3 + d*e[i]/4)))))
+                out.append((F[1][1] - F[0][1]) / (F[1][0] - F[0][0]))
+        # carry points of next window and the point before for cubic slopes
+        self.k = kend
+        j = max(bisect.bisect_right(time, self.t0 + self.k*self.ts - w) - 2, 0)
+        self.time = time[j:]
+        self.val = val[j:]
+        self.stats['output'] += len(out)
+        return out
+    #*****************************
+
+#------------------------------------------------------------------------------
+
+
+
+#------------------------------------------------------------------------------
+def read_chunks(file=None, chunk=1<<20):
+    """
+    @note           reads log in chunks, formats of arbitrary.load()
+
+    @param file     path to log file
+    @param chunk    log points per chunk
+    @rtype          generator
+    @return         (time, val) per chunk
+    """
+    # check
+    if ( None == file ):
+        raise ValueError("No log file provided")
+    if ( False == os.path.isfile(file) ):
+        raise FileNotFoundError("Log file '" + file + "' not found")
+    ext = os.path.splitext(file)[1].lower()
+    # raw binary
+    if ( ext in (".bin", ".dat") ):
+        with open(file, 'rb') as fH:
+            while True:
+                if ( None != numpy ):
+                    raw = numpy.fromfile(fH, dtype='<f8', count=2*chunk)
+                else:
+                    raw = array('d')
+                    try:
+                        raw.fromfile(fH, 2*chunk)
+                    except EOFError:
+                        pass    # last chunk
+                    if ( "big" == sys.byteorder ):
+                        raw.byteswap()
+                if ( 0 == len(raw) ):
+                    return
+                if ( 0 != len(raw) % 2 ):
+                    raise ValueError("Binary log file size is not a multiple of 16 bytes")
+                yield (raw[0::2], raw[1::2])
+    # text
+    elif ( ".csv" == ext ):
+        with open(file, 'r') as fH:
+            (time, val) = (array('d'), array('d'))
+            for line in fH:
+                col = line.replace(";", " ").replace(",", " ").split()
+                if ( 2 > len(col) ):
+                    continue
+                try:
+                    (t, v) = (float(col[0]), float(col[1]))
+                except ValueError:
+                    continue    # header or comment
+                time.append(t)
+                val.append(v)
+                if ( chunk <= len(time) ):
+                    yield (time, val)
+                    (time, val) = (array('d'), array('d'))
+            if ( 0 < len(time) ):
+                yield (time, val)
+    # yaml, event parsed into one chunk of arrays
+    else:
+        from .arbitrary import load     # import if required
+        yield load(file)
+#------------------------------------------------------------------------------
+
+
+#------------------------------------------------------------------------------
+def resample(file=None, ts=1, chunk=1<<20, points=None, **kwargs):
+    """
+    @note           resamples log file chunkwise
+
+    @param file     path to log file
+    @param ts       output sample time in seconds
+    @param chunk    log points per chunk, bounds memory
+    @param points   log as tuple (time, val), alternative to file
+    @param kwargs   resampler settings, method, gap, fill, decimate
+    @rtype          tuple
+    @return         (t0, ts, val, stats), sample k of val as array('d') is at
+                    t0 + k*ts, f.e. for segments.gridTable. Only the output
+                    samples grow, no time stamps are stored
+    """
+    stream = resampler(ts=ts, **kwargs)
+    chunks = read_chunks(file=file, chunk=chunk) if ( None == points ) else [points]
+    val = array('d')
+    for (t, v) in chunks:
+        val.frombytes(stream.push(time=t, val=v).tobytes())
+    val.frombytes(stream.flush().tobytes())
+    if ( 2 > len(val) ):
+        raise ValueError("Log shorter than two samples")
+    return (stream.t0, ts, val, stream.stats)
+#------------------------------------------------------------------------------
@@ -0,0 +1,292 @@
+# -*- coding: utf-8 -*-
+"""
+@author:        Andreas Kaeberlein
+@copyright:     Copyright 2026
+@credits:       AKAE
+
+@license:       GPLv3
+@maintainer:    Andreas Kaeberlein
+@email:         andreas.kaeberlein@web.de
+
+@file:          segments.py
+@date:          2026-10-17
+
+@note           compact table of linear segments for piecewise waveforms,
+                uniform sampled tables store only the values
+"""
+
+
+
+#------------------------------------------------------------------------------
+import math                 # floor
+import bisect               # segment lookup
+from array import array     # compact storage
+try:
+    import numpy            # optional, vectorized evaluation
+except ImportError:
+    numpy = None
+#------------------------------------------------------------------------------
+
+
+
+#------------------------------------------------------------------------------
+class segmentTable:
+    """
+    @note:  piecewise linear function, segment i is valid in [start[i], start[i+1])
+            and calculated with val[i] + grad[i]*(x-start[i])
+    """
+
+    __slots__ = ('start', 'val', 'grad', 'gradSec', 'end', 'ts', 'cursor')
+
+    #*****************************
+    def __init__(self, ts=1, start=0):
+        """
+        @note           initializes empty table
+
+        @param ts       seconds per x unit, used for gradient per second
+        @param start    x of first segment
+        """
+        self.start = array('d')     # cumulative segment boundaries
+        self.val = array('d')       # value at segment start
+        self.grad = array('d')      # gradient per x unit
+        self.gradSec = array('d')   # gradient per second
+        self.end = start            # end of last segment, start of next appended segment
+        self.ts = ts                # x unit in seconds
+        self.cursor = 0             # last matched segment
+    #*****************************
+
+
+    #*****************************
+    def __len__(self):
+        """
+        @note           number of segments
+        """
+        return len(self.start)
+    #*****************************
+
+
+    #*****************************
+    def append(self, length=1, val=0, grad=0):
+        """
+        @note           adds segment to the end of the table, segments without
+                        length are skipped
+
+        @param length   segment length in x units
+        @param val      value at segment start
+        @param grad     gradient per x unit
+        @rtype          boolean
+        @return         True if segment was added
+        """
+        # check
+        if ( 0 > length ):
+            raise ValueError("Negative segment length")
+        if ( 0 == length ):
+            return False
+        # add
+        self.start.append(self.end)
+        self.val.append(val)
+        self.grad.append(grad)
+        self.gradSec.append(grad / self.ts)
+        self.end = self.end + length
+        return True
+    #*****************************
+
+
+    #*****************************
+    def points(self, x=None, val=None):
+        """
+        @note           replaces table with linear interpolation between points,
+                        last point marks the end of the table. The point arrays
+                        are used as start/val columns without copy
+
+        @param x        array('d') of increasing positions
+        @param val      array('d') of values at positions
+        @rtype          int
+        @return         number of segments
+        """
+        # check
+        if ( (None == x) or (None == val) or (len(x) != len(val)) ):
+            raise ValueError("Positions and values of same length required")
+        if ( 2 > len(x) ):
+            raise ValueError("At least two points required")
+        # gradients, points with same position are steps
+        grad = array('d', bytes(8*(len(x)-1)))
+        for i in range(len(x)-1):
+            dx = x[i+1] - x[i]
+            if ( 0 > dx ):
+                raise ValueError("Positions not increasing at point " + str(i+1))
+            if ( 0 < dx ):
+                grad[i] = (val[i+1]-val[i]) / dx
+        # assign, last point is end of table
+        self.end = x.pop()
+        val.pop()
+        self.start = x
+        self.val = val
+        self.grad = grad
+        if ( 1 == self.ts ):
+            self.gradSec = grad   # same column
+        else:
+            self.gradSec = array('d', [g / self.ts for g in grad])
+        self.cursor = 0
+        return len(x)
+    #*****************************
+
+
+    #*****************************
+    def find(self, x=0):
+        """
+        @note           finds segment index of x, current and following segment are
+                        checked first, otherwise bisect. x outside of the table is
+                        assigned to the first/last segment
+
+        @param x        position
+        @rtype          int
+        @return         segment index
+        """
+        # sequential access
+        start = self.start
+        last = len(start) - 1
+        if ( 0 > last ):
+            raise ValueError("Empty segment table")
+        i = self.cursor
+        if ( start[i] <= x ):
+            if ( (i == last) or (x < start[i+1]) ):
+                return i
+            i += 1
+            if ( (i == last) or (x < start[i+1]) ):
+                self.cursor = i
+                return i
+        # random access
+        i = bisect.bisect_right(start, x) - 1
+        if ( 0 > i ):
+            i = 0
+        self.cursor = i
+        return i
+    #*****************************
+
+
+    #*****************************
+    def eval(self, x=0):
+        """
+        @note           calculates value at position x
+
+        @param x        position
+        @rtype          tuple
+        @return         (value, gradient per second)
+        """
+        i = self.find(x)
+        return (self.val[i] + self.grad[i] * (x-self.start[i]), self.gradSec[i])
+    #*****************************
+
+
+    #*****************************
+    def index(self, x=None):
+        """
+        @note           vectorized find(), requires numpy
+
+        @param x        numpy array of positions
+        @rtype          numpy array
+        @return         segment indices
+        """
+        if ( None == numpy ):
+            raise ValueError("Block evaluation requires numpy")
+        if ( 0 == len(self.start) ):
+            raise ValueError("Empty segment table")
+        return numpy.maximum(numpy.searchsorted(numpy.frombuffer(self.start), x, side='right') - 1, 0)
+    #*****************************
+
+
+    #*****************************
+    def block(self, x=None):
+        """
+        @note           vectorized eval(), requires numpy
+
+        @param x        numpy array of positions
+        @rtype          tuple
+        @return         (values, gradients per second) as numpy arrays
+        """
+        i = self.index(x)
+        start = numpy.frombuffer(self.start)
+        return (numpy.frombuffer(self.val)[i] + numpy.frombuffer(self.grad)[i] * (x-start[i]), numpy.frombuffer(self.gradSec)[i])
+    #*****************************
+
+#------------------------------------------------------------------------------
+
+
+
+#------------------------------------------------------------------------------
+class gridTable:
+    """
+    @note:  piecewise linear function through uniform samples, sample k is at
+            x0 + k*dx. Same evaluation interface as segmentTable, only the
+            values are stored
+    """
+
+    __slots__ = ('x0', 'dx', 'val', 'end')
+
+    #*****************************
+    def __init__(self, x0=0, dx=1, val=None):
+        """
+        @note           initializes table, values are used without copy
+
+        @param x0       position of first sample in seconds
+        @param dx       sample distance in seconds
+        @param val      array('d') of samples
+        """
+        # check
+        if ( (None == val) or (2 > len(val)) ):
+            raise ValueError("At least two points required")
+        if ( 0 >= dx ):
+            raise ValueError("Positive sample distance required")
+        # assign
+        self.x0 = x0
+        self.dx = dx
+        self.val = val
+        self.end = x0 + (len(val)-1) * dx
+    #*****************************
+
+
+    #*****************************
+    def __len__(self):
+        """
+        @note           number of segments
+        """
+        return len(self.val) - 1
+    #*****************************
+
+
+    #*****************************
+    def eval(self, x=0):
+        """
+        @note           calculates value at position x, x outside of the table
+                        is extrapolated with the first/last segment
+
+        @param x        position
+        @rtype          tuple
+        @return         (value, gradient per second)
+        """
+        p = (x - self.x0) / self.dx
+        i = min(max(math.floor(p + 1e-9), 0), len(self.val)-2)     # float rounding of sample positions
+        grad = (self.val[i+1] - self.val[i]) / self.dx
+        return (self.val[i] + grad * (x - self.x0 - i*self.dx), grad)
+    #*****************************
+
+
+    #*****************************
+    def block(self, x=None):
+        """
+        @note           vectorized eval(), requires numpy
+
+        @param x        numpy array of positions
+        @rtype          tuple
+        @return         (values, gradients per second) as numpy arrays
+        """
+        if ( None == numpy ):
+            raise ValueError("Block evaluation requires numpy")
+        val = numpy.frombuffer(self.val)
+        i = numpy.clip(numpy.floor((x - self.x0) / self.dx + 1e-9).astype(int), 0, len(val)-2)
+        grad = (val[i+1] - val[i]) / self.dx
+        return (val[i] + grad * (x - self.x0 - i*self.dx), grad)
+    #*****************************
+
+#------------------------------------------------------------------------------
@@ -0,0 +1,380 @@
+# -*- coding: utf-8 -*-
+"""
+@author:        Andreas Kaeberlein
+@copyright:     Copyright 2026
+@credits:       AKAE
+
+@license:       GPLv3
+@maintainer:    Andreas Kaeberlein
+@email:         andreas.kaeberlein@web.de
+
+@file:          sequence.py
+@date:          2026-10-17
+
+@note           test profile sequence, ordered steps compiled once into one segment table
+                  start: 25                                                 start temperature
+                  steps:
+                    - ramp: {to: -40, rate: 2C/min}                         or {to: -40, time: 30m}, rate with unit
+                    - soak: 2h                                              keep temperature
+                    - hold: {temp: 25, time: 1h}                            jump to temperature and keep
+                    - sine: {lowVal: -40, highVal: 85, tp: 1h, cycles: 20}  starts and ends at lowVal
+                    - trapezoid: {lowVal: -40, highVal: 85, tp: 1h, tr: 10m, tf: 5C/min, dutyCycle: 0.5, cycles: 5}
+                    - repeat: 10                                            nested steps, compiled once
+                      steps: [...]
+                times and gradients in units.time_to_sec/temp_grad_to_time format,
+                the last temperature is kept after the sequence
+"""
+
+
+
+#------------------------------------------------------------------------------
+import math                         # sine
+from array import array             # sine columns
+from .segments import segmentTable  # compiled profile
+from . import units                 # time and gradient strings
+try:
+    import numpy                    # optional, vectorized blocks
+except ImportError:
+    numpy = None
+#------------------------------------------------------------------------------
+
+
+
+#------------------------------------------------------------------------------
+class compiler:
+    """
+    @note:  compiles sequence steps into segment table, sine segments use the extra
+            columns amp/omega: val + grad*dx + amp*(1-cos(omega*dx))
+    """
+
+    __slots__ = ('cache', 'seg', 'length', 'amp', 'omega', 'temp')
+
+    STEPS = ('ramp', 'soak', 'hold', 'sine', 'trapezoid', 'repeat')
+
+    #*****************************
+    def __init__(self, start=0):
+        """
+        @note           initializes empty profile
+
+        @param start    start temperature
+        """
+        self.cache = {}             # converted strings, repeated steps
+        self.seg = segmentTable(ts=1)
+        self.length = array('d')    # segment lengths, copies of repeated steps
+        self.amp = array('d')
+        self.omega = array('d')
+        self.temp = float(start)    # temperature at end of profile
+    #*****************************
+
+
+    #*****************************
+    def add(self, length=0, val=0, grad=0, amp=0, omega=0):
+        """
+        @note           appends segment with sine columns
+
+        @param length   segment length in seconds
+        @param val      value at segment start
+        @param grad     gradient per second
+        @param amp      half peak-peak of cosine part
+        @param omega    angular frequency of cosine part
+        """
+        if ( self.seg.append(length=length, val=val, grad=grad) ):
+            self.length.append(length)
+            self.amp.append(amp)
+            self.omega.append(omega)
+    #*****************************
+
+
+    #*****************************
+    def time(self, arg=None, step="", key="time"):
+        """
+        @note           reads mandatory time of step
+
+        @param arg      step arguments
+        @param step     step name, for error message
+        @param key      time key
+        @rtype          float
+        @return         seconds
+        """
+        if ( (False == isinstance(arg, dict)) or (key not in arg) ):
+            raise ValueError("Sequence step '" + step + "' requires '" + key + "'")
+        sec = arg[key]
+        if ( isinstance(sec, str) ):
+            if ( sec not in self.cache ):
+                self.cache[sec] = units.time_to_sec(sec)
+            sec = self.cache[sec]
+        if ( 0 > sec ):
+            raise ValueError("Sequence step '" + step + "' with negative time")
+        return sec
+    #*****************************
+
+
+    #*****************************
+    def value(self, arg=None, step="", key="temp"):
+        """
+        @note           reads mandatory temperature of step
+
+        @param arg      step arguments
+        @param step     step name, for error message
+        @param key      temperature key
+        @rtype          float
+        @return         temperature
+        """
+        if ( (False == isinstance(arg, dict)) or (key not in arg) ):
+            raise ValueError("Sequence step '" + step + "' requires '" + key + "'")
+        return float(arg[key])
+    #*****************************
+
+
+    #*****************************
+    def slew(self, arg=None, key="tr", deltaTemp=0):
+        """
+        @note           slew time from gradient or time string
+
+        @param arg      step arguments
+        @param key      gradient key
+        @param deltaTemp temperature difference of slew
+        @rtype          float
+        @return         seconds
+        """
+        val = arg.get(key, 0)
+        if ( False == isinstance(val, str) ):
+            return val
+        if ( -1 == val.find("/") ):     # slew time
+            return self.time(arg, key=key)
+        if ( val not in self.cache ):   # seconds per degree
+            self.cache[val] = units.temp_grad_to_time(gradient=val, deltaTemp=1)
+        return self.cache[val] * abs(deltaTemp)
+    #*****************************
+
+
+    #*****************************
+    def steps(self, steps=None):
+        """
+        @note           compiles list of steps
+
+        @param steps    list of single key dicts, see module note
+        """
+        for item in steps:
+            # dispatch
+            name = next((key for key in item if key in compiler.STEPS), None) if ( isinstance(item, dict) ) else None
+            if ( None == name ):
+                raise ValueError("Unsupported sequence step '" + str(item) + "'")
+            arg = item[name]
+            # ramp to temperature
+            if ( "ramp" == name ):
+                to = self.value(arg, step=name, key="to")
+                if ( 'rate' in arg ):
+                    if ( (False == isinstance(arg['rate'], str)) or (-1 == arg['rate'].find("/")) ):
+                        raise ValueError("Sequence step 'ramp' requires rate with unit, f.e. '2C/min'")
+                    length = self.slew(arg, key="rate", deltaTemp=to-self.temp)
+                else:
+                    length = self.time(arg, step=name)
+                if ( 0 == length ):
+                    self.temp = to  # jump
+                    continue
+                self.add(length=length, val=self.temp, grad=(to-self.temp)/length)
+                self.temp = to
+            # keep temperature
+            elif ( "soak" == name ):
+                self.add(length=self.time({'time': arg}, step=name), val=self.temp)
+            # jump and keep temperature
+            elif ( "hold" == name ):
+                self.temp = self.value(arg, step=name, key="temp")
+                self.add(length=self.time(arg, step=name), val=self.temp)
+            # sine cycles from lowVal
+            elif ( "sine" == name ):
+                tp = self.time(arg, step=name, key="tp")
+                (low, high) = (self.value(arg, step=name, key="lowVal"), self.value(arg, step=name, key="highVal"))
+                self.add(length=tp*arg.get('cycles', 1), val=low, amp=(high-low)/2, omega=2*math.pi/tp)
+                self.temp = low
+            # trapezoid cycles from lowVal
+            elif ( "trapezoid" == name ):
+                tp = self.time(arg, step=name, key="tp")
+                (low, high) = (self.value(arg, step=name, key="lowVal"), self.value(arg, step=name, key="highVal"))
+                tr = self.slew(arg, key="tr", deltaTemp=high-low)
+                tf = self.slew(arg, key="tf", deltaTemp=high-low)
+                if ( 0 > (tp - tr - tf) ):
+                    raise ValueError("Rise + Fall time is larger then period, minimal period length is " + str(tr+tf) + "s")
+                th = (tp - tr - tf) * arg.get('dutyCycle', 0.5)
+                tl = tp - tr - tf - th
+                for i in range(arg.get('cycles', 1)):
+                    self.add(length=tr, val=low, grad=(high-low)/tr if ( 0 < tr ) else 0)
+                    self.add(length=th, val=high)
+                    self.add(length=tf, val=high, grad=(low-high)/tf if ( 0 < tf ) else 0)
+                    self.add(length=tl, val=low)
+                self.temp = low
+            # nested steps, a pass starting at the temperature of the last compiled pass is copied
+            elif ( "repeat" == name ):
+                body = None     # (first segment, end segment, start temperature) of compiled pass
+                for i in range(int(arg)):
+                    if ( (None == body) or (body[2] != self.temp) ):
+                        (first, temp) = (len(self.length), self.temp)
+                        self.steps(item.get('steps', []))
+                        body = (first, len(self.length), temp)
+                    else:
+                        for k in range(body[0], body[1]):
+                            self.add(length=self.length[k], val=self.seg.val[k], grad=self.seg.grad[k], amp=self.amp[k], omega=self.omega[k])
+    #*****************************
+
+
+    #*****************************
+    def range(self):
+        """
+        @note           minimal and maximal temperature of profile
+
+        @rtype          tuple
+        @return         (min, max)
+        """
+        seg = self.seg
+        ends = seg.start[1:] + array('d', [seg.end])
+        stop = [v + g*(e-s) for v, g, s, e in zip(seg.val, seg.grad, seg.start, ends)]    # value at segment end
+        peak = [v + 2*a for v, a in zip(seg.val, self.amp)]                                # sine maximum
+        return (min(self.temp, min(seg.val), min(stop)), max(self.temp, max(seg.val), max(stop), max(peak)))
+    #*****************************
+
+#------------------------------------------------------------------------------
+
+
+
+#------------------------------------------------------------------------------
+def load(file=None):
+    """
+    @note           loads sequence from yaml file
+
+    @param file     path to yaml file
+    @rtype          dict
+    @return         {'start': , 'steps': []}, plain step list for files without start
+    """
+    import yaml     # import if required
+    Loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    with open(file, 'r') as fH:
+        data = yaml.load(fH, Loader=Loader)
+    if ( isinstance(data, list) ):
+        return {'steps': data}
+    return data
+#------------------------------------------------------------------------------
+
+
+#------------------------------------------------------------------------------
+def init(self, file=None, steps=None, start=None, ts=1, lowVal=float("nan"), highVal=float("nan"), initVal=float("nan"), pSlope=True):
+    """
+    @note           initializes sequence waveform
+
+    @param self     waves instance
+    @param file     yaml sequence file
+    @param steps    list of steps, alternative to file
+    @param start    start temperature, overwrites file
+    @param ts       Sample/Update time of waveform in seconds
+    @param lowVal   optional lower limit, checked against profile
+    @param highVal  optional upper limit, checked against profile
+    @param initVal  start temperature if not defined in sequence
+    @param pSlope   unused, sequence starts with first step
+    @rtype          tuple
+    @return         (iterator, wave descriptor)
+    """
+    # load
+    if ( None == steps ):
+        if ( None == file ):
+            raise ValueError("Sequence requires steps or file")
+        data = load(file)
+        steps = data.get('steps', [])
+        if ( None == start ):
+            start = data.get('start', None)
+    if ( None == start ):
+        if ( math.isnan(initVal) ):
+            raise ValueError("Sequence requires start temperature")
+        start = initVal
+    # compile
+    prog = compiler(start=start)
+    prog.steps(steps)
+    if ( 0 == len(prog.seg) ):
+        raise ValueError("Empty sequence")
+    (low, high) = prog.range()
+    if ( (low < lowVal) or (high > highVal) ):
+        raise ValueError("Sequence temperature range [" + str(low) + ", " + str(high) + "] exceeds limits")
+    # time behaviour
+    x = {}
+    x['ts'] = ts                            # sample rate
+    x['tp'] = prog.seg.end                  # duration
+    x['n'] = max(math.ceil(x['tp']/ts), 1)  # number of steps
+    # last temperature is kept
+    prog.add(length=1, val=prog.temp)
+    # build waveform
+    wave = {}
+    wave['x'] = x
+    wave['seg'] = prog.seg
+    wave['amp'] = prog.amp
+    wave['omega'] = prog.omega
+    return (0, wave)
+#------------------------------------------------------------------------------
+
+
+#------------------------------------------------------------------------------
+def step(self, iterator, wave):
+    """
+    @note           calculates profile value at iterator
+
+    @param self     waves instance
+    @param iterator sample index since waveform init
+    @param wave     wave descriptor, see init()
+    @rtype          tuple
+    @return         (next iterator, {'val': , 'grad': })
+    """
+    seg = wave['seg']
+    t = iterator * wave['x']['ts']
+    i = seg.find(t)
+    dx = t - seg.start[i]
+    val = seg.val[i] + seg.grad[i]*dx
+    grad = seg.gradSec[i]
+    amp = wave['amp'][i]
+    if ( 0 != amp ):
+        omega = wave['omega'][i]
+        val += amp*(1-math.cos(omega*dx))
+        grad += amp*omega*math.sin(omega*dx)
+    return (iterator+1, {'val': val, 'grad': grad})
+#------------------------------------------------------------------------------
+
+
+#------------------------------------------------------------------------------
+def block(self, iterator, wave, count):
+    """
+    @note           vectorized step(), block function of waves registry
+
+    @param self     waves instance
+    @param iterator sample index of first sample
+    @param wave     wave descriptor, see init()
+    @param count    number of samples
+    @rtype          tuple
+    @return         (sample index after block, {'val': buffer, 'grad': buffer})
+    """
+    seg = wave['seg']
+    t = (iterator + numpy.arange(count, dtype=float)) * wave['x']['ts']
+    i = seg.index(t)
+    dx = t - numpy.frombuffer(seg.start)[i]
+    val = numpy.frombuffer(seg.val)[i] + numpy.frombuffer(seg.grad)[i]*dx
+    grad = numpy.frombuffer(seg.gradSec)[i]
+    amp = numpy.frombuffer(wave['amp'])[i]
+    sine = (0 != amp)                                   # sine steps only
+    if ( numpy.any(sine) ):
+        omega = numpy.frombuffer(wave['omega'])[i][sine]
+        val[sine] += amp[sine]*(1-numpy.cos(omega*dx[sine]))
+        grad[sine] += amp[sine]*omega*numpy.sin(omega*dx[sine])
+    return (iterator+count, {'val': val, 'grad': grad})
+#------------------------------------------------------------------------------
+
+
+#------------------------------------------------------------------------------
+def advance(self, iterator, steps, wave):
+    """
+    @note           iterator is the sample index, no wrap
+
+    @param self     waves instance
+    @param iterator sample index
+    @param steps    number of steps
+    @param wave     wave descriptor
+    @rtype          int
+    @return         sample index
+    """
+    return iterator + steps
+#------------------------------------------------------------------------------
@@ -0,0 +1,180 @@
+# -*- coding: utf-8 -*-
+"""
+@author:        Andreas Kaeberlein
+@copyright:     Copyright 2026
+@credits:       AKAE
+
+@license:       GPLv3
+@maintainer:    Andreas Kaeberlein
+@email:         andreas.kaeberlein@web.de
+
+@file:          slew.py
+@date:          2026-10-17
+
+@note           slew rate handling of setpoint stream
+                  * check():        feasibility of one period against slew rates and ratings
+                  * slewLimiter:    limits setpoint change per sample, wraps a step function
+                gradients in 1/sec
+"""
+
+
+
+#------------------------------------------------------------------------------
+import math                 # isfinite
+from array import array     # numpy free differences
+try:
+    import numpy            # optional, vectorized check
+except ImportError:
+    numpy = None
+#------------------------------------------------------------------------------
+
+
+
+#------------------------------------------------------------------------------
+TOL = 1e-9  # relative tolerance of slew limit, float rounding of ramps
+#------------------------------------------------------------------------------
+
+
+
+#------------------------------------------------------------------------------
+def check(wave=None, rise=float('+inf'), fall=float('-inf'), low=float('-inf'), high=float('+inf'), chunk=1<<16):
+    """
+    @note           checks sample to sample gradient of one period, including the
+                    transition into the next period, and value range
+
+    @param wave     initialized waves instance
+    @param rise     max. positive gradient in 1/sec
+    @param fall     max. negative gradient in 1/sec, negative number
+    @param low      min. allowed value
+    @param high     max. allowed value
+    @param chunk    samples per block
+    @rtype          dict
+    @return         {'feasible': , 'samples': , 'min': , 'max': , 'below': , 'above': ,
+                     'rise': {'max': , 'violations': , 'first': }, 'fall': {'min': , 'violations': , 'first': }},
+                    'first' is the time of the first violation in seconds since waveform init
+    """
+    # check
+    x = wave.waveDescr['x']
+    if ( False == math.isfinite(x['n']) ):
+        raise ValueError("Feasibility check requires finite waveform")
+    # prepare
+    ts = x['ts']
+    n = int(x['n']) + 1     # transition into next period
+    rpt = {'feasible': True, 'samples': n-1, 'min': float('+inf'), 'max': float('-inf'), 'below': 0, 'above': 0,
+           'rise': {'max': 0.0, 'violations': 0, 'first': None}, 'fall': {'min': 0.0, 'violations': 0, 'first': None}}
+    up = rise * ts * (1+TOL)    # limits per sample, ramps at limit pass
+    down = fall * ts * (1+TOL)  #
+    iterator = wave.iterInit
+    prev = None
+    done = 0
+    # blockwise
+    while ( done < n ):
+        count = min(chunk, n-done)
+        (iterator, new) = wave.render_block(start=iterator, count=count)
+        val = new['val']
+        body = val[:max(n-1-done, 0)]                       # samples of period, without transition
+        base = done if ( None == prev ) else done-1         # sample index of first difference
+        if ( None != numpy ):
+            val = numpy.asarray(val, dtype=float)
+            body = numpy.asarray(body, dtype=float)
+            delta = numpy.diff(val if ( None == prev ) else numpy.concatenate(([prev], val)))
+            if ( 0 < len(body) ):
+                (rpt['min'], rpt['max']) = (min(rpt['min'], float(body.min())), max(rpt['max'], float(body.max())))
+            rpt['below'] += int(numpy.count_nonzero(body < low))
+            rpt['above'] += int(numpy.count_nonzero(body > high))
+            extreme = (float(delta.max()), float(delta.min())) if ( 0 < len(delta) ) else None
+            for key, viol in (('rise', delta > up), ('fall', delta < down)):
+                cnt = int(numpy.count_nonzero(viol))
+                if ( (0 < cnt) and (None == rpt[key]['first']) ):
+                    rpt[key]['first'] = (base + int(numpy.argmax(viol))) * ts
+                rpt[key]['violations'] += cnt
+        else:
+            chain = val if ( None == prev ) else array('d', [prev]) + array('d', val)
+            delta = [b - a for a, b in zip(chain, chain[1:])]
+            extreme = (max(delta), min(delta)) if ( 0 < len(delta) ) else None
+            if ( 0 < len(body) ):
+                (rpt['min'], rpt['max']) = (min(rpt['min'], min(body)), max(rpt['max'], max(body)))
+            rpt['below'] += sum(1 for v in body if v < low) if ( math.isfinite(low) ) else 0
+            rpt['above'] += sum(1 for v in body if v > high) if ( math.isfinite(high) ) else 0
+            for key, viol in (('rise', [j for j, d in enumerate(delta) if d > up]), ('fall', [j for j, d in enumerate(delta) if d < down])):
+                if ( (0 < len(viol)) and (None == rpt[key]['first']) ):
+                    rpt[key]['first'] = (base + viol[0]) * ts
+                rpt[key]['violations'] += len(viol)
+        if ( None != extreme ):
+            rpt['rise']['max'] = max(rpt['rise']['max'], extreme[0] / ts)
+            rpt['fall']['min'] = min(rpt['fall']['min'], extreme[1] / ts)
+        prev = float(val[-1])
+        done += count
+    # summary
+    rpt['feasible'] = (0 == rpt['below'] + rpt['above'] + rpt['rise']['violations'] + rpt['fall']['violations'])
+    return rpt
+#------------------------------------------------------------------------------
+
+
+
+#------------------------------------------------------------------------------
+class slewLimiter:
+    """
+    @note:  limits setpoint change per sample, the setpoint follows the waveform
+            with max. slew rate until it catches up
+    """
+
+    __slots__ = ('func', 'ts', 'up', 'down', 'rise', 'fall', 'val')
+
+    #*****************************
+    def __init__(self, func=None, ts=1, rise=float('+inf'), fall=float('-inf')):
+        """
+        @note           wraps step function
+
+        @param func     step function, func(iterator, descr)
+        @param ts       sample time in seconds
+        @param rise     max. positive gradient in 1/sec
+        @param fall     max. negative gradient in 1/sec, negative number
+        """
+        # check
+        if ( (0 >= rise) or (0 <= fall) ):
+            raise ValueError("Positive rise and negative fall slew rate required")
+        # assign
+        self.func = func
+        self.ts = ts
+        self.rise = rise
+        self.fall = fall
+        self.up = rise * ts     # max. change per sample
+        self.down = fall * ts   #
+        self.val = None         # last setpoint
+    #*****************************
+
+
+    #*****************************
+    def reset(self, val=None):
+        """
+        @note           sets last setpoint, f.e. measured chamber temperature
+
+        @param val      setpoint, None takes first waveform value
+        """
+        self.val = val
+    #*****************************
+
+
+    #*****************************
+    def step(self, iterator=0, wave=None):
+        """
+        @note           steps wrapped function and limits the result
+
+        @param iterator waveform iterator
+        @param wave     wave descriptor
+        @rtype          tuple
+        @return         (next iterator, {'val': , 'grad': })
+        """
+        (iterator, new) = self.func(iterator, wave)
+        if ( None != self.val ):
+            delta = new['val'] - self.val
+            if ( delta > self.up ):
+                new = {'val': self.val + self.up, 'grad': self.rise}
+            elif ( delta < self.down ):
+                new = {'val': self.val + self.down, 'grad': self.fall}
+        self.val = new['val']
+        return (iterator, new)
+    #*****************************
+
+#------------------------------------------------------------------------------
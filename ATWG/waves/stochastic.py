@@ -0,0 +1,488 @@
+# -*- coding: utf-8 -*-
+"""
+@author:        Andreas Kaeberlein
+@copyright:     Copyright 2026
+@credits:       AKAE
+
+@license:       GPLv3
+@maintainer:    Andreas Kaeberlein
+@email:         andreas.kaeberlein@web.de
+
+@file:          stochastic.py
+@date:          2026-10-17
+
+@note           seeded pseudo random waveforms for robustness tests
+                  * randwalk:   bounded random walk, reflected at lowVal/highVal
+                  * noise:      band limited noise, sum of seeded harmonics of the period
+                  * dwell:      random levels, ramped with rise/fall time
+                random numbers are counter based, number k of a stream only depends
+                on seed, stream and k. One period is tabulated once in init(), every
+                sample is evaluated in closed form from the table, so random access
+                needs no replay and runs are reproducible with and without numpy,
+                numpy blocks can differ from next() in the last bit.
+                tr/tf are the times from lowVal to highVal like trapezoid, the slope
+                of the waveforms never exceeds them.
+                band limited noise around a base waveform is a composite sum node
+"""
+
+
+
+#------------------------------------------------------------------------------
+import math                 # floor, sin
+from array import array     # numpy free tables
+try:
+    import numpy            # optional, vectorized tables and blocks
+except ImportError:
+    numpy = None
+#------------------------------------------------------------------------------
+
+
+
+#------------------------------------------------------------------------------
+SHAPES = ('randwalk', 'noise', 'dwell')     # slew from chamber, see ATWG.open()
+MARGIN = 0.95                               # ramps below chamber slew rate, see ATWG.init_wave()
+GOLDEN = 0x9E3779B97F4A7C15                 # splitmix64
+MIX1 = 0xBF58476D1CE4E5B9                   #
+MIX2 = 0x94D049BB133111EB                   #
+MASK = (1 << 64) - 1                        # uint64
+CHUNK = 1 << 12                             # samples of noise rotation table
+#------------------------------------------------------------------------------
+
+
+
+#------------------------------------------------------------------------------
+def mix(z=0):
+    """
+    @note           splitmix64 finalizer
+
+    @param z        unsigned 64bit integer
+    @rtype          int
+    @return         hashed integer
+    """
+    z = ((z ^ (z >> 30)) * MIX1) & MASK
+    z = ((z ^ (z >> 27)) * MIX2) & MASK
+    return z ^ (z >> 31)
+#------------------------------------------------------------------------------
+
+
+#------------------------------------------------------------------------------
+def uniform(seed=0, stream=0, count=1):
+    """
+    @note           counter based random numbers, splitmix64 of seed, stream
+                    and number
+
+    @param seed     integer seed
+    @param stream   independent stream of same seed
+    @param count    number of random numbers
+    @rtype          numpy array or array('d')
+    @return         random numbers in [0, 1)
+    """
+    key = mix((int(seed) * GOLDEN + int(stream)) & MASK)
+    if ( None != numpy ):
+        z = numpy.uint64(key) + (numpy.arange(1, count+1, dtype=numpy.uint64) * numpy.uint64(GOLDEN))
+        z = (z ^ (z >> numpy.uint64(30))) * numpy.uint64(MIX1)
+        z = (z ^ (z >> numpy.uint64(27))) * numpy.uint64(MIX2)
+        z = z ^ (z >> numpy.uint64(31))
+        return (z >> numpy.uint64(11)).astype(float) * 2.0**-53
+    return array('d', [(mix((key + k * GOLDEN) & MASK) >> 11) * 2.0**-53 for k in range(1, count+1)])
+#------------------------------------------------------------------------------
+
+
+#------------------------------------------------------------------------------
+def prepare(self, ts=1, tp=3600, lowVal=0, highVal=1, tr=0, tf=0):
+    """
+    @note           time base and value range of all shapes
+
+    @param self     waves instance
+    @param ts       Sample/Update time of waveform in seconds
+    @param tp       Period time of waveform in seconds
+    @param lowVal   minimal value
+    @param highVal  maximal value
+    @param tr       rise time in sec from min to max, 0 unlimited
+    @param tf       fall time in sec from max to min, 0 unlimited
+    @rtype          tuple
+    @return         (x, y) of wave descriptor
+    """
+    # check
+    if ( highVal <= lowVal ):
+        raise ValueError("Random waveform requires lowVal < highVal")
+    # time behaviour
+    x = {}
+    x['ts'] = ts                            # sample rate
+    x['tp'] = tp                            # period
+    x['n'] = self.samples(x['tp'], x['ts']) # number of steps for full period
+    # value range and slew rates per second
+    y = {}
+    y['low'] = lowVal
+    y['high'] = highVal
+    y['span'] = highVal - lowVal
+    y['rise'] = (y['span'] / tr) if ( 0 < tr ) else float('+inf')
+    y['fall'] = (y['span'] / tf) if ( 0 < tf ) else float('+inf')
+    return (x, y)
+#------------------------------------------------------------------------------
+
+
+#------------------------------------------------------------------------------
+def times(wave, iterator=0, count=1):
+    """
+    @note           sample times of block in period, same as step()
+
+    @param wave     wave descriptor
+    @param iterator waveform iterator of first sample
+    @param count    number of samples
+    @rtype          numpy array
+    @return         times in seconds
+    """
+    x = wave['x']
+    idx = iterator + numpy.arange(count, dtype=float)
+    if ( (0 < count) and ((0 > iterator) or (idx[-1] > x['n']-1)) ):  # wraps
+        idx = numpy.mod(idx, x['n'])
+    return idx * x['ts']
+#------------------------------------------------------------------------------
+
+
+#------------------------------------------------------------------------------
+def step(self, iterator, wave):
+    """
+    @note           evaluates table of shape at iterator
+
+    @param self     waves instance
+    @param iterator waveform iterator
+    @param wave     wave descriptor
+    @rtype          tuple
+    @return         (next iterator, {'val': , 'grad': })
+    """
+    x = wave['x']
+    (val, grad) = wave['at'](wave, (iterator % x['n']) * x['ts'])
+    iterator += 1
+    if ( iterator > x['n']-1 ):
+        iterator -= x['n']
+    return (iterator, {'val': val, 'grad': grad})
+#------------------------------------------------------------------------------
+
+
+#------------------------------------------------------------------------------
+def render(self, iterator, wave, count):
+    """
+    @note           block function of waves registry, vectorized with numpy.
+                    numpy blocks can differ from next() in the last bit
+
+    @param self     waves instance
+    @param iterator waveform iterator of first sample
+    @param wave     wave descriptor
+    @param count    number of samples
+    @rtype          tuple
+    @return         (iterator after block, {'val': buffer, 'grad': buffer})
+    """
+    x = wave['x']
+    # vectorized
+    if ( None != numpy ):
+        (val, grad) = wave['vector'](wave, iterator, count)
+        return (self.advance(iterator, count), {'val': val, 'grad': grad})
+    # table per sample
+    val = array('d')
+    grad = array('d')
+    for i in range(count):
+        (iterator, new) = step(self, iterator, wave)
+        val.append(new['val'])
+        grad.append(new['grad'])
+    return (iterator, {'val': val, 'grad': grad})
+#------------------------------------------------------------------------------
+
+
+
+#------------------------------------------------------------------------------
+def randwalk(self, seed=0, ts=1, tp=3600, lowVal=0, highVal=1, initVal=float("nan"), pSlope=True, tr=0, tf=0, tk=60, gain=1):
+    """
+    @note           bounded random walk, knots every tk seconds with random
+                    increments, linear between knots and reflected at lowVal/highVal.
+                    The increments are mean free, the walk closes the period
+
+    @param self     waves instance
+    @param seed     integer seed, f.e. CLI option value
+    @param ts       Sample/Update time of waveform in seconds
+    @param tp       Period time of waveform in seconds
+    @param lowVal   minimal value
+    @param highVal  maximal value
+    @param initVal  start value, default center
+    @param pSlope   unused
+    @param tr       rise time in sec from min to max, limits slope
+    @param tf       fall time in sec from max to min, limits slope
+    @param tk       time between knots in seconds, fitted to period
+    @param gain     max. increment per knot as fraction of the slew limit or range
+    @rtype          tuple
+    @return         (iterator, wave descriptor)
+    """
+    (x, y) = prepare(self, ts=ts, tp=tp, lowVal=lowVal, highVal=highVal, tr=tr, tf=tf)
+    # knots
+    m = max(round(tp / tk), 1)
+    y['tk'] = tp / m
+    d = gain * min(min(y['rise'], y['fall']) * y['tk'], y['span'])  # reflection swaps rise and fall
+    u = uniform(seed=seed, stream=1, count=m)
+    start = ((lowVal + highVal) / 2) if ( math.isnan(initVal) ) else min(max(initVal, lowVal), highVal)
+    if ( None != numpy ):
+        inc = (2*u - 1) * (d/2)
+        inc -= inc.mean()                                   # |inc| <= d
+        y['knot'] = start + numpy.concatenate(([0.0], numpy.cumsum(inc)))
+        y['knot'][-1] = start                               # closed period
+        y['slope'] = numpy.append(inc / y['tk'], 0.0)       # last entry catches t=tp
+    else:
+        inc = [(2*v - 1) * (d/2) for v in u]
+        mean = sum(inc) / m
+        inc = [v - mean for v in inc]
+        y['knot'] = array('d', [start])
+        for v in inc:
+            y['knot'].append(y['knot'][-1] + v)
+        y['knot'][-1] = start
+        y['slope'] = array('d', [v / y['tk'] for v in inc] + [0.0])
+    # build waveform
+    wave = {}
+    wave['x'] = x
+    wave['y'] = y
+    wave['at'] = randwalk_at
+    wave['vector'] = randwalk_vector
+    return (0, wave)
+#------------------------------------------------------------------------------
+
+
+#------------------------------------------------------------------------------
+def randwalk_at(wave, t):
+    """
+    @note           random walk at time
+
+    @param wave     wave descriptor
+    @param t        time in seconds in period
+    @rtype          tuple
+    @return         (value, gradient)
+    """
+    y = wave['y']
+    k = min(int(t / y['tk']), len(y['knot'])-2)
+    walk = y['knot'][k] + y['slope'][k] * (t - k*y['tk']) - y['low']
+    # reflect
+    p = walk - 2*y['span'] * math.floor(walk / (2*y['span']))
+    if ( p > y['span'] ):
+        return (float(y['low'] + 2*y['span'] - p), -float(y['slope'][k]))
+    return (float(y['low'] + p), float(y['slope'][k]))
+#------------------------------------------------------------------------------
+
+
+#------------------------------------------------------------------------------
+def randwalk_vector(wave, iterator, count):
+    """
+    @note           random walk, vectorized
+
+    @param wave     wave descriptor
+    @param iterator waveform iterator of first sample
+    @param count    number of samples
+    @rtype          tuple
+    @return         (values, gradients)
+    """
+    y = wave['y']
+    t = times(wave, iterator, count)
+    k = numpy.minimum((t / y['tk']).astype(numpy.intp), len(y['knot'])-2)
+    slope = y['slope'][k]
+    p = y['knot'][k] + slope * (t - k*y['tk']) - y['low']
+    p -= 2*y['span'] * numpy.floor(p / (2*y['span']))
+    back = p > y['span']
+    return (y['low'] + numpy.where(back, 2*y['span'] - p, p), numpy.where(back, -slope, slope))
+#------------------------------------------------------------------------------
+
+
+
+#------------------------------------------------------------------------------
+def noise(self, seed=0, ts=1, tp=3600, lowVal=0, highVal=1, initVal=float("nan"), pSlope=True, tr=0, tf=0, tmin=None, tones=16):
+    """
+    @note           band limited noise, sum of harmonics of the period with
+                    random order, phase and 1/sqrt(order) amplitude. The sum of
+                    amplitudes is the half range, the amplitudes are reduced until
+                    the max. slope fits tr/tf
+
+    @param self     waves instance
+    @param seed     integer seed, f.e. CLI option value
+    @param ts       Sample/Update time of waveform in seconds
+    @param tp       Period time of waveform in seconds, longest noise period
+    @param lowVal   minimal value
+    @param highVal  maximal value
+    @param initVal  unused, noise is centered
+    @param pSlope   unused
+    @param tr       rise time in sec from min to max, limits slope
+    @param tf       fall time in sec from max to min, limits slope
+    @param tmin     shortest noise period in seconds, default tp/64, min. two samples
+    @param tones    number of harmonics
+    @rtype          tuple
+    @return         (iterator, wave descriptor)
+    """
+    (x, y) = prepare(self, ts=ts, tp=tp, lowVal=lowVal, highVal=highVal, tr=tr, tf=tf)
+    # band
+    tmin = max((tp / 64) if ( None == tmin ) else tmin, 2*ts)
+    kmax = max(math.floor(tp / tmin), 1)
+    # harmonics
+    order = [1 + math.floor(v * kmax) for v in uniform(seed=seed, stream=2, count=tones)]
+    phase = [2*math.pi*v for v in uniform(seed=seed, stream=3, count=tones)]
+    omega = [2*math.pi*k/tp for k in order]
+    amp = [1/math.sqrt(k) for k in order]
+    scale = (y['span'] / 2) / sum(amp)
+    scale = min(scale, min(y['rise'], y['fall']) / sum(a*w for a, w in zip(amp, omega)))
+    y['ofs'] = (lowVal + highVal) / 2
+    y['amp'] = array('d', [a * scale for a in amp])
+    y['omega'] = array('d', omega)
+    y['phase'] = array('d', phase)
+    if ( None != numpy ):
+        y['amp'] = numpy.frombuffer(y['amp'])
+        y['omega'] = numpy.frombuffer(y['omega'])
+        y['phase'] = numpy.frombuffer(y['phase'])
+        y['rot'] = numpy.exp(1j * numpy.multiply.outer(numpy.arange(CHUNK) * ts, y['omega']))  # harmonics rotated by sample offset
+    # build waveform
+    wave = {}
+    wave['x'] = x
+    wave['y'] = y
+    wave['at'] = noise_at
+    wave['vector'] = noise_vector
+    return (0, wave)
+#------------------------------------------------------------------------------
+
+
+#------------------------------------------------------------------------------
+def noise_at(wave, t):
+    """
+    @note           noise at time
+
+    @param wave     wave descriptor
+    @param t        time in seconds in period
+    @rtype          tuple
+    @return         (value, gradient)
+    """
+    y = wave['y']
+    val = y['ofs']
+    grad = 0.0
+    for a, w, p in zip(y['amp'], y['omega'], y['phase']):
+        val += a * math.sin(w*t + p)
+        grad += a * w * math.cos(w*t + p)
+    return (float(val), float(grad))
+#------------------------------------------------------------------------------
+
+
+#------------------------------------------------------------------------------
+def noise_vector(wave, iterator, count):
+    """
+    @note           noise, vectorized in chunks. The phasors of the chunk start
+                    are rotated with the precomputed table, one matrix product
+                    per chunk instead of sin/cos per sample and harmonic
+
+    @param wave     wave descriptor
+    @param iterator waveform iterator of first sample
+    @param count    number of samples
+    @rtype          tuple
+    @return         (values, gradients)
+    """
+    x = wave['x']
+    y = wave['y']
+    val = numpy.empty(count)
+    grad = numpy.empty(count)
+    for i in range(0, count, CHUNK):
+        t = ((iterator + i) % x['n']) * x['ts']     # harmonics of period, wrap inside chunk is seamless
+        c = y['amp'] * numpy.exp(1j * (y['omega']*t + y['phase']))
+        z = y['rot'][:min(CHUNK, count-i)] @ numpy.stack((c, c*y['omega']), axis=1)
+        val[i:i+CHUNK] = y['ofs'] + z[:, 0].imag
+        grad[i:i+CHUNK] = z[:, 1].real
+    return (val, grad)
+#------------------------------------------------------------------------------
+
+
+
+#------------------------------------------------------------------------------
+def dwell(self, seed=0, ts=1, tp=3600, lowVal=0, highVal=1, initVal=float("nan"), pSlope=True, tr=0, tf=0, td=600, levels=0):
+    """
+    @note           random levels every td seconds, the transition from the
+                    previous level ramps with tr/tf
+
+    @param self     waves instance
+    @param seed     integer seed, f.e. CLI option value
+    @param ts       Sample/Update time of waveform in seconds
+    @param tp       Period time of waveform in seconds
+    @param lowVal   minimal value
+    @param highVal  maximal value
+    @param initVal  unused, period starts with ramp from last level
+    @param pSlope   unused
+    @param tr       rise time in sec from min to max
+    @param tf       fall time in sec from max to min
+    @param td       time per level including ramp in seconds, fitted to period,
+                    raised until the ramps fit
+    @param levels   number of equidistant levels, 0 for continuous
+    @rtype          tuple
+    @return         (iterator, wave descriptor)
+    """
+    (x, y) = prepare(self, ts=ts, tp=tp, lowVal=lowVal, highVal=highVal, tr=tr, tf=tf)
+    # levels, fewer and longer levels until all ramps fit into dwell time
+    m = max(round(tp / td), 1)
+    while True:
+        y['td'] = tp / m
+        u = uniform(seed=seed, stream=4, count=m)
+        if ( 1 < levels ):
+            lvl = [lowVal + math.floor(v * levels) / (levels-1) * y['span'] for v in u]
+        else:
+            lvl = [lowVal + v * y['span'] for v in u]
+        prev = lvl[-1:] + lvl[:-1]                  # ramp start, wraps with period
+        # ramps
+        grad = []
+        for a, b in zip(prev, lvl):
+            rate = y['rise'] if ( b > a ) else y['fall']
+            grad.append(math.copysign(rate, b-a) if ( (b != a) and math.isfinite(rate) ) else 0.0)   # infinite rate jumps
+        ramp = [(b-a)/g if ( 0 != g ) else 0.0 for a, b, g in zip(prev, lvl, grad)]
+        if ( max(ramp) <= y['td'] ):                # single level never ramps
+            break
+        m = max(min(m-1, math.floor(tp / max(ramp))), 1)
+    y['level'] = array('d', lvl + lvl[-1:])     # last entry catches t=tp
+    y['prev'] = array('d', prev + prev[-1:])    #
+    y['grad'] = array('d', grad + [0.0])        #
+    y['ramp'] = array('d', ramp + [0.0])        #
+    if ( None != numpy ):
+        for key in ('level', 'prev', 'grad', 'ramp'):
+            y[key] = numpy.frombuffer(y[key])
+    # build waveform
+    wave = {}
+    wave['x'] = x
+    wave['y'] = y
+    wave['at'] = dwell_at
+    wave['vector'] = dwell_vector
+    return (0, wave)
+#------------------------------------------------------------------------------
+
+
+#------------------------------------------------------------------------------
+def dwell_at(wave, t):
+    """
+    @note           dwell level at time
+
+    @param wave     wave descriptor
+    @param t        time in seconds in period
+    @rtype          tuple
+    @return         (value, gradient)
+    """
+    y = wave['y']
+    k = min(int(t / y['td']), len(y['level'])-1)
+    dt = t - k*y['td']
+    if ( dt < y['ramp'][k] ):
+        return (float(y['prev'][k] + y['grad'][k]*dt), float(y['grad'][k]))
+    return (float(y['level'][k]), 0.0)
+#------------------------------------------------------------------------------
+
+
+#------------------------------------------------------------------------------
+def dwell_vector(wave, iterator, count):
+    """
+    @note           dwell levels, vectorized
+
+    @param wave     wave descriptor
+    @param iterator waveform iterator of first sample
+    @param count    number of samples
+    @rtype          tuple
+    @return         (values, gradients)
+    """
+    y = wave['y']
+    t = times(wave, iterator, count)
+    k = numpy.minimum((t / y['td']).astype(numpy.intp), len(y['level'])-1)
+    dt = t - k*y['td']
+    ramp = dt < y['ramp'][k]
+    return (numpy.where(ramp, y['prev'][k] + y['grad'][k]*dt, y['level'][k]), numpy.where(ramp, y['grad'][k], 0.0))
+#------------------------------------------------------------------------------
@@ -0,0 +1,357 @@
+# -*- coding: utf-8 -*-
+"""
+@author:        Andreas Kaeberlein
+@copyright:     Copyright 2026
+@credits:       AKAE
+
+@license:       GPLv3
+@maintainer:    Andreas Kaeberlein
+@email:         andreas.kaeberlein@web.de
+
+@file:          store.py
+@date:          2026-10-17
+
+@note           precomputed waveform store, one period of samples is written
+                once to a memory-mapped cache file and reused by later runs
+                with identical waves.set() arguments. Header and columns are
+                little-endian
+"""
+
+
+
+#------------------------------------------------------------------------------
+import os               # paths
+import sys              # byte order
+import mmap             # memory mapped samples
+import struct           # file header
+import hashlib          # cache key
+from array import array # sample conversion
+try:
+    import numpy        # optional, vectorized blocks
+except ImportError:
+    numpy = None
+#------------------------------------------------------------------------------
+
+
+
+#------------------------------------------------------------------------------
+class storeTable:
+    """
+    @note:  memory mapped samples of one period, index is the sample number since
+            waveform init modulo period
+    """
+
+    __slots__ = ('n', 'ts', 'tp', 'val', 'grad', 'valRes', 'gradRes', 'map')
+
+    #*****************************
+    def __init__(self, file=None):
+        """
+        @note           maps store file
+
+        @param file     store file
+        """
+        with open(file, 'rb') as fH:
+            self.map = mmap.mmap(fH.fileno(), 0, access=mmap.ACCESS_READ)   # mapping keeps own handle
+        (magic, dtype, self.n, self.ts, self.tp, self.valRes, self.gradRes) = waveStore.HEADER.unpack_from(self.map, 0)
+        if ( waveStore.MAGIC != magic ):
+            self.close()
+            raise ValueError("No waveform store file '" + file + "'")
+        dtype = dtype.decode()
+        size = array(dtype).itemsize * self.n
+        view = memoryview(self.map)
+        self.val = view[waveStore.HEADER.size:waveStore.HEADER.size+size].cast(dtype)
+        self.grad = view[waveStore.HEADER.size+size:waveStore.HEADER.size+2*size].cast(dtype)
+        if ( "big" == sys.byteorder ):  # little-endian columns, copied instead of mapped
+            (self.val, self.grad) = (array(dtype, self.val), array(dtype, self.grad))
+            self.val.byteswap()
+            self.grad.byteswap()
+    #*****************************
+
+
+    #*****************************
+    def close(self):
+        """
+        @note           releases mapping
+        """
+        self.val = None
+        self.grad = None
+        self.map.close()
+    #*****************************
+
+
+    #*****************************
+    def step(self, iterator, wave=None):
+        """
+        @note           reads sample, fractional iterators are interpolated linear
+
+        @param iterator sample number modulo period
+        @param wave     unused, interface of waves step functions
+        @rtype          tuple
+        @return         (next iterator, {'val': , 'grad': })
+        """
+        new = {}
+        pos = iterator if ( 0 <= iterator ) else iterator + self.n  # negative fractional iterator from random access
+        i = int(pos)
+        if ( i == pos ):
+            new['val'] = self.val[i] * self.valRes
+            new['grad'] = self.grad[i] * self.gradRes
+        else:
+            j = i+1 if ( i+1 < self.n ) else 0
+            frac = pos - i
+            new['val'] = (self.val[i] + frac*(self.val[j]-self.val[i])) * self.valRes
+            new['grad'] = self.grad[i] * self.gradRes
+        # next sample
+        iterator += 1
+        if ( iterator > self.n-1 ):
+            iterator -= self.n
+        return (iterator, new)
+    #*****************************
+
+
+    #*****************************
+    def block(self, iterator=0, count=1):
+        """
+        @note           reads samples as slices of the columns, wraps with period
+
+        @param iterator integer sample number of first sample, wrapped into period
+        @param count    number of samples
+        @rtype          dict
+        @return         {'val': buffer, 'grad': buffer}
+        """
+        new = {}
+        iterator = int(iterator) % self.n
+        for key, col, res in (('val', self.val, self.valRes), ('grad', self.grad, self.gradRes)):
+            if ( None != numpy ):
+                idx = numpy.mod(iterator + numpy.arange(count), self.n)
+                buf = numpy.asarray(col)[idx].astype(float) * res
+            else:
+                buf = array('d')
+                pos = iterator
+                while ( len(buf) < count ):
+                    end = min(self.n, pos + count - len(buf))
+                    buf.extend(col[pos:end] if ( 1.0 == res ) else [v*res for v in col[pos:end]])
+                    pos = 0 if ( end == self.n ) else end
+            new[key] = buf
+        return new
+    #*****************************
+
+#------------------------------------------------------------------------------
+
+
+
+#------------------------------------------------------------------------------
+class waveStore:
+    """
+    @note:  cache directory of precomputed waveforms, size bounded with least
+            recently used eviction
+    """
+
+    MAGIC = b"ATWGWAV1"
+    HEADER = struct.Struct("<8s1s7xQdddd")  # magic, dtype, pad, n, ts, tp, valRes, gradRes; 8 byte aligned
+
+    #*****************************
+    def __init__(self, path=None, maxBytes=1<<30, dtype='h', valRes=0.1, gradRes=1e-4, chunk=1<<16):
+        """
+        @note           initializes cache
+
+        @param path     cache directory, default '~/.cache/ATWG'
+        @param maxBytes size limit of all store files
+        @param dtype    sample type, 'h': int16 quantized, 'f': float32, 'd': float64
+        @param valRes   value quantization of int16 store, f.e. chamber resolution
+        @param gradRes  gradient quantization of int16 store in 1/sec
+        @param chunk    samples per calculation block, limits memory while build
+        """
+        # check
+        if ( dtype not in ('h', 'f', 'd') ):
+            raise ValueError("Unsupported store type '" + str(dtype) + "'")
+        # default dir
+        if ( None == path ):
+            path = os.path.join(os.path.expanduser("~"), ".cache", "ATWG")
+        os.makedirs(path, exist_ok=True)
+        # assign
+        self.path = path
+        self.maxBytes = maxBytes
+        self.dtype = dtype
+        self.valRes = valRes if ( 'h' == dtype ) else 1.0
+        self.gradRes = gradRes if ( 'h' == dtype ) else 1.0
+        self.chunk = chunk
+    #*****************************
+
+
+    #*****************************
+    def key(self, waveArgs=None):
+        """
+        @note           hash of waveform arguments and store format, files
+                        are identified with size and modification time
+
+        @param waveArgs waves.set() arguments
+        @rtype          string
+        @return         cache key
+        """
+        items = []
+        for k in sorted(waveArgs):
+            val = waveArgs[k]
+            if ( ('file' == k) and isinstance(val, str) and os.path.isfile(val) ):
+                stat = os.stat(val)
+                val = (os.path.abspath(val), stat.st_size, stat.st_mtime_ns)
+            items.append((k, val))
+        items.append(('store', self.dtype, self.valRes, self.gradRes))
+        return hashlib.sha256(repr(items).encode()).hexdigest()[:32]
+    #*****************************
+
+
+    #*****************************
+    def file(self, waveArgs=None):
+        """
+        @note           cache file of waveform
+
+        @param waveArgs waves.set() arguments
+        @rtype          string
+        @return         path to store file
+        """
+        return os.path.join(self.path, self.key(waveArgs) + ".wav")
+    #*****************************
+
+
+    #*****************************
+    def lookup(self, waveArgs=None):
+        """
+        @note           opens cached waveform
+
+        @param waveArgs waves.set() arguments
+        @rtype          storeTable
+        @return         mapped samples, None if not cached
+        """
+        file = self.file(waveArgs)
+        if ( False == os.path.isfile(file) ):
+            return None
+        os.utime(file)  # mark as recently used
+        return storeTable(file)
+    #*****************************
+
+
+    #*****************************
+    def build(self, wave=None, waveArgs=None):
+        """
+        @note           calculates one period blockwise and writes store file
+
+        @param wave     initialized waves instance
+        @param waveArgs waves.set() arguments
+        @rtype          storeTable
+        @return         mapped samples
+        """
+        # prepare
+        x = wave.waveDescr['x']
+        n = x['n']
+        if ( n != int(n) ):
+            raise ValueError("Store requires period as multiple of sample time")
+        file = self.file(waveArgs)
+        tmp = file + ".tmp." + str(os.getpid())
+        size = array(self.dtype).itemsize * n  # column size
+        # value and gradient column are written blockwise
+        try:
+            with open(tmp, 'wb') as fH:
+                fH.write(waveStore.HEADER.pack(waveStore.MAGIC, self.dtype.encode(), n, x['ts'], x['tp'], self.valRes, self.gradRes))
+                iterator = wave.iterInit
+                done = 0
+                while ( done < n ):
+                    count = min(self.chunk, n-done)
+                    (iterator, new) = wave.render_block(start=iterator, count=count)
+                    offset = waveStore.HEADER.size + done*array(self.dtype).itemsize
+                    fH.seek(offset)
+                    self.write(fH, new['val'], self.valRes)
+                    fH.seek(offset + size)
+                    self.write(fH, new['grad'], self.gradRes)
+                    done += count
+            # publish atomic
+            os.replace(tmp, file)
+        finally:
+            if ( os.path.isfile(tmp) ):     # failed render
+                os.remove(tmp)
+        # limit cache size
+        self.evict(keep=file)
+        return storeTable(file)
+    #*****************************
+
+
+    #*****************************
+    def write(self, fH=None, samples=None, res=1.0):
+        """
+        @note           converts samples to store type and appends to file
+
+        @param fH       file handle
+        @param samples  sample buffer
+        @param res      quantization
+        """
+        if ( 'h' == self.dtype ):
+            try:
+                buf = array('h', [round(v/res) for v in samples])
+            except OverflowError:
+                raise ValueError("Sample exceeds int16 store range, increase resolution")
+        else:
+            buf = array(self.dtype, samples)
+        if ( "big" == sys.byteorder ):
+            buf.byteswap()
+        buf.tofile(fH)
+    #*****************************
+
+
+    #*****************************
+    def evict(self, keep=None):
+        """
+        @note           deletes least recently used store files until cache
+                        fits into size limit
+
+        @param keep     file excluded from eviction
+        @rtype          int
+        @return         number of deleted files
+        """
+        files = []
+        total = 0
+        for name in os.listdir(self.path):
+            if ( False == name.endswith(".wav") ):
+                continue
+            stat = os.stat(os.path.join(self.path, name))
+            files.append((stat.st_mtime, stat.st_size, os.path.join(self.path, name)))
+            total += stat.st_size
+        deleted = 0
+        for mtime, size, file in sorted(files):
+            if ( total <= self.maxBytes ):
+                break
+            if ( file == keep ):
+                continue
+            os.remove(file)
+            total -= size
+            deleted += 1
+        return deleted
+    #*****************************
+
+#------------------------------------------------------------------------------
+
+
+
+#------------------------------------------------------------------------------
+def block(self, iterator, wave, count):
+    """
+    @note           block function of waves registry for stored waveforms,
+                    fractional iterators from random access are stepped
+
+    @param self     waves instance
+    @param iterator waveform iterator of first sample
+    @param wave     wave descriptor, table in 'store'
+    @param count    number of samples
+    @rtype          tuple
+    @return         (iterator after block, {'val': buffer, 'grad': buffer})
+    """
+    table = wave['store']
+    i = iterator if ( 0 <= iterator ) else iterator + table.n
+    if ( int(i) != i ):
+        val = array('d')
+        grad = array('d')
+        for k in range(count):
+            (iterator, new) = table.step(iterator)
+            val.append(new['val'])
+            grad.append(new['grad'])
+        return (iterator, {'val': val, 'grad': grad})
+    return (self.advance(iterator, count), table.block(iterator=int(i), count=count))
+#------------------------------------------------------------------------------
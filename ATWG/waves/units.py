@@ -0,0 +1,143 @@
+# -*- coding: utf-8 -*-
+"""
+@author:        Andreas Kaeberlein
+@copyright:     Copyright 2026
+@credits:       AKAE
+
+@license:       GPLv3
+@maintainer:    Andreas Kaeberlein
+@email:         andreas.kaeberlein@web.de
+
+@file:          units.py
+@date:          2026-10-17
+
+@note           time and temperature gradient string conversion, shared by
+                ATWG and the waveforms without importing ATWG
+"""
+
+
+
+#------------------------------------------------------------------------------
+import re       # number string separation
+#------------------------------------------------------------------------------
+
+
+
+#------------------------------------------------------------------------------
+TIME_TO_SEC = {'s': 1, 'sec': 1, 'm': 60, 'min': 60, 'h': 3600, 'hour': 3600, 'd': 86400, 'day': 86400, 'ms': 0.001}   # conversion dictory to seconds
+TIME_COL_SEP = "d:h:m:s"                                                                                                # colon separated time string prototype
+#------------------------------------------------------------------------------
+
+
+
+#------------------------------------------------------------------------------
+def time_to_sec(time=None):
+    """
+    @note           detects type of time and converts to seconds in numeric format
+                    supported time formats
+                      * d:h:m:s
+                      * 1d, 1h, 1m, 1s, 100ms
+
+    @param time     time in seconds or time string
+    @rtype          float
+    @return         time in seconds as numeric value
+    """
+    # check empty argument
+    if ( None == time ):
+        raise ValueError("No time string provided")
+    # check if numeric data is provided, treated as seconds
+    elif ( isinstance(time, float) or isinstance(time, int) ):
+        return time
+    # check for string
+    elif ( isinstance(time, str) ):
+        # check for pure numeric string, f.e. '0.1'
+        try:
+            return float(time)
+        except ValueError:
+            pass
+        # check for ':' separated string
+        if ( -1 != time.find(":") ):
+            # collects converted time
+            secs = 0
+            # prepare for positional to typ conv
+            colSep = TIME_COL_SEP.split(":")    # make to list
+            colSep.reverse()                    # alignment from seconds
+            # iterate over segments in reversed order. last element is always sec
+            for idx,item in enumerate(reversed(time.split(":"))):
+                # skip empty element
+                if ( 0 == len(item) ): continue
+                # convert to sec
+                try:
+                    secs = secs + float(item) * TIME_TO_SEC[colSep[idx]]    # accumulate and convert
+                except:
+                    raise Warning("Skipping positional element " + str(idx) + " with value '" + str(item) + "'")
+            # release result
+            return secs
+        # check if string contents elements from 'toSec'
+        elif ( time.replace(" ", "").replace(".", "").isalnum() ):
+            # prepare time
+            secs = 0
+            # separate into time substrings
+            for timePart in time.split(" "):    # split at blank at iterate
+                # https://stackoverflow.com/questions/12409894/fast-way-to-split-alpha-and-numeric-chars-in-a-python-string/12411196
+                # https://stackoverflow.com/questions/4703390/how-to-extract-a-floating-number-from-a-string
+                digUnit = re.findall(r"[a-zA-Z_]+|[-+]?\d*\.\d+|\d+", timePart)   # split number from unit
+                if ( 1 == len(digUnit) ):       # handle time w/o numeric multiplier
+                    digUnit.append(digUnit[0])  # save base time
+                    digUnit[0] = 1              # complete non time base part
+                elif ( 2 < len(digUnit) ):
+                    raise Warning("Time string part '" + timePart + "' not convertable, skip...")
+                    continue
+                # convert to seconds
+                try:
+                    secs = secs + float(digUnit[0]) * TIME_TO_SEC[digUnit[1]]
+                except:
+                    raise Warning ("Time unit '" + digUnit[1] + "' unknown")
+            # release result
+            return secs
+        # unrecognized time string
+        else:
+            raise ValueError("Unrecognized time string '" + time + "'")
+    # unkown data type
+    else:
+        raise TypeError("Unsupported data type '" + str(type(time)) + "'")
+#------------------------------------------------------------------------------
+
+
+#------------------------------------------------------------------------------
+def temp_grad_to_time(gradient=None, deltaTemp=None):
+    """
+    @note               converts given gradient or slew time to seconds
+                        supported formats:
+                          * 5C/min
+                          * 5C/5min
+                          * 1min
+
+    @param gradient     time in seconds, number to convert
+    @param deltaTemp    min/max temperature difference
+    @rtype              float
+    @return             slew time from min to max
+    """
+    # check for gradient
+    if ( None == gradient ):
+        raise ValueError("No temperature gradient given")
+    # check for gradient
+    if ( -1 != gradient.find("/") ):
+        # check
+        if ( None == deltaTemp ):
+            raise ValueError("Low/High Temperature value for total slew time required")
+        # split time and temp
+        temperature = gradient.split("/")[0]
+        timeVal = gradient.split("/")[1]
+        # prepare
+        timeVal = time_to_sec(time=timeVal)                             # convert to seconds
+        temperature = temperature.replace("C", "").replace("c", "")     # filter celsius
+        temperature = temperature.replace("K", "").replace("k", "")     # filter kelvin
+        # calc slew time
+        slewTime = (abs(deltaTemp) / float(temperature)) * timeVal
+    # slew time over complete range
+    else:
+        slewTime = time_to_sec(time=gradient)
+    # normal end
+    return slewTime
+#------------------------------------------------------------------------------
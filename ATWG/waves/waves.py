@@ -17,7 +17,23 @@
 
 
 #------------------------------------------------------------------------------
-import math     # sine
+import math                 # sine
+import types                # bind step functions
+from array import array     # numpy free sample buffers
+from .segments import segmentTable  # piecewise linear waveforms
+from .phasor import phasor          # incremental sine stepping
+from . import arbitrary             # breakpoint file waveform
+from . import composite             # combined waveforms
+from . import sequence              # test profile sequence
+from . import expr                  # expression waveform
+from . import stochastic            # seeded random waveforms
+from .store import waveStore        # precomputed waveforms
+from .store import block as storeBlock  # slices of precomputed waveforms
+from .slew import slewLimiter       # slew rate limited stepping
+try:
+    import numpy            # optional, speeds up block rendering
+except ImportError:
+    numpy = None
 #------------------------------------------------------------------------------
 
 
@@ -28,6 +44,8 @@ class waves:
     @note:  class to create numeric waveforms
     """
 
+    shapes = {} # registered waveform shapes, see register()
+
     #*****************************
     def __init__(self):
         """
@@ -35,7 +53,52 @@ class waves:
         """
         self.waveDescr = {} # descriptor of initializes waveform
         self.iterator = 0   # waveform iterator
+        self.iterInit = 0   # iterator after waveform init, time origin of at() and seek()
         self.waveArgs = {}  # not initialized
+        self.osc = None     # phasor oscillator for sine stepping
+        self.shape = None                   # registry entry of selected waveform
+        self.stepFunc = self.uninitialized  # bound step function of next()
+        self.evalFunc = self.uninitialized  # bound closed form step function
+    #*****************************
+
+
+    #*****************************
+    @classmethod
+    def register(cls, name=None, init=None, step=None, block=None, advance=None, cliArg=None, profile=False, period=False, help=""):
+        """
+        @note           registers a waveform shape, selectable with set(wave=name)
+                        and as CLI option '--name'
+
+        @param name     waveform name
+        @param init     init function, init(waves, **kwargs), returns (iterator, descriptor)
+        @param step     step function, step(waves, iterator, descriptor), returns (next iterator, {'val': , 'grad': })
+        @param block    optional block function, block(waves, iterator, descriptor, count), returns (iterator, {'val': buffer, 'grad': buffer}),
+                        numpy paths can differ from step in the last bit
+        @param advance  optional iterator function, advance(waves, iterator, steps, descriptor), default periodic with descriptor['x']['n']
+        @param cliArg   wave argument filled with CLI option value, None for flag options
+        @param profile  shape defines time base and temperature range, CLI passes no period and min/max are optional
+        @param period   profile shape with optional period 'tp', CLI passes period if given, endless without
+        @param help     CLI help text
+        @rtype          boolean
+        @return         True
+        """
+        # check
+        if ( (None == name) or (None == init) or (None == step) ):
+            raise ValueError("Waveform requires name, init and step function")
+        if ( name in cls.shapes ):
+            raise ValueError("Waveform '" + name + "' already registered")
+        # register
+        cls.shapes[name] = {'init': init, 'step': step, 'block': block, 'advance': advance, 'cliArg': cliArg, 'profile': profile, 'period': period, 'help': help}
+        return True
+    #*****************************
+
+
+    #*****************************
+    def uninitialized(self, *args, **kwargs):
+        """
+        @note           step function placeholder until set() selects a waveform
+        """
+        raise ValueError("Uninitialized waveform")
     #*****************************
 
 
@@ -61,39 +124,123 @@ class waves:
     #*****************************
 
 
+    #*****************************
+    def samples(self, t=0, ts=1):
+        """
+        @note           number of samples in time span, kept fractional if the
+                        time span is no multiple of the sample time. The waveform
+                        iterator keeps the remainder on wrap, the period error
+                        stays below one sample
+
+        @param t        time span
+        @param ts       sample time
+        @rtype          int, float
+        @return         number of samples
+        """
+        n = t / ts
+        if ( math.isclose(n, round(n), rel_tol=1e-9, abs_tol=1e-9) ):
+            return round(n)
+        return n
+    #*****************************
+
+
     #*****************************
     def set(self, **kwargs):
         """
         @note       selects waveform, and initializes waveform with proper arguments
 
-        @see        sine()
-        @see        trapezoid()
+        @param wave     waveform name, see register()
+        @param phasor   sine: next() rotates a phasor instead of sin/cos per sample
+        @param store    waveStore or True for default store, samples of one period are
+                        precomputed once and memory mapped from cache file
+        @param slew     {'rise': , 'fall': } in 1/sec, next() limits the setpoint change,
+                        at() and block() return the unlimited waveform
+        @see            sine()
+        @see            trapezoid()
 
         @return:    True
         """
         # prepare
         self.waveDescr = {}     # reset wave descriptor
         self.waveArgs = {}      # make invalid
+        self.osc = None         # closed form stepping
+        self.limit = None       # unlimited stepping
+        self.shape = None       # no waveform selected
+        self.stepFunc = self.uninitialized
+        self.evalFunc = self.uninitialized
         waveParam = {}          # for waveform construction
         # assign kwargs to dict
         for key, value in kwargs.items():
             # separate waveform description from waveform selection
-            if ( key != "wave" ):
+            if ( key not in ("wave", "phasor", "store", "slew") ):
                 waveParam[key] = value
             # assign to storage element
             self.waveArgs[key] = value
         # init waveform
-        if ( "sine" == self.waveArgs['wave'] ):
-            (self.iterator, self.waveDescr) = self.sine(**waveParam)        # sine
-        elif ( "trapezoid" == self.waveArgs['wave'] ):
-            (self.iterator, self.waveDescr) = self.trapezoid(**waveParam)   # trapezoid
-        else:
-            raise ValueError("Unsupported waveform '" + self.waveArgs['wave'] + "' requested")
+        if ( self.waveArgs.get('wave') not in self.shapes ):
+            raise ValueError("Unsupported waveform '" + str(self.waveArgs.get('wave')) + "' requested")
+        shape = self.shapes[self.waveArgs['wave']]
+        # precomputed waveform
+        store = self.waveArgs.get('store', None)
+        if ( (None != store) and (False != store) ):
+            if ( True == store ):
+                store = waveStore()     # default cache
+            storeArgs = {key: value for key, value in self.waveArgs.items() if key not in ("phasor", "store", "slew")}
+            table = store.lookup(storeArgs)
+            if ( None == table ):       # calculate and write once
+                (self.iterator, self.waveDescr) = shape['init'](self, **waveParam)
+                self.shape = shape
+                self.evalFunc = types.MethodType(shape['step'], self)
+                self.iterInit = self.iterator
+                table = store.build(wave=self, waveArgs=storeArgs)
+            # samples are counted from waveform init
+            self.waveDescr = {'x': {'ts': table.ts, 'tp': table.tp, 'n': table.n}, 'store': table}
+            self.iterator = 0
+            self.iterInit = 0
+            self.shape = dict(shape, block=storeBlock, advance=None)
+            self.evalFunc = table.step
+            self.stepFunc = table.step
+            self.set_slew()
+            return True
+        # init waveform
+        (self.iterator, self.waveDescr) = shape['init'](self, **waveParam)
+        # bind step function once
+        self.shape = shape
+        self.evalFunc = types.MethodType(shape['step'], self)
+        self.stepFunc = self.evalFunc
+        # incremental sine stepping
+        if ( True == self.waveArgs.get('phasor', False) ):
+            if ( "sine" != self.waveArgs['wave'] ):
+                raise ValueError("Phasor stepping requires sine waveform")
+            self.osc = phasor(wave=self.waveDescr)
+            self.stepFunc = self.osc.step
+        # time origin for random access
+        self.iterInit = self.iterator
+        self.set_slew()
         # normal end
         return True
     #*****************************
 
 
+    #*****************************
+    def set_slew(self):
+        """
+        @note       wraps step function with slew limiter if requested in set()
+
+        @rtype      boolean
+        @return     True if limited
+        """
+        slew = self.waveArgs.get('slew', None)
+        if ( None == slew ):
+            return False
+        if ( False == isinstance(slew, dict) ):
+            raise ValueError("Slew limits {'rise': , 'fall': } required")
+        self.limit = slewLimiter(func=self.stepFunc, ts=self.waveDescr['x']['ts'], rise=slew.get('rise', float('+inf')), fall=slew.get('fall', float('-inf')))
+        self.stepFunc = self.limit.step
+        return True
+    #*****************************
+
+
     #*****************************
     def next(self):
         """
@@ -101,24 +248,204 @@ class waves:
 
         @return     dict with new temperature and gradient
         """
-        # init
-        newVal = {}
-        # in case of non intinilaized waveform is waveArgs not avialable
-        try:
-            # dispatch
-            if ( "sine" == self.waveArgs['wave'] ):
-                (self.iterator, newVal) = self.sine(descr=(self.iterator,self.waveDescr))       # update
-            elif ( "trapezoid" == self.waveArgs['wave'] ):
-                (self.iterator, newVal) = self.trapezoid(descr=(self.iterator,self.waveDescr))  # update
-            else:
-                raise ValueError("Unsupported waveform")
-        except:
-            raise ValueError("Uninitialized waveform")
+        (self.iterator, newVal) = self.stepFunc(self.iterator, self.waveDescr)
         # return new vals
         return newVal
     #*****************************
 
 
+    #*****************************
+    def advance(self, iterator=0, steps=0):
+        """
+        @note           calculates the waveform iterator after a number of steps
+                        in closed form, identical to 'steps' calls of next()
+
+        @param iterator start iterator
+        @param steps    number of discrete time steps
+        @rtype          float
+        @return         iterator after steps
+        """
+        # shape specific
+        if ( None != self.shape['advance'] ):
+            return self.shape['advance'](self, iterator, steps, self.waveDescr)
+        # period length in steps
+        n = self.waveDescr['x']['n']
+        # go forward and wrap into [-1, n-1], same as next()
+        iterator = iterator + steps
+        if ( iterator > n-1 ):
+            iterator -= n * math.ceil((iterator-(n-1))/n)
+        elif ( iterator <= -1 ):
+            iterator += n * (math.floor((-1-iterator)/n) + 1)
+        return iterator
+    #*****************************
+
+
+    #*****************************
+    def position(self, t=None, idx=None):
+        """
+        @note           converts time or sample index since waveform init to
+                        waveform iterator
+
+        @param t        time in seconds since waveform init
+        @param idx      sample index since waveform init, first next() is zero
+        @rtype          float
+        @return         waveform iterator
+        """
+        # check
+        if ( None == self.shape ):
+            raise ValueError("Uninitialized waveform")
+        if ( (None == t) == (None == idx) ):
+            raise ValueError("Either time or sample index required")
+        # time to sample index
+        if ( None != t ):
+            idx = self.divide(t, self.waveDescr['x']['ts'])
+            if ( math.isclose(idx, round(idx), rel_tol=1e-9, abs_tol=1e-9) ):
+                idx = int(round(idx))   # keep integer iterator, f.e. t=0.3 with ts=0.1
+        if ( 0 > idx ):
+            raise ValueError("Only non-negative time allowed")
+        # release
+        return self.advance(iterator=self.iterInit, steps=idx)
+    #*****************************
+
+
+    #*****************************
+    def at(self, t=None, idx=None):
+        """
+        @note           random access to waveform, state is not changed
+
+        @param t        time in seconds since waveform init
+        @param idx      sample index since waveform init, first next() is zero
+        @rtype          dict
+        @return         dict with temperature and gradient
+        """
+        # waveform iterator
+        iterator = self.position(t=t, idx=idx)
+        # closed form value
+        (foo, newVal) = self.evalFunc(iterator, self.waveDescr)
+        # release
+        return newVal
+    #*****************************
+
+
+    #*****************************
+    def seek(self, t=None, idx=None):
+        """
+        @note           jumps in waveform, next() continues at given time
+
+        @param t        time in seconds since waveform init
+        @param idx      sample index since waveform init, first next() is zero
+        @rtype          boolean
+        @return         True
+        """
+        self.iterator = self.position(t=t, idx=idx)
+        return True
+    #*****************************
+
+
+    #*****************************
+    def block(self, start=None, count=1):
+        """
+        @note           renders a block of samples without changing the waveform state,
+                        values are bit identical to 'count' calls of next() without
+                        numpy, vectorized numpy functions (f.e. sin) can differ in the last bit
+
+        @param start    waveform iterator of first sample, None uses current iterator
+        @param count    number of samples in block
+        @rtype          dict
+        @return         {'val': buffer, 'grad': buffer}, numpy array or array('d')
+        """
+        # render and drop final iterator
+        (iterator, new) = self.render_block(start=start, count=count)
+        return new
+    #*****************************
+
+
+    #*****************************
+    def render(self, count=1):
+        """
+        @note           renders next 'count' samples and advances the waveform,
+                        equivalent to 'count' calls of next()
+
+        @param count    number of samples
+        @rtype          dict
+        @return         {'val': buffer, 'grad': buffer}, numpy array or array('d')
+        """
+        (self.iterator, new) = self.render_block(start=self.iterator, count=count)
+        return new
+    #*****************************
+
+
+    #*****************************
+    def render_block(self, start=None, count=1):
+        """
+        @note           calculates one period of the waveform with the step function
+                        and repeats them to the requested block length
+
+        @param start    waveform iterator of first sample, None uses current iterator
+        @param count    number of samples in block
+        @rtype          tuple
+        @return         (iterator after block, {'val': buffer, 'grad': buffer})
+        """
+        # check
+        if ( 0 > count ):
+            raise ValueError("Negative number of samples requested")
+        if ( None == self.shape ):
+            raise ValueError("Uninitialized waveform")
+        # prepare
+        if ( None == start ):
+            start = self.iterator
+        # shape specific block function
+        if ( None != self.shape['block'] ):
+            return self.shape['block'](self, start, self.waveDescr, count)
+        step = self.evalFunc
+        iterator = start
+        pos = []                # iterator before each sample of the period table
+        val = array('d')        # sample values
+        grad = array('d')       # gradients
+        # calc until waveform repeats, max. one period
+        while ( len(val) < count ):
+            pos.append(iterator)
+            (iterator, new) = step(iterator, self.waveDescr)
+            val.append(new['val'])
+            grad.append(new['grad'])
+            if ( iterator == start ):
+                break
+        # repeat period to requested length
+        period = len(val)
+        if ( period < count ):
+            reps, rest = divmod(count, period)
+            iterator = pos[rest]
+            if ( None != numpy ):
+                return (iterator, {'val': numpy.resize(numpy.frombuffer(val), count), 'grad': numpy.resize(numpy.frombuffer(grad), count)})
+            val = val*reps + val[:rest]
+            grad = grad*reps + grad[:rest]
+        # release
+        if ( (None != numpy) and (0 < period) ):
+            return (iterator, {'val': numpy.frombuffer(val), 'grad': numpy.frombuffer(grad)})
+        return (iterator, {'val': val, 'grad': grad})
+    #*****************************
+
+
+    #*****************************
+    def indices(self, iterator=0, count=1):
+        """
+        @note           vectorized iterators of the next 'count' samples, wrapped
+                        into the period as next() and advance(). Requires numpy
+
+        @param iterator waveform iterator of first sample
+        @param count    number of samples
+        @rtype          numpy array
+        @return         iterator per sample
+        """
+        n = self.waveDescr['x']['n']
+        idx = iterator + numpy.arange(count, dtype=float)
+        if ( (0 < count) and (idx[-1] > n-1) ):     # wraps
+            over = idx > n-1
+            idx[over] -= n * numpy.ceil((idx[over]-(n-1))/n)
+        return idx
+    #*****************************
+
+
     #*****************************
     def sine(self, descr=None, **kwargs):
         """
@@ -154,7 +481,7 @@ class waves:
             x = {}                              # waveforms time behaviour
             x['ts'] = optarg['ts']              # sample rate
             x['tp'] = optarg['tp']              # periode
-            x['n'] = round(x['tp']/x['ts'])     # number of steps for full periode
+            x['n'] = self.samples(x['tp'], x['ts']) # number of steps for full periode
             # value base of waveform
             y = {}
             y['amp'] = (optarg['highVal'] - optarg['lowVal']) / 2   # sine amplitude
@@ -178,12 +505,12 @@ class waves:
                 if ( True == optarg['pSlope'] ):
                     if ( 0.25*x['n'] < iterator <= 0.5*x['n'] ):        # shift to [0*n, 0.25*n]
                         iterator = 0.25*x['n'] - iterator
-                    elif ( 0.5*x['n'] < self.iterator <= 0.75*x['n'] ): # shift to [0.75*n, n]
+                    elif ( 0.5*x['n'] < iterator <= 0.75*x['n'] ):      # shift to [0.75*n, n]
                         iterator = 0.75*x['n'] + (0.75*x['n']-iterator)
                 else:
                     if ( 0 <= iterator <= 0.25*x['n']):                 # shift to [0.25*n, 0.5*n]
                         iterator = 0.25*x['n'] + (0.25*x['n'] - iterator)
-                    elif ( 0.75*x['n'] < self.iterator <= x['n']):      # shift to [0.5*n, 0.75*n]
+                    elif ( 0.75*x['n'] < iterator <= x['n']):           # shift to [0.5*n, 0.75*n]
                         iterator = 0.75*x['n'] - (iterator - 0.75*x['n'])
             # build waveform
             wave = {}
@@ -193,19 +520,69 @@ class waves:
             return (iterator, wave)
         # calculate next temp value
         else:
-            # disassemble descriptor
-            iterator, wave = descr
-            # calculate next time step
-            new = {}
-            new['val'] = wave['y']['ofs'] + wave['y']['amp']*(math.sin(2*math.pi*((iterator)*(float(1)/wave['x']['n']))))                       # calculate discrete sine value for n
-            new['grad'] = wave['y']['amp']*(2*math.pi*(float(1)/wave['x']['n']))*(math.cos(2*math.pi*((iterator)*(float(1)/wave['x']['n']))))   # calc gradient, derived discrete sine
-            # prepare for next calc
-            iterator += 1
-            # jump to sine start
-            if ( iterator > wave['x']['n']-1 ):
-                iterator -= wave['x']['n']
-            # assign to release tupple
-            return (iterator, new)
+            return self.sine_step(*descr)
+    #*****************************
+
+
+    #*****************************
+    def sine_step(self, iterator, wave):
+        """
+        @note           calculates sine value at iterator
+
+        @param iterator sine iterator
+        @param wave     wave descriptor, see sine()
+        @rtype          tuple
+        @return         (next iterator, {'val': , 'grad': })
+        """
+        # calculate next time step
+        new = {}
+        new['val'] = wave['y']['ofs'] + wave['y']['amp']*(math.sin(2*math.pi*((iterator)*(float(1)/wave['x']['n']))))                       # calculate discrete sine value for n
+        new['grad'] = (wave['y']['amp']*(2*math.pi*(float(1)/wave['x']['n']))/wave['x']['ts'])*(math.cos(2*math.pi*((iterator)*(float(1)/wave['x']['n']))))   # calc gradient per sec, derived discrete sine
+        # prepare for next calc
+        iterator += 1
+        # jump to sine start
+        if ( iterator > wave['x']['n']-1 ):
+            iterator -= wave['x']['n']
+        # assign to release tupple
+        return (iterator, new)
+    #*****************************
+
+
+    #*****************************
+    def sine_block(self, iterator, wave, count):
+        """
+        @note           vectorized sine_step(), block function of registry.
+                        Without numpy one loop with the terms of sine_step(),
+                        bit identical. numpy sin/cos can differ in the last bit
+
+        @param iterator sine iterator of first sample
+        @param wave     wave descriptor, see sine()
+        @param count    number of samples
+        @rtype          tuple
+        @return         (iterator after block, {'val': buffer, 'grad': buffer})
+        """
+        # python, same operation order as sine_step, bit identical
+        if ( None == numpy ):
+            (n, ofs, amp) = (wave['x']['n'], wave['y']['ofs'], wave['y']['amp'])
+            (sin, cos, w) = (math.sin, math.cos, 2*math.pi)
+            inv = float(1)/n
+            kGrad = amp*(w*inv)/wave['x']['ts']
+            last = n-1
+            val = array('d', bytes(8*count))
+            grad = array('d', bytes(8*count))
+            for i in range(count):
+                arg = w*(iterator*inv)
+                val[i] = ofs + amp*sin(arg)
+                grad[i] = kGrad*cos(arg)
+                iterator += 1
+                if ( iterator > last ):
+                    iterator -= n
+            return (iterator, {'val': val, 'grad': grad})
+        # numpy
+        arg = 2*math.pi*(self.indices(iterator, count)*(float(1)/wave['x']['n']))
+        val = wave['y']['ofs'] + wave['y']['amp']*numpy.sin(arg)
+        grad = (wave['y']['amp']*(2*math.pi*(float(1)/wave['x']['n']))/wave['x']['ts'])*numpy.cos(arg)
+        return (self.advance(iterator, count), {'val': val, 'grad': grad})
     #*****************************
 
 
@@ -254,7 +631,7 @@ class waves:
             x = {}                                      # waveforms time behavior
             x['ts'] = optarg['ts']                      # sample rate
             x['tp'] = optarg['tp']                      # period
-            x['n'] = round(optarg['tp']/optarg['ts'])   # number of steps for full period
+            x['n'] = self.samples(x['tp'], x['ts'])     # number of steps for full period
             # determine discrete time steps of waveform
             # duty cycle is given
             if ( False == math.isnan(optarg['dutyCycle']) ):
@@ -275,6 +652,10 @@ class waves:
             y['high'] = {'start': y['rise']['stop']+1, 'stop': y['rise']['stop']+1+step_high_n-1, 'grad': 0,                                                            'val': optarg['highVal']}    # high part
             y['fall'] = {'start': y['high']['stop']+1, 'stop': y['high']['stop']+1+step_fall_n-1, 'grad': self.divide(optarg['lowVal']-optarg['highVal'], step_fall_n), 'val': optarg['highVal']}    # fall part
             y['low']  = {'start': y['fall']['stop']+1, 'stop': y['fall']['stop']+1+step_low_n-1,  'grad': 0,                                                            'val': optarg['lowVal']}     # low part
+            # segment table for evaluation
+            seg = segmentTable(ts=x['ts'])
+            for part in ('rise', 'high', 'fall', 'low'):
+                seg.append(length=y[part]['stop']-y[part]['start']+1, val=y[part]['val'], grad=y[part]['grad'])
             # find start value of iterator
             if ( math.isnan(optarg['initVal']) ):
                 iterator = 0
@@ -293,27 +674,93 @@ class waves:
             wave = {}
             wave['x'] = x
             wave['y'] = y
+            wave['seg'] = seg
             return (iterator, wave)
         # calculate next step
         else:
-            # disassemble descriptor
-            iterator, wave = descr
-            # calc waveform
-            new = {}
-            for foo, y in wave['y'].items():
-                # match part of waveform
-                if ( y['start'] <= iterator <= y['stop'] ):
-                    new['val'] = y['val'] + y['grad'] * (iterator-y['start'])   # new value value
-                    new['grad'] = y['grad'] / wave['x']['ts']                   # gradient per sec
-            # inc wave iterator, prepare for next calc
-            iterator += 1
-            # jump to start
-            if ( iterator > wave['x']['n']-1 ):
-                iterator -= wave['x']['n']
-            # assign to release tupple
-            return (iterator, new)
+            return self.trapezoid_step(*descr)
+    #*****************************
+
+
     #*****************************
+    def trapezoid_step(self, iterator, wave):
+        """
+        @note           calculates trapezoid value at iterator
+
+        @param iterator trapezoid iterator
+        @param wave     wave descriptor, see trapezoid()
+        @rtype          tuple
+        @return         (next iterator, {'val': , 'grad': })
+        """
+        # calc waveform
+        new = {}
+        pos = iterator if ( 0 <= iterator ) else iterator + wave['x']['n']   # fractional iterator from random access
+        (new['val'], new['grad']) = wave['seg'].eval(pos)                     # value and gradient per sec
+        # inc wave iterator, prepare for next calc
+        iterator += 1
+        # jump to start
+        if ( iterator > wave['x']['n']-1 ):
+            iterator -= wave['x']['n']
+        # assign to release tupple
+        return (iterator, new)
+    #*****************************
+
+
+    #*****************************
+    def trapezoid_block(self, iterator, wave, count):
+        """
+        @note           vectorized trapezoid_step(), block function of registry.
+                        Without numpy constant runs of one segment are filled
+                        at once
 
+        @param iterator trapezoid iterator of first sample
+        @param wave     wave descriptor, see trapezoid()
+        @param count    number of samples
+        @rtype          tuple
+        @return         (iterator after block, {'val': buffer, 'grad': buffer})
+        """
+        # python, segment runs
+        if ( None == numpy ):
+            seg = wave['seg']
+            n = wave['x']['n']
+            val = array('d')
+            grad = array('d')
+            while ( len(val) < count ):
+                pos = iterator if ( 0 <= iterator ) else iterator + n   # fractional iterator from random access
+                i = seg.find(pos)
+                end = seg.start[i+1] if ( i+1 < len(seg) ) else seg.end
+                wrap = math.ceil(-iterator) if ( 0 > iterator ) else math.floor(n-1 - iterator) + 1     # samples until pos restarts
+                num = max(min(count - len(val), math.ceil(end - pos), wrap), 1)                         # until segment end or wrap
+                (start, v, g) = (seg.start[i], seg.val[i], seg.grad[i])
+                if ( 0 == g ):
+                    val.extend(array('d', [v]) * num)
+                else:
+                    val.extend([v + g * (p-start) for p in (pos + k for k in range(num))])
+                grad.extend(array('d', [seg.gradSec[i]]) * num)
+                iterator = self.advance(iterator, num)
+            return (iterator, {'val': val, 'grad': grad})
+        # numpy
+        idx = self.indices(iterator, count)
+        (val, grad) = wave['seg'].block(numpy.where(0 > idx, idx + wave['x']['n'], idx))  # fractional iterator from random access
+        return (self.advance(iterator, count), {'val': val, 'grad': grad})
+    #*****************************
+
+#------------------------------------------------------------------------------
+
+
+#------------------------------------------------------------------------------
+# build-in waveforms
+# numpy blocks are used for batch evaluation of long periods, f.e. preflight and plan
+vector = ( None != numpy )
+waves.register(name="sine",      init=waves.sine,      step=waves.sine_step,      block=waves.sine_block,      help="sine waveform")
+waves.register(name="trapezoid", init=waves.trapezoid, step=waves.trapezoid_step, block=waves.trapezoid_block, help="trapezoid waveform")
+waves.register(name="arbitrary", init=arbitrary.init, step=arbitrary.step, block=arbitrary.block if vector else None, cliArg="file", profile=True, help="breakpoint file (.csv, .yml, .bin) with time [s], temperature [C]")
+waves.register(name="composite", init=composite.init, step=composite.step, block=composite.render, advance=composite.advance, cliArg="file", profile=True, help="yaml file with tree of sum/product/min/max/clamp nodes over waveforms")
+waves.register(name="sequence",  init=sequence.init,  step=sequence.step,  block=sequence.block if vector else None, advance=sequence.advance, cliArg="file", profile=True, help="yaml file with ramp/soak/hold/sine/trapezoid/repeat steps")
+waves.register(name="expr",      init=expr.init,      step=expr.step,      block=expr.render, advance=expr.advance, cliArg="expr", profile=True, period=True, help="expression of time t, f.e. '25 + 10*sin(2*pi*t/1h)'")
+waves.register(name="randwalk",  init=stochastic.randwalk, step=stochastic.step, block=stochastic.render, cliArg="seed", help="bounded random walk, option value is seed")
+waves.register(name="noise",     init=stochastic.noise,    step=stochastic.step, block=stochastic.render, cliArg="seed", help="band limited noise, option value is seed")
+waves.register(name="dwell",     init=stochastic.dwell,    step=stochastic.step, block=stochastic.render, cliArg="seed", help="random dwell levels, option value is seed")
 #------------------------------------------------------------------------------
 
 #------------------------------------------------------------------------------
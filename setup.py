@@ -42,6 +42,7 @@ setuptools.setup(
     download_url = "https://pypi.org/project/ATWG/",
     packages=["ATWG",
               "ATWG.waves",
+              "ATWG.scheduler",
               "ATWG.driver",
               "ATWG.driver.espec",
               "ATWG.driver.sim",
@@ -0,0 +1,71 @@
+# -*- coding: utf-8 -*-
+"""
+@author:        Andreas Kaeberlein
+@copyright:     Copyright 2026
+@credits:       AKAE
+
+@license:       GPLv3
+@maintainer:    Andreas Kaeberlein
+@email:         andreas.kaeberlein@web.de
+
+@file:          phasor_benchmark.py
+@date:          2026-10-17
+
+@note           Benchmark and long run accuracy of phasor sine stepping
+                  run ./test/benchmark/phasor_benchmark.py [steps]
+"""
+
+
+
+#------------------------------------------------------------------------------
+# Standard
+import sys        # python path handling
+import os         # platform independent paths
+import time       # benchmark
+# Self
+sys.path.append(os.path.abspath((os.path.dirname(os.path.abspath(__file__)) + "/../../")))  # add project root to lib search path
+from ATWG.waves.waves import waves                                                         # Python Script under test
+#------------------------------------------------------------------------------
+
+
+
+#------------------------------------------------------------------------------
+if __name__ == '__main__':
+    # settings
+    steps = int(sys.argv[1]) if ( 1 < len(sys.argv) ) else int(1e7)     # number of compared steps
+    limit = 1e-9                                                        # allowed absolute error [C]
+    args = {'wave': "sine", 'ts': 1, 'tp': 2*steps, 'lowVal': -40, 'highVal': 150, 'initVal': 25}   # no period sync in run
+    # closed form
+    ref = waves()
+    ref.set(**args)
+    tstart = time.perf_counter()
+    for i in range(steps):
+        ref.next()
+    tref = time.perf_counter() - tstart
+    # phasor
+    dut = waves()
+    dut.set(phasor=True, **args)
+    tstart = time.perf_counter()
+    for i in range(steps):
+        dut.next()
+    tdut = time.perf_counter() - tstart
+    # accuracy, every step
+    ref.seek(idx=0)
+    dut.seek(idx=0)
+    errVal = 0
+    errGrad = 0
+    for i in range(steps):
+        a = ref.next()
+        b = dut.next()
+        errVal = max(errVal, abs(a['val']-b['val']))
+        errGrad = max(errGrad, abs(a['grad']-b['grad']))
+    # report
+    print("Steps          : " + str(steps))
+    print("next() closed  : " + "{:.3f} us/step".format(1e6*tref/steps))
+    print("next() phasor  : " + "{:.3f} us/step".format(1e6*tdut/steps))
+    print("max error val  : " + "{:.3e}".format(errVal))
+    print("max error grad : " + "{:.3e}".format(errGrad))
+    if ( (errVal > limit) or (errGrad > limit) ):
+        print("Error: phasor exceeds " + str(limit))
+        sys.exit(1)
+#------------------------------------------------------------------------------
@@ -0,0 +1,132 @@
+# -*- coding: utf-8 -*-
+"""
+@author:        Andreas Kaeberlein
+@copyright:     Copyright 2026
+@credits:       AKAE
+
+@license:       GPLv3
+@maintainer:    Andreas Kaeberlein
+@email:         andreas.kaeberlein@web.de
+
+@file:          atwgAsync_unittest.py
+@date:          2026-10-17
+
+@note           Unittest for ATWGAsync.py
+                  run ./test/unit/atwg/atwgAsync_unittest.py
+"""
+
+
+
+#------------------------------------------------------------------------------
+# Standard
+import sys        # python path handling
+import os         # platform independent paths
+import time       # concurrency check
+import asyncio    # event loop
+import unittest   # performs test
+# Self
+sys.path.append(os.path.abspath((os.path.dirname(os.path.abspath(__file__)) + "/../../../")))  # add project root to lib search path
+from ATWG.ATWGAsync import ATWGAsync                                                          # Python Script under test
+from ATWG.ATWG import ATWG                                                                    # sync reference
+#------------------------------------------------------------------------------
+
+
+
+#------------------------------------------------------------------------------
+class TestATWGAsync(unittest.TestCase):
+
+    #*****************************
+    def test_update(self):
+        """
+        @note   async update against sync generator
+        """
+        waveArg = {'ts': 1, 'tp': 600, 'wave': 'sine', 'lowVal': 10, 'highVal': 60, 'initVal': 30}
+        ref = ATWG()
+        self.assertTrue(ref.open(chamberArg={'chamber': 'SIM', 'port': ""}, waveArg=waveArg))
+        self.assertTrue(ref.start())
+        async def main():
+            dut = ATWGAsync()
+            self.assertTrue(await dut.open(chamberArg={'chamber': 'SIM', 'port': ""}, waveArg=waveArg))
+            self.assertTrue(await dut.start())
+            for i in range(100):
+                self.assertTrue(await dut.chamber_update())
+                self.assertTrue(ref.chamber_update())
+                self.assertEqual(dut.clima['set'], ref.clima['set'])
+                self.assertEqual(dut.clima['get']['temperature'], ref.clima['get']['temperature'])
+            self.assertEqual((await dut.measure())['temperature'], ref.measure()['temperature'])
+            self.assertEqual(await dut.setpoint_at(t=300), ref.setpoint_at(t=300))
+            self.assertIn("Tset", dut.status())
+            self.assertTrue(dut.preflight()['feasible'])
+            self.assertTrue(dut.swap(waveArg={'ts': 1, 'tp': 600, 'wave': 'sine', 'lowVal': 0, 'highVal': 80}))
+            self.assertTrue(await dut.stop())
+            self.assertEqual((await dut.measure())['temperature'], 30)     # start value of first waveform
+            self.assertTrue(await dut.close())
+            self.assertEqual(dut.chamber.requests, 2 + 2*100 + 2 + 1 + 2 + 1)
+        asyncio.run(main())
+        # exceptions
+        with self.assertRaises(ValueError) as cm:
+            asyncio.run(ATWGAsync().chamber_update())
+        self.assertEqual(str(cm.exception), "Interfaces not opened, call methode 'open'")
+        with self.assertRaises(ValueError) as cm:
+            ATWGAsync().select({'chamber': 'FOO'})
+        self.assertEqual(str(cm.exception), "Unsupported climate chmaber 'FOO' selected")
+    #*****************************
+
+
+    #*****************************
+    def test_pipeline(self):
+        """
+        @note   setpoint latency independent of measurement
+        """
+        async def main(pipeline):
+            dut = ATWGAsync()
+            dut.cfg_pipeline = pipeline
+            await dut.open(chamberArg={'chamber': 'SIM', 'port': "", 'latency': 0.05}, waveArg={'ts': 1, 'tp': 600, 'wave': 'sine', 'lowVal': 10, 'highVal': 60})
+            await dut.start()
+            set_clima = dut.chamber.set_clima
+            done = []
+            async def timed(clima=None):
+                await set_clima(clima=clima)
+                done.append(time.monotonic())
+            dut.chamber.set_clima = timed
+            start = time.monotonic()
+            await dut.chamber_update()
+            return (done[0] - start, time.monotonic() - start, dut.clima)
+        (setSeq, tickSeq, climaSeq) = asyncio.run(main(pipeline=False))
+        (setPipe, tickPipe, climaPipe) = asyncio.run(main(pipeline=True))
+        self.assertGreater(setSeq, 0.1)     # after measurement
+        self.assertLess(setPipe, 0.08)      # at deadline
+        self.assertGreater(tickPipe, 0.1)   # measurement afterwards
+        self.assertEqual(climaPipe['set'], climaSeq['set'])
+        self.assertEqual(climaPipe['get']['temperature'], climaPipe['set']['val'])
+    #*****************************
+
+
+    #*****************************
+    def test_run(self):
+        """
+        @note   many generators on one event loop
+        """
+        async def main():
+            duts = [ATWGAsync() for i in range(32)]
+            for dut in duts:
+                dut.cfg_tsample_sec = 0.05
+                await dut.open(chamberArg={'chamber': 'SIM', 'port': "", 'latency': 0.01}, waveArg={'ts': 1, 'tp': 600, 'wave': 'sine', 'lowVal': 10, 'highVal': 60})
+                await dut.start()
+            ui = []
+            start = time.monotonic()
+            stats = await asyncio.gather(*[dut.run(ticks=10, tick=ui.append) for dut in duts])
+            self.assertLess(time.monotonic() - start, 10*0.05 + 0.4)     # 32 chambers at 2*10ms per tick
+            self.assertEqual(len(ui), 32*10)
+            self.assertTrue(all(10 == stat['ticks'] for stat in stats))
+            self.assertTrue(all(10 == dut.wave.iterator - dut.wave.iterInit for dut in duts))
+        asyncio.run(main())
+    #*****************************
+
+#------------------------------------------------------------------------------
+
+
+#------------------------------------------------------------------------------
+if __name__ == '__main__':
+    unittest.main()
+#------------------------------------------------------------------------------
@@ -0,0 +1,152 @@
+# -*- coding: utf-8 -*-
+"""
+@author:        Andreas Kaeberlein
+@copyright:     Copyright 2026
+@credits:       AKAE
+
+@license:       GPLv3
+@maintainer:    Andreas Kaeberlein
+@email:         andreas.kaeberlein@web.de
+
+@file:          atwgFleet_unittest.py
+@date:          2026-10-17
+
+@note           Unittest for ATWGFleet.py
+                  run ./test/unit/atwg/atwgFleet_unittest.py
+"""
+
+
+
+#------------------------------------------------------------------------------
+# Standard
+import sys          # python path handling
+import os           # platform independent paths
+import io           # argparse error output
+import time         # concurrency check
+import asyncio      # event loop
+import tempfile     # fleet file
+import contextlib   # redirect stderr
+import unittest     # performs test
+# Self
+sys.path.append(os.path.abspath((os.path.dirname(os.path.abspath(__file__)) + "/../../../")))  # add project root to lib search path
+from ATWG.ATWGFleet import ATWGFleet                                                          # Python Script under test
+#------------------------------------------------------------------------------
+
+
+
+#------------------------------------------------------------------------------
+class TestATWGFleet(unittest.TestCase):
+
+    #*****************************
+    def test_load(self):
+        """
+        @note   chamber list from yaml file
+        """
+        with tempfile.TemporaryDirectory() as tmp:
+            file = os.path.join(tmp, "fleet.yml")
+            with open(file, 'w') as fH:
+                fH.write("sampleTime: 100ms\n")
+                fH.write("overrun: catchup\n")
+                fH.write("chambers:\n")
+                fH.write("  - name: oven1\n")
+                fH.write("    wave: --sine --minTemp=10 --maxTemp=60 --period=1h --sampleTime=10s\n")
+                fH.write("  - chamber: SIM\n")
+                fH.write("    latency: 20ms\n")
+                fH.write("    wave: {wave: trapezoid, lowVal: -10, highVal: 80, tp: 7200, tr: 1800, tf: 1800}\n")
+            dut = ATWGFleet()
+            self.assertEqual(dut.load(file=file), 2)
+        self.assertEqual(dut.cfg_tsample_sec, 0.1)
+        self.assertEqual(dut.cfg_overrun, "catchup")
+        self.assertEqual([member['name'] for member in dut.members], ["oven1", "SIM1"])
+        self.assertDictEqual(dut.members[0]['chamberArg'], {'chamber': "SIM", 'port': ""})
+        self.assertEqual(dut.members[0]['waveArg']['wave'], "sine")
+        self.assertEqual(dut.members[0]['waveArg']['tp'], 3600)
+        self.assertEqual(dut.members[0]['waveArg']['ts'], 0.1)      # one time grid
+        self.assertDictEqual(dut.members[1]['chamberArg'], {'chamber': "SIM", 'port': "", 'latency': 0.02})
+        self.assertDictEqual(dut.members[1]['waveArg'], {'wave': "trapezoid", 'lowVal': -10, 'highVal': 80, 'tp': 7200, 'tr': 1800, 'tf': 1800, 'ts': 0.1})
+        # exceptions
+        with self.assertRaises(ValueError) as cm:
+            dut.configure(cfg={'chambers': []})
+        self.assertEqual(str(cm.exception), "Fleet requires list of chambers")
+        with self.assertRaises(ValueError) as cm:
+            dut.configure(cfg={'chambers': [{'name': "a", 'wave': "--sine --minTemp=0 --maxTemp=1"}]*2})
+        self.assertEqual(str(cm.exception), "Duplicate chamber name 'a'")
+        with self.assertRaises(ValueError) as cm:
+            dut.configure(cfg={'chambers': [{'chamber': "SIM"}]})
+        self.assertEqual(str(cm.exception), "Missing wave of chamber 'SIM0'")
+        with self.assertRaises(ValueError) as cm:
+            with contextlib.redirect_stderr(io.StringIO()):
+                dut.configure(cfg={'chambers': [{'wave': "--foo"}]})
+        self.assertEqual(str(cm.exception), "Invalid wave of chamber 'chamber0'")
+        with self.assertRaises(ValueError) as cm:
+            dut.configure(cfg={'overrun': "drop", 'chambers': [{'wave': "--sine --minTemp=0 --maxTemp=1"}]})
+        self.assertEqual(str(cm.exception), "Unsupported overrun policy 'drop'")
+    #*****************************
+
+
+    #*****************************
+    def test_run(self):
+        """
+        @note   many chambers on one time grid
+        """
+        num = 40
+        dut = ATWGFleet()
+        dut.configure(cfg={'sampleTime': "50ms", 'chambers': [{'chamber': "SIM", 'latency': "10ms", 'wave': "--sine --minTemp=10 --maxTemp=60 --period=10m"}]*num})
+        ui = []
+        async def main():
+            self.assertEqual(await dut.open(), num)
+            start = time.monotonic()
+            stats = await dut.run(ticks=10, tick=lambda fleet: ui.append(fleet.stats['trips']['last']))
+            self.assertLess(time.monotonic() - start, 10*0.05 + 0.4)    # chambers in parallel, 2*10ms per tick
+            self.assertEqual(await dut.close(), num)
+            return stats
+        stats = asyncio.run(main())
+        self.assertEqual(ui, [2*num]*10)    # get and set per chamber
+        self.assertEqual(stats['ticks'], 10)
+        self.assertEqual(stats['failed'], 0)
+        self.assertDictEqual(stats['trips'], {'last': 2*num, 'max': 2*num, 'mean': 2*num, 'total': 20*num})
+        self.assertTrue(all(10 == member['atwg'].wave.iterator - member['atwg'].wave.iterInit for member in dut.members))
+        self.assertTrue(all("closed" == member['state'] for member in dut.members))
+        self.assertIn("Round trips: 80 last tick", dut.status())
+    #*****************************
+
+
+    #*****************************
+    def test_fail(self):
+        """
+        @note   failing chambers are dropped, others continue
+        """
+        dut = ATWGFleet()
+        wave = "--sine --minTemp=10 --maxTemp=60 --period=10m"
+        dut.configure(cfg={'sampleTime': 0.02, 'chambers': [{'chamber': "SIM", 'wave': wave}, {'chamber': "FOO", 'wave': wave}, {'chamber': "SIM", 'wave': wave}]})
+        async def lost():
+            raise ValueError("Chamber response timeout")
+        def tick(fleet):
+            if ( 3 == fleet.stats['ticks'] ):
+                fleet.members[2]['atwg'].chamber.get_clima = lost
+        async def main():
+            self.assertEqual(await dut.open(), 2)
+            self.assertEqual(dut.members[1]['state'], "failed")
+            self.assertEqual(dut.members[1]['error'], "Unsupported climate chmaber 'FOO' selected")
+            return await dut.run(ticks=10, tick=tick)
+        stats = asyncio.run(main())
+        self.assertEqual(stats['ticks'], 10)
+        self.assertEqual(stats['failed'], 2)
+        self.assertEqual([member['state'] for member in dut.members], ["run", "failed", "failed"])
+        self.assertEqual(dut.members[2]['error'], "Chamber response timeout")
+        self.assertEqual(dut.members[0]['atwg'].wave.iterator - dut.members[0]['atwg'].wave.iterInit, 10)
+        self.assertIn("Error: Chamber response timeout", dut.status())
+        self.assertIn("Running    : 1 of 3", dut.status())
+        self.assertEqual(asyncio.run(dut.close()), 1)
+        # all chambers failed, loop ends
+        dut.configure(cfg={'chambers': [{'chamber': "FOO", 'wave': wave}]})
+        self.assertEqual(asyncio.run(dut.main(ticks=10))['ticks'], 0)
+    #*****************************
+
+#------------------------------------------------------------------------------
+
+
+#------------------------------------------------------------------------------
+if __name__ == '__main__':
+    unittest.main()
+#------------------------------------------------------------------------------
@@ -22,9 +22,15 @@
 import sys        # python path handling
 import os         # platform independent paths
 import unittest   # performs test
+import math       # pi
+import json       # plan output
+import tempfile   # preview file
+import io         # captured cli error
+import contextlib # redirect stderr
 # Self
 sys.path.append(os.path.abspath((os.path.dirname(os.path.abspath(__file__)) + "/../../../")))   # add project root to lib search path
 from ATWG.ATWG import ATWG                                                                      # Python Script under test
+from ATWG.scheduler.scheduler import scheduler                                                  # control loop timing
 #------------------------------------------------------------------------------
 
 
@@ -67,6 +73,9 @@ class TestATWG(unittest.TestCase):
         self.assertEqual(dut.time_to_sec("h"), 3600)
         self.assertEqual(dut.time_to_sec("min"), 60)
         self.assertEqual(dut.time_to_sec("sec"), 1)
+        # sub-second
+        self.assertEqual(dut.time_to_sec("100ms"), 0.1)
+        self.assertEqual(dut.time_to_sec("0.25"), 0.25)
     #*****************************
     
     
@@ -91,6 +100,11 @@ class TestATWG(unittest.TestCase):
         self.assertEqual(dut.sec_to_time(0), "0")
         self.assertEqual(dut.sec_to_time(61), "1m 1s")
         self.assertEqual(dut.sec_to_time(61.5), "1m 1.5s")
+        self.assertEqual(dut.sec_to_time(0.5), "0.5s")
+        self.assertEqual(dut.sec_to_time(90.1), "1m 30.1s")         # no float noise of sub-second sample times
+        self.assertEqual(dut.sec_to_time(3600.3), "1h 0.3s")        #
+        self.assertEqual(dut.sec_to_time(3*0.1), "0.3s")            #
+        self.assertEqual(dut.sec_to_time(7200.0), "2h")             #
         # convert to string, colomn based
         self.assertEqual(dut.sec_to_time(sec=129731, sep=":"), "1:12:2:11")
     #*****************************
@@ -124,6 +138,22 @@ class TestATWG(unittest.TestCase):
         chamberArg, waveArg = dut.parse_cli(["--sine", "--riseTime=5sec", "--minTemp=5C", "--maxTemp=10c", "--chamber=ESPEC_SH641"])
         self.assertDictEqual(waveArg, {'ts': 1, 'tp': 3600, 'wave': 'sine', 'lowVal': 5, 'highVal': 10, 'tr': 5, 'initVal': 10})
         self.assertDictEqual(chamberArg, {'chamber': 'ESPEC_SH641', 'port': ""})
+        # exception: more then one waveform
+        with self.assertRaises(ValueError) as cm:
+            dut.parse_cli(["--sine", "--trapezoid", "--minTemp=5C", "--maxTemp=10c"])
+        self.assertEqual(str(cm.exception), "Multiple waveform selected")
+        # profile waveform, min/max optional
+        chamberArg, waveArg = dut.parse_cli(["--arbitrary=profile.csv", "--startTemp=30"])
+        self.assertDictEqual(waveArg, {'ts': 1, 'wave': 'arbitrary', 'file': 'profile.csv', 'initVal': 30})
+        # sample time
+        chamberArg, waveArg = dut.parse_cli(["--sine", "--minTemp=5C", "--maxTemp=10c", "--sampleTime=100ms"])
+        self.assertEqual((waveArg['ts'], dut.cfg_tsample_sec), (0.1, 0.1))
+        # resampled log
+        chamberArg, waveArg = dut.parse_cli(["--arbitrary=log.bin", "--resample=cubic", "--gapTime=5m"])
+        self.assertDictEqual(waveArg['resample'], {'method': 'cubic', 'gap': 300})
+        with self.assertRaises(ValueError) as cm:
+            dut.parse_cli(["--sine", "--minTemp=5C", "--maxTemp=10c", "--resample=linear"])
+        self.assertEqual(str(cm.exception), "Resampling requires arbitrary waveform")
     #*****************************
     
     
@@ -186,6 +216,233 @@ class TestATWG(unittest.TestCase):
     #*****************************
     
     
+    #*****************************
+    def test_preflight(self):
+        """
+        @note   tests slew rate and rating check against chamber
+        """
+        # init values
+        dut = ATWG()
+        # sim chamber without limits
+        self.assertTrue(dut.open(chamberArg={'chamber': 'SIM', 'port': ""}, waveArg={'ts': 1, 'tp': 3600, 'wave': 'trapezoid', 'tr': 60, 'tf': 60, 'dutyCycle': 0.5, 'lowVal': 10, 'highVal': 60, 'slew': True}))
+        self.assertDictEqual(dut.slew_limits(), {'rise': float('inf'), 'fall': float('-inf')})
+        rpt = dut.preflight()
+        self.assertTrue(rpt['feasible'])
+        self.assertEqual(rpt['samples'], 3600)
+        self.assertAlmostEqual(rpt['rise']['max'], 50/60)
+        self.assertEqual(len(dut.compress()), 2*60+1)    # every ramp sample changes setpoint
+        self.assertTrue(dut.start())
+        self.assertIsNotNone(dut.wave.limit)
+    #*****************************
+
+
+    #*****************************
+    def test_plan(self):
+        """
+        @note   tests dry run without chamber interface
+        """
+        # cyclic mode, chamber is not opened
+        dut = ATWG()
+        (chamberArgs, waveArgs) = dut.parse_cli(["--sine", "--chamber=ESPEC_SH641", "--minTemp=10", "--maxTemp=60", "--period=2h", "--plan"])
+        self.assertEqual(dut.cfg_plan, "text")
+        plan = dut.plan(chamberArg=chamberArgs, waveArg=waveArgs)
+        self.assertFalse(dut.chamber.isOpen)
+        self.assertEqual(plan['chamber'], "ESPEC_SH641")
+        self.assertEqual(plan['mode'], "cyclic")
+        self.assertEqual(plan['duration'], 7200)
+        self.assertEqual(plan['samples'], 7200)
+        self.assertEqual(plan['changes'], len(dut.changes))
+        self.assertDictEqual(plan['calls'], {'get': 7200, 'set': 7200})
+        self.assertDictEqual(plan['commands'], {'get': 2*7200, 'set': plan['changes'], 'total': 2*7200+plan['changes']})
+        self.assertAlmostEqual(plan['gradient']['rise'], 25*2*math.pi/7200, places=6)
+        self.assertDictEqual(plan['range'], {'min': 10, 'max': 60})
+        self.assertTrue(plan['feasible'])
+        self.assertIn("Feasible   : yes", dut.plan_text(plan=plan))
+        # event mode, exceeds slew rate
+        (chamberArgs, waveArgs) = dut.parse_cli(["--sine", "--chamber=ESPEC_SH641", "--minTemp=-60", "--maxTemp=60", "--period=1h", "--event", "--plan=json"])
+        self.assertEqual(dut.cfg_plan, "json")
+        plan = dut.plan(chamberArg=chamberArgs, waveArg=waveArgs)
+        self.assertDictEqual(plan['calls'], {'get': 360, 'set': plan['changes']})
+        self.assertFalse(plan['feasible'])
+        self.assertEqual(plan['below'], len([i for i in range(3600) if ( -40 > dut.wave.at(idx=i)['val'] )]))
+        self.assertLess(0, plan['violations']['rise'])
+        self.assertEqual(json.loads(dut.plan_text(plan=plan, fmt="json"))['feasible'], False)
+        # infinite values in json
+        (chamberArgs, waveArgs) = dut.parse_cli(["--sine", "--minTemp=10", "--maxTemp=60", "--plan=json"])
+        plan = json.loads(dut.plan_text(plan=dut.plan(chamberArg=chamberArgs, waveArg=waveArgs), fmt="json"))
+        self.assertDictEqual(plan['limits'], {'rise': None, 'fall': None})
+        self.assertEqual(plan['commands']['total'], 0)
+        # exception
+        with self.assertRaises(ValueError) as cm:
+            dut.plan_text(plan=plan, fmt="xml")
+        self.assertEqual(str(cm.exception), "Unsupported plan format 'xml'")
+    #*****************************
+
+
+    #*****************************
+    def test_preview(self):
+        """
+        @note   tests waveform preview without chamber interface
+        """
+        dut = ATWG()
+        with tempfile.TemporaryDirectory() as tmp:
+            file = os.path.join(tmp, "preview.csv")
+            (chamberArgs, waveArgs) = dut.parse_cli(["--sine", "--chamber=ESPEC_SH641", "--minTemp=10", "--maxTemp=60", "--period=1d", "--preview=" + file])
+            self.assertEqual(dut.cfg_preview, file)
+            num = dut.preview(chamberArg=chamberArgs, waveArg=waveArgs, file=dut.cfg_preview)
+            self.assertTrue(1900 < num <= 2000)     # 87 samples per bucket
+            self.assertFalse(dut.chamber.isOpen)
+            with open(file, 'r') as fH:
+                self.assertEqual(len(fH.readlines()), 1+num)
+        dut.parse_cli(["--sine", "--minTemp=10", "--maxTemp=60"])
+        self.assertIsNone(dut.cfg_preview)
+        # unsupported format is a cli error
+        with contextlib.redirect_stderr(io.StringIO()) as err:
+            with self.assertRaises(SystemExit) as cm:
+                dut.parse_cli(["--sine", "--minTemp=10", "--maxTemp=60", "--preview=out.png"])
+        self.assertEqual(cm.exception.code, 2)
+        self.assertIn("error: argument --preview: unsupported format 'out.png', use .csv, .svg", err.getvalue())
+        # expression is periodic with --period, endless without
+        (chamberArgs, waveArgs) = dut.parse_cli(["--expr=25+t/60", "--period=10m", "--plan"])
+        self.assertEqual(waveArgs['tp'], 600)
+        self.assertEqual(dut.plan(chamberArg=chamberArgs, waveArg=waveArgs)['samples'], 600)
+        self.assertNotIn('tp', dut.parse_cli(["--expr=25+t/60"])[1])
+        for opt in ("--plan", "--preview=out.csv"):
+            with contextlib.redirect_stderr(io.StringIO()) as err:
+                with self.assertRaises(SystemExit) as cm:
+                    dut.parse_cli(["--expr=25+t/60", opt])
+            self.assertEqual(cm.exception.code, 2)
+            self.assertIn("error: argument " + opt.split("=")[0] + ": endless waveform '--expr', use --period", err.getvalue())
+    #*****************************
+
+
+    #*****************************
+    def test_stochastic(self):
+        """
+        @note   tests random waveform with chamber slew rate
+        """
+        # init values
+        dut = ATWG()
+        (chamberArgs, waveArgs) = dut.parse_cli(["--randwalk=5", "--minTemp=10", "--maxTemp=60", "--period=1d"])
+        self.assertEqual(waveArgs['wave'], "randwalk")
+        self.assertEqual(waveArgs['seed'], "5")
+        self.assertTrue(dut.open(chamberArg={'chamber': 'SIM', 'port': ""}, waveArg=waveArgs))
+        self.assertEqual(dut.wave.waveDescr['y']['rise'], float('inf'))   # sim chamber without limits
+        self.assertTrue(dut.preflight()['feasible'])
+        # chamber slew rates, ramps below limit
+        for cli in (["--dwell=42", "--minTemp=-40", "--maxTemp=85"], ["--dwell=42", "--minTemp=20", "--maxTemp=30"]):
+            plan = dut.plan(chamberArg={'chamber': 'ESPEC_SH641', 'port': ""}, waveArg=dut.parse_cli(cli)[1])
+            self.assertTrue(plan['feasible'])
+            self.assertLess(plan['gradient']['rise'], plan['limits']['rise'])
+    #*****************************
+
+
+    #*****************************
+    def test_event(self):
+        """
+        @note   tests event driven setpoint update
+        """
+        # init values
+        dut = ATWG()
+        dut.parse_cli(["--sine", "--minTemp=10", "--maxTemp=60", "--period=1d", "--event", "--pollTime=1m"])
+        self.assertTrue(dut.cfg_event)
+        self.assertEqual(dut.cfg_tpoll_sec, 60)
+        self.assertTrue(dut.open(chamberArg={'chamber': 'SIM', 'port': ""}, waveArg={'ts': 1, 'tp': 86400, 'wave': 'sine', 'lowVal': 10, 'highVal': 60}))
+        self.assertTrue(dut.start())
+        # one period with change points only
+        t = 0
+        writes = 0
+        setpoints = []
+        while ( t < 86400 ):
+            tnext = dut.setpoint_at(t=t)
+            self.assertGreater(tnext, t)
+            setpoints.append(round(dut.clima['set']['val'], 2))
+            writes += 1
+            t = tnext
+        self.assertEqual(t, 86400)
+        self.assertEqual(writes, len(dut.changes))
+        self.assertGreater(dut.changes.ratio(), 8)    # sim chamber resolves 0.01 C
+        self.assertTrue(all(a != b for a, b in zip(setpoints, setpoints[1:])))
+        self.assertEqual(dut.setpoint_at(t=0.5), dut.changes.time[1])
+        self.assertEqual(dut.measure()['temperature'], dut.clima['get']['temperature'])
+        # fractional period, no drift
+        self.assertTrue(dut.open(chamberArg={'chamber': 'SIM', 'port': ""}, waveArg={'ts': 1, 'tp': 600.5, 'wave': 'sine', 'lowVal': 10, 'highVal': 60}))
+        self.assertEqual(dut.setpoint_at(t=0), dut.changes.time[1])
+        for k in (1, 2, 1000):
+            self.assertEqual(dut.next_change(t=k*600.5), k*600.5 + dut.changes.time[1])
+        # endless waveform
+        self.assertTrue(dut.open(chamberArg={'chamber': 'SIM', 'port': ""}, waveArg={'ts': 1, 'wave': 'expr', 'expr': "t"}))
+        self.assertEqual(dut.setpoint_at(t=2.5), 3)
+    #*****************************
+
+
+    #*****************************
+    def test_swap(self):
+        """
+        @note   tests waveform replacement with phase continuity
+        """
+        # running sine
+        dut = ATWG()
+        self.assertTrue(dut.open(chamberArg={'chamber': 'SIM', 'port': ""}, waveArg={'ts': 1, 'tp': 3600, 'wave': 'sine', 'lowVal': 10, 'highVal': 60}))
+        self.assertTrue(dut.start())
+        for i in range(600):
+            self.assertTrue(dut.chamber_update())
+        last = dut.clima['set']
+        self.assertGreater(last['grad'], 0)
+        # swap without chamber request
+        (get_clima, set_clima) = (dut.chamber.get_clima, dut.chamber.set_clima)
+        (dut.chamber.get_clima, dut.chamber.set_clima) = (None, None)
+        self.assertTrue(dut.swap(waveArg={'ts': 1, 'tp': 7200, 'wave': 'trapezoid', 'lowVal': 0, 'highVal': 80, 'tr': 3600, 'tf': 1800, 'dutyCycle': 0.5}))
+        (dut.chamber.get_clima, dut.chamber.set_clima) = (get_clima, set_clima)
+        self.assertTrue(dut.chamber_update())
+        self.assertAlmostEqual(dut.clima['set']['val'], last['val'], delta=80/3600)     # one trapezoid step
+        self.assertGreater(dut.clima['set']['grad'], 0)                                 # same slope direction
+        # falling slope
+        for i in range(3600):
+            self.assertTrue(dut.chamber_update())
+        last = dut.clima['set']
+        self.assertLess(last['grad'], 0)
+        self.assertTrue(dut.swap(waveArg={'ts': 1, 'tp': 600, 'wave': 'sine', 'lowVal': 0, 'highVal': 80}))
+        self.assertTrue(dut.chamber_update())
+        self.assertAlmostEqual(dut.clima['set']['val'], last['val'], delta=80*3.15/600)
+        self.assertLess(dut.clima['set']['grad'], 0)
+        # failed swap keeps active waveform
+        wave = dut.wave
+        with self.assertRaises(ValueError):
+            dut.swap(waveArg={'ts': 1, 'tp': 60, 'wave': 'trapezoid', 'lowVal': 0, 'highVal': 80, 'tr': 60, 'tf': 60, 'dutyCycle': 0.5})
+        self.assertIs(dut.wave, wave)
+        # event mode time base starts with swap
+        self.assertTrue(dut.swap(waveArg={'ts': 1, 'tp': 3600, 'wave': 'sine', 'lowVal': 0, 'highVal': 80}, t=5000))
+        val = dut.clima['set']['val']
+        self.assertGreater(dut.setpoint_at(t=5000), 5000)
+        self.assertEqual(dut.clima['set']['val'], dut.wave.at(idx=0)['val'])
+        self.assertAlmostEqual(dut.clima['set']['val'], val, delta=80*3.15/3600)
+        self.assertEqual(dut.setpoint_at(t=5000+0.5), 5000+dut.changes.time[1])
+        # setpoint outside of new waveform
+        wave = dut.wave
+        with self.assertRaises(ValueError) as cm:
+            dut.swap(waveArg={'ts': 1, 'tp': 3600, 'wave': 'sine', 'lowVal': -40, 'highVal': 0})
+        self.assertRegex(str(cm.exception), r"^Swap jumps from \d+\.\d\d to 0\.00 °C, setpoint outside of waveform$")
+        self.assertIs(dut.wave, wave)
+        # sub-second sample time
+        dut = ATWG()
+        self.assertTrue(dut.open(chamberArg={'chamber': 'SIM', 'port': ""}, waveArg={'ts': 0.1, 'tp': 600, 'wave': 'sine', 'lowVal': 10, 'highVal': 60}))
+        for i in range(1000):
+            self.assertTrue(dut.chamber_update())
+        last = dut.clima['set']
+        self.assertTrue(dut.swap(waveArg={'ts': 0.1, 'tp': 300, 'wave': 'sine', 'lowVal': 0, 'highVal': 80}))
+        self.assertTrue(dut.chamber_update())
+        self.assertAlmostEqual(dut.clima['set']['val'], last['val'], delta=40*2*math.pi/3000)    # one sample step of new sine
+        with self.assertRaises(ValueError) as cm:
+            dut.swap(waveArg={'ts': 0.1, 'tp': 300, 'wave': 'sine', 'lowVal': 0, 'highVal': 20})
+        self.assertRegex(str(cm.exception), r"^Swap jumps from \d+\.\d\d to 20\.00 °C, setpoint outside of waveform$")
+        # exception
+        with self.assertRaises(ValueError) as cm:
+            ATWG().swap(waveArg={'wave': 'sine'})
+        self.assertEqual(str(cm.exception), "Interfaces not opened, call methode 'open'")
+    #*****************************
+
+
     #*****************************
     def test_stop(self):
         """
@@ -196,6 +453,14 @@ class TestATWG(unittest.TestCase):
         # check, initVal added cause default comes from parse_cli
         self.assertTrue(dut.open(chamberArg={'chamber': 'SIM', 'port': ""}, waveArg={'ts': 1, 'tp': 3600, 'wave': 'sine', 'initVal': 25}))
         self.assertTrue(dut.stop())
+        # start value of first waveform after swap
+        self.assertTrue(dut.start())
+        for i in range(600):
+            self.assertTrue(dut.chamber_update())
+        self.assertTrue(dut.swap(waveArg={'ts': 1, 'tp': 600, 'wave': 'sine', 'lowVal': 0, 'highVal': 80}))
+        self.assertNotEqual(dut.wave.waveArgs['initVal'], 25)
+        self.assertTrue(dut.stop())
+        self.assertEqual(dut.chamber.get_clima()['temperature'], 25)
     #*****************************
     
     
@@ -232,9 +497,66 @@ class TestATWG(unittest.TestCase):
         exp += "Press 'CTRL + C' for exit\n"
         # test & compare
         self.assertEqual(dut.status(), exp)
+        # control loop timing
+        dut.parse_cli(["--sine", "--minTemp=10C", "--maxTemp=60C", "--overrun=adapt"])
+        dut.sched = scheduler(period=1, policy=dut.cfg_overrun)
+        dut.sched.stats['period'] = 3
+        dut.sched.stats['overruns'] = 1
+        dut.sched.stats['cost']['max'] = 2.5
+        self.assertIn("  Timing\n    Sample   : 3s (adapted from 1s)\n    Cost     : 0.0 ms (mean 0.0, max 2500.0)\n    Overruns : 1 (skipped 0 ticks)\n", dut.status())
     #*****************************
     
     
+    #*****************************
+    def test_worker(self):
+        """
+        @note   chamber I/O in background thread
+        """
+        dut = ATWG()
+        chamberArgs, waveArgs = dut.parse_cli(["--sine", "--minTemp=10C", "--maxTemp=60C", "--startTemp=30C", "--worker"])
+        self.assertTrue(dut.cfg_worker)
+        self.assertTrue(dut.open(chamberArg=chamberArgs, waveArg=waveArgs))
+        self.assertEqual(dut.chamber.info()['name'], "SIM")
+        self.assertTrue(dut.start())
+        for i in range(10):
+            self.assertTrue(dut.chamber_update())
+        dut.chamber.flush()
+        self.assertEqual(dut.chamber.driver.last_set_temp, dut.clima['set']['val'])
+        dut.measure()                           # requests next measurement
+        dut.chamber.flush()
+        self.assertEqual(dut.measure()['temperature'], dut.clima['set']['val'])
+        self.assertIn("  Interface\n    Queue    : ", dut.status())
+        self.assertTrue(dut.stop())
+        self.assertTrue(dut.close())
+        self.assertEqual(dut.chamber.driver.last_set_temp, 30)
+    #*****************************
+
+
+    #*****************************
+    def test_pipeline(self):
+        """
+        @note   setpoint written before measurement
+        """
+        ref = ATWG()
+        dut = ATWG()
+        chamberArgs, waveArgs = dut.parse_cli(["--sine", "--minTemp=10C", "--maxTemp=60C", "--startTemp=30C", "--pipeline"])
+        self.assertTrue(dut.cfg_pipeline)
+        for atwg in (ref, dut):
+            self.assertTrue(atwg.open(chamberArg=chamberArgs, waveArg=waveArgs))
+            self.assertTrue(atwg.start())
+            atwg.log = []
+            get_clima, set_clima = atwg.chamber.get_clima, atwg.chamber.set_clima
+            atwg.chamber.get_clima = lambda get_clima=get_clima, log=atwg.log: log.append("get") or get_clima()
+            atwg.chamber.set_clima = lambda clima, set_clima=set_clima, log=atwg.log: log.append("set") or set_clima(clima=clima)
+            for i in range(3):
+                self.assertTrue(atwg.chamber_update())
+        self.assertEqual(ref.log, ["get", "set"]*3)
+        self.assertEqual(dut.log, ["set", "get"]*3)
+        self.assertEqual(dut.clima['set'], ref.clima['set'])
+        self.assertEqual(dut.clima['get']['temperature'], dut.clima['set']['val'])   # measured after write
+    #*****************************
+
+
     #*****************************
     def test_close(self):
         """
@@ -0,0 +1,133 @@
+# -*- coding: utf-8 -*-
+"""
+@author:        Andreas Kaeberlein
+@copyright:     Copyright 2026
+@credits:       AKAE
+
+@license:       GPLv3
+@maintainer:    Andreas Kaeberlein
+@email:         andreas.kaeberlein@web.de
+
+@file:          worker_unittest.py
+@date:          2026-10-17
+
+@note           Unittest for worker.py
+                  run ./test/unit/driver/worker_unittest.py
+"""
+
+
+
+#------------------------------------------------------------------------------
+# Libs
+import sys        # python path handling
+import os         # platform independent paths
+import time       # slow chamber
+import unittest   # performs test
+# Self, DUT
+sys.path.append(os.path.abspath((os.path.dirname(os.path.abspath(__file__)) + "/../../../")))  # add project root to lib search path
+from ATWG.driver.worker import chamberWorker                                                  # Python Script under test
+from ATWG.driver.sim.simChamber import simChamber                                             # chamber
+#------------------------------------------------------------------------------
+
+
+
+#------------------------------------------------------------------------------
+class slowChamber(simChamber):
+    """
+    @note:  sim chamber with round trip time, records written setpoints
+    """
+    def __init__(self, latency=0.05):
+        super().__init__()
+        self.latency = latency
+        self.written = []
+        self.fail = False
+    def get_clima(self):
+        time.sleep(self.latency)
+        return super().get_clima()
+    def set_clima(self, clima=None):
+        time.sleep(self.latency)
+        if ( self.fail ):
+            raise ValueError("Chamber response timeout")
+        self.written.append(clima['temperature'])
+        return super().set_clima(clima=clima)
+#------------------------------------------------------------------------------
+
+
+
+#------------------------------------------------------------------------------
+class TestChamberWorker(unittest.TestCase):
+
+    #*****************************
+    def test_worker(self):
+        """
+        @note:  control calls do not wait for chamber
+        """
+        chamber = slowChamber(latency=0.05)
+        dut = chamberWorker(driver=chamber, depth=4)
+        self.assertEqual(dut.info()['name'], "SIM")
+        self.assertTrue(dut.open())
+        self.assertEqual(dut.get_clima()['temperature'], 20)    # first measurement waits
+        self.assertTrue(dut.start(temperature=25))
+        # posted
+        start = time.monotonic()
+        for i in range(20):
+            self.assertTrue(dut.set_clima(clima={'temperature': 30+i}))
+            self.assertEqual(dut.get_clima()['temperature'], 20)  # latest measurement
+        self.assertLess(time.monotonic() - start, 0.05)
+        stats = dut.stats()
+        self.assertLessEqual(stats['depth']['requests'], 2)     # coalesced
+        self.assertEqual(stats['depth']['max'], 4)
+        # written in background, latest setpoint wins
+        dut.flush()
+        self.assertEqual(chamber.written[-1], 49)
+        self.assertLess(len(chamber.written), 5)
+        dut.get_clima()
+        dut.flush()
+        self.assertEqual(dut.get_clima()['temperature'], 49)
+        stats = dut.stats()
+        self.assertGreaterEqual(stats['latency']['mean'], 0.04)
+        self.assertGreaterEqual(stats['latency']['max'], stats['latency']['last'])
+        self.assertLess(stats['age'], 1)
+        self.assertTrue(dut.stop())
+        self.assertTrue(dut.close())
+        self.assertIsNone(dut.thread)
+    #*****************************
+
+
+    #*****************************
+    def test_error(self):
+        """
+        @note:  failure of posted request raised with next call
+        """
+        chamber = slowChamber(latency=0)
+        dut = chamberWorker(driver=chamber)
+        with self.assertRaises(ValueError) as cm:
+            dut.set_clima(clima={'temperature': 10})
+        self.assertEqual(str(cm.exception), "Interface not opened, call methode 'open'")
+        dut.open()
+        chamber.fail = True
+        self.assertTrue(dut.set_clima(clima={'temperature': 10}))
+        dut.requests.join()
+        with self.assertRaises(ValueError) as cm:
+            dut.get_clima()
+        self.assertEqual(str(cm.exception), "Chamber request failed: Chamber response timeout")
+        with self.assertRaises(ValueError) as cm:
+            dut.set_clima(clima=None)
+        self.assertEqual(str(cm.exception), "No new data provided")
+        chamber.fail = False
+        self.assertTrue(dut.set_clima(clima={'temperature': 12}))
+        dut.flush()
+        self.assertEqual(chamber.written, [12])
+        self.assertTrue(dut.close())
+        with self.assertRaises(ValueError) as cm:
+            chamberWorker(driver=chamber, depth=1)
+        self.assertEqual(str(cm.exception), "Queue depth of at least two required")
+    #*****************************
+
+#------------------------------------------------------------------------------
+
+
+#------------------------------------------------------------------------------
+if __name__ == '__main__':
+    unittest.main()
+#------------------------------------------------------------------------------
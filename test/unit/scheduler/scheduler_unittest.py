@@ -0,0 +1,175 @@
+# -*- coding: utf-8 -*-
+"""
+@author:        Andreas Kaeberlein
+@copyright:     Copyright 2026
+@credits:       AKAE
+
+@license:       GPLv3
+@maintainer:    Andreas Kaeberlein
+@email:         andreas.kaeberlein@web.de
+
+@file:          scheduler_unittest.py
+@date:          2026-10-17
+
+@note           Unittest for scheduler.py
+                  run ./test/unit/scheduler/scheduler_unittest.py
+"""
+
+
+
+#------------------------------------------------------------------------------
+# Standard
+import sys        # python path handling
+import os         # platform independent paths
+import time       # real clock
+import unittest   # performs test
+import asyncio    # event loop
+# Self
+sys.path.append(os.path.abspath((os.path.dirname(os.path.abspath(__file__)) + "/../../../")))  # add project root to lib search path
+from ATWG.scheduler.scheduler import scheduler                                                # Python Script under test
+#------------------------------------------------------------------------------
+
+
+
+#------------------------------------------------------------------------------
+class fakeClock:
+    """
+    @note:  simulated time, sleep advances clock
+    """
+    def __init__(self):
+        self.now = 100.0
+        self.slept = []
+    def clock(self):
+        return self.now
+    def sleep(self, sec):
+        self.slept.append(sec)
+        self.now += sec
+#------------------------------------------------------------------------------
+
+
+
+#------------------------------------------------------------------------------
+class TestScheduler(unittest.TestCase):
+
+    #*****************************
+    def run_ticks(self, policy="skip", work=()):
+        """
+        @note   runs ticks with given work durations
+
+        @return (ticks, release times relative to start, scheduler)
+        """
+        clk = fakeClock()
+        dut = scheduler(period=1, policy=policy, clock=clk.clock, sleep=clk.sleep)
+        ticks = []
+        times = []
+        for w in work:
+            ticks.append(dut.wait())
+            times.append(clk.now - 100)
+            clk.now += w
+        return (ticks, times, dut)
+    #*****************************
+
+
+    #*****************************
+    def test_no_drift(self):
+        """
+        @note   deadlines are absolute, runtime is not accumulated
+        """
+        (ticks, times, dut) = self.run_ticks(work=[0.3]*10)
+        self.assertEqual(ticks, list(range(10)))
+        self.assertEqual(times, [float(i) for i in range(10)])
+        self.assertEqual(dut.stats['overruns'], 0)
+        self.assertEqual(dut.stats['jitter']['max'], 0)
+    #*****************************
+
+
+    #*****************************
+    def test_policies(self):
+        """
+        @note   tests overrun policies, second tick takes 2.5 periods
+        """
+        work = [0.1, 2.5, 0.1, 0.1, 0.1]
+        # skip: ticks 2 and 3 dropped
+        (ticks, times, dut) = self.run_ticks(policy="skip", work=work)
+        self.assertEqual(ticks, [0, 1, 4, 5, 6])
+        self.assertEqual(times, [0, 1, 4, 5, 6])
+        self.assertEqual((dut.stats['overruns'], dut.stats['skipped']), (1, 2))
+        # catchup: ticks run back to back
+        (ticks, times, dut) = self.run_ticks(policy="catchup", work=work)
+        self.assertEqual(ticks, [0, 1, 2, 3, 4])
+        self.assertEqual([round(t, 6) for t in times], [0, 1, 3.5, 3.6, 4])
+        self.assertEqual(dut.stats['overruns'], 2)
+        self.assertAlmostEqual(dut.stats['jitter']['max'], 1.5)
+        # stretch: grid restarts
+        (ticks, times, dut) = self.run_ticks(policy="stretch", work=work)
+        self.assertEqual(ticks, [0, 1, 2, 3, 4])
+        self.assertEqual(times, [0, 1, 3.5, 4.5, 5.5])
+        self.assertEqual(dut.stats['overruns'], 1)
+        # exceptions
+        with self.assertRaises(ValueError) as cm:
+            scheduler(policy="wait")
+        self.assertEqual(str(cm.exception), "Unsupported overrun policy 'wait'")
+    #*****************************
+
+
+    #*****************************
+    def test_adapt(self):
+        """
+        @note   effective period follows tick cost, ticks follow time
+        """
+        # single overrun, period raised and lowered again
+        (ticks, times, dut) = self.run_ticks(policy="adapt", work=[0.1, 2.5]+[0.1]*14)
+        self.assertEqual(ticks, [0, 1, 4, 7, 10, 12, 14, 16, 18, 20, 22, 24, 25, 26, 27, 28])
+        self.assertEqual(times, ticks)      # tick number is time on grid
+        self.assertEqual((dut.stats['overruns'], dut.stats['skipped'], dut.stats['period']), (1, 0, 1))
+        self.assertAlmostEqual(dut.stats['cost']['max'], 2.5)
+        self.assertAlmostEqual(dut.stats['cost']['last'], 0.1)
+        # permanent overrun, no further overruns with adapted period
+        (ticks, times, dut) = self.run_ticks(policy="adapt", work=[1.5]*10)
+        self.assertEqual(ticks, list(range(0, 20, 2)))
+        self.assertEqual((dut.stats['overruns'], dut.stats['period']), (1, 2))
+        (ticks, times, dut) = self.run_ticks(policy="skip", work=[1.5]*10)
+        self.assertEqual(dut.stats['overruns'], 9)
+    #*****************************
+
+
+    #*****************************
+    def test_monotonic(self):
+        """
+        @note   real clock, sleeps instead of busy wait
+        """
+        dut = scheduler(period=0.02)
+        cpu = time.process_time()
+        start = time.monotonic()
+        for i in range(10):
+            dut.wait()
+        self.assertGreaterEqual(time.monotonic() - start, 9*0.02)
+        self.assertLess(time.process_time() - cpu, 0.05)
+        self.assertEqual(dut.stats['ticks'], 10)
+    #*****************************
+
+
+    #*****************************
+    def test_wait_async(self):
+        """
+        @note   schedulers share one event loop
+        """
+        duts = [scheduler(period=0.02) for i in range(8)]
+        async def loop(dut):
+            return [await dut.wait_async() for i in range(10)]
+        async def main():
+            return await asyncio.gather(*[loop(dut) for dut in duts])
+        start = time.monotonic()
+        ticks = asyncio.run(main())
+        self.assertLess(time.monotonic() - start, 8*9*0.02)     # concurrent, not in sequence
+        self.assertEqual(ticks, [list(range(10))]*8)
+        self.assertTrue(all(10 == dut.stats['ticks'] for dut in duts))
+    #*****************************
+
+#------------------------------------------------------------------------------
+
+
+#------------------------------------------------------------------------------
+if __name__ == '__main__':
+    unittest.main()
+#------------------------------------------------------------------------------
@@ -0,0 +1,159 @@
+# -*- coding: utf-8 -*-
+"""
+@author:        Andreas Kaeberlein
+@copyright:     Copyright 2026
+@credits:       AKAE
+
+@license:       GPLv3
+@maintainer:    Andreas Kaeberlein
+@email:         andreas.kaeberlein@web.de
+
+@file:          sh641Async_unittest.py
+@date:          2026-10-17
+
+@note           Unittest for sh641Async.py
+                  run ./test/unit/sh641/sh641Async_unittest.py
+"""
+
+
+
+#------------------------------------------------------------------------------
+# Standard
+import sys        # python path handling
+import os         # platform independent paths
+import time       # concurrency check
+import asyncio    # event loop
+import unittest   # performs test
+# Self
+sys.path.append(os.path.abspath((os.path.dirname(os.path.abspath(__file__)) + "/../../../")))  # add project root to lib search path
+from ATWG.driver.espec.sh641Async import especShSuAsync                                       # Python Script under test
+from ATWG.driver.espec.sh641Const import *                                                    # climate chamber defintions
+#------------------------------------------------------------------------------
+
+
+
+#------------------------------------------------------------------------------
+class fakeChamber:
+    """
+    @note   answers SH641 commands on the master side of a pseudo terminal
+    """
+
+    #*****************************
+    def __init__(self, latency=0):
+        (self.master, slave) = os.openpty()
+        self.port = os.ttyname(slave)
+        self.slave = slave
+        self.latency = latency
+        self.rx = b""
+        self.cmds = []
+    #*****************************
+
+    #*****************************
+    def attach(self):
+        asyncio.get_running_loop().add_reader(self.master, self.receive)
+    #*****************************
+
+    #*****************************
+    def receive(self):
+        self.rx += os.read(self.master, 1024)
+        while ( b"\r\n" in self.rx ):
+            (cmd, self.rx) = self.rx.split(b"\r\n", 1)
+            cmd = cmd.decode()
+            self.cmds.append(cmd)
+            rsp = {'TYPE?': RSP_CH_ID, 'TEMP?': "26.4,0.0,140.0,-50.0", 'HUMI?': "25,85,100,0"}.get(cmd, RSP_OK + ":" + cmd)
+            asyncio.get_running_loop().call_later(self.latency, os.write, self.master, rsp.encode()[:3])            # split response
+            asyncio.get_running_loop().call_later(self.latency*1.5, os.write, self.master, rsp.encode()[3:] + b"\r\n")
+    #*****************************
+
+    #*****************************
+    def close(self):
+        asyncio.get_running_loop().remove_reader(self.master)
+        os.close(self.master)
+        os.close(self.slave)
+    #*****************************
+
+#------------------------------------------------------------------------------
+
+
+
+#------------------------------------------------------------------------------
+class TestSh641Async(unittest.TestCase):
+
+    #*****************************
+    # common const
+    simFile = os.path.dirname(os.path.abspath(__file__)) + os.path.sep + "sh641_dialog.yml"
+    #*****************************
+
+
+    #*****************************
+    def test_dialog(self):
+        """
+        @note:  dialog file, same responses as especShSu
+        """
+        async def main():
+            dut = especShSuAsync()
+            self.assertTrue(await dut.open(simFile=TestSh641Async.simFile))
+            self.assertDictEqual(await dut.get_clima(), {'temperature': 26.4, 'humidity': 25})
+            self.assertTrue(await dut.set_clima(clima={'temperature': 35.21}))
+            self.assertEqual(dut.last_write_temp, 35.21)
+            self.assertTrue(await dut.start(temperature=-10))
+            self.assertTrue(await dut.stop())
+            with self.assertRaises(ValueError) as cm:
+                await dut.set_power(pwr="STANDBY")
+            self.assertEqual(str(cm.exception), "unsupported power mode 'STANDBY'")
+            self.assertTrue(await dut.close())
+        asyncio.run(main())
+    #*****************************
+
+
+    #*****************************
+    @unittest.skipIf("posix" != os.name, "requires pseudo terminal")
+    def test_serial(self):
+        """
+        @note:  non-blocking serial port, chambers answer concurrently
+        """
+        async def main():
+            chambers = [fakeChamber(latency=0.1) for i in range(4)]
+            for chamber in chambers:
+                chamber.attach()
+            duts = [especShSuAsync() for chamber in chambers]
+            await asyncio.gather(*[dut.open(port=chamber.port) for dut, chamber in zip(duts, chambers)])
+            start = time.monotonic()
+            climas = await asyncio.gather(*[dut.get_clima() for dut in duts])
+            self.assertLess(time.monotonic() - start, 4*2*0.15)     # four chambers in parallel
+            self.assertEqual(climas, [{'temperature': 26.4, 'humidity': 25}]*4)
+            self.assertTrue(await duts[0].set_clima(clima={'temperature': 25}))
+            self.assertEqual(chambers[0].cmds, ["TYPE?", "TEMP?", "HUMI?", "TEMP,S25.0"])
+            self.assertEqual(duts[0].requests, len(chambers[0].cmds))
+            # concurrent requests of one chamber are serialized
+            await asyncio.gather(duts[1].get_clima(), duts[1].set_clima(clima={'temperature': 30}))
+            self.assertEqual(sorted(chambers[1].cmds[1:]), sorted(["TEMP?", "HUMI?", "TEMP?", "HUMI?", "TEMP,S30.0"]))
+            # timeout
+            duts[2].tiout_sec = 0.05
+            with self.assertRaises(ValueError) as cm:
+                await duts[2].read()
+            self.assertEqual(str(cm.exception), "Chamber response timeout")
+            # partial response at timeout, rest arrives late
+            duts[3].tiout_sec = 0.125
+            with self.assertRaises(ValueError) as cm:
+                await duts[3].transaction(CMD_GET_TEMP)
+            self.assertEqual(duts[3].rxbuf, b"26.")
+            await asyncio.sleep(0.1)
+            duts[3].tiout_sec = 1
+            self.assertDictEqual(await duts[3].get_clima(), {'temperature': 26.4, 'humidity': 25})
+            self.assertTrue(await duts[3].set_clima(clima={'temperature': 31}))
+            await asyncio.sleep(0.2)            # pending responses
+            for dut, chamber in zip(duts, chambers):
+                self.assertTrue(await dut.close())
+                chamber.close()
+        asyncio.run(main())
+    #*****************************
+
+#------------------------------------------------------------------------------
+
+
+
+#------------------------------------------------------------------------------
+if __name__ == '__main__':
+    unittest.main()
+#------------------------------------------------------------------------------
@@ -165,6 +165,7 @@ class TestSh641(unittest.TestCase):
         self.assertDictEqual(info['fracs'], {'temperature': 1, 'humidity': 1})
         self.assertDictEqual(info['temperature']['ratings'], {'min': -40, 'max': 150, 'unit': 'c'})
         self.assertDictEqual(info['temperature']['slewrate'], {'rise': 2.9, 'fall': -1.7, 'unit': 'c/min'})
+        self.assertDictEqual(info['commands'], {'get': 2, 'set': 1})
         self.assertEqual(info['name'], "ESPEC_SH641")
     #*****************************
     
@@ -0,0 +1,69 @@
+# -*- coding: utf-8 -*-
+"""
+@author:        Andreas Kaeberlein
+@copyright:     Copyright 2026
+@credits:       AKAE
+
+@license:       GPLv3
+@maintainer:    Andreas Kaeberlein
+@email:         andreas.kaeberlein@web.de
+
+@file:          simChamberAsync_unittest.py
+@date:          2026-10-17
+
+@note           Unittest for simChamberAsync.py
+                  run ./test/unit/sim/simChamberAsync_unittest.py
+"""
+
+
+
+#------------------------------------------------------------------------------
+# Libs
+import sys        # python path handling
+import os         # platform independent paths
+import time       # concurrency check
+import asyncio    # event loop
+import unittest   # performs test
+# Self, DUT
+sys.path.append(os.path.abspath((os.path.dirname(os.path.abspath(__file__)) + "/../../../")))  # add project root to lib search path
+from ATWG.driver.sim.simChamberAsync import simChamberAsync                                   # Python Script under test
+#------------------------------------------------------------------------------
+
+
+
+#------------------------------------------------------------------------------
+class TestSimChamberAsync(unittest.TestCase):
+
+    #*****************************
+    def test_clima(self):
+        """
+        @note:  async protocol, latency per request
+        """
+        async def main():
+            dut = simChamberAsync()
+            self.assertTrue(await dut.open())
+            self.assertTrue(await dut.start(temperature=30))
+            self.assertEqual((await dut.get_clima())['temperature'], 30)
+            self.assertTrue(await dut.set_clima(clima={'temperature': 25}))
+            self.assertEqual((await dut.get_clima())['temperature'], 25)
+            self.assertTrue(await dut.stop())
+            self.assertTrue(await dut.close())
+            self.assertEqual(dut.requests, 5)
+            with self.assertRaises(ValueError) as cm:
+                await dut.set_clima()
+            self.assertEqual(str(cm.exception), "No new data provided")
+            # chambers wait concurrently
+            duts = [simChamberAsync(latency=0.05) for i in range(32)]
+            start = time.monotonic()
+            await asyncio.gather(*[dut.get_clima() for dut in duts])
+            self.assertLess(time.monotonic() - start, 4*0.05)
+        asyncio.run(main())
+    #*****************************
+
+#------------------------------------------------------------------------------
+
+
+#------------------------------------------------------------------------------
+if __name__ == '__main__':
+    unittest.main()
+#------------------------------------------------------------------------------
@@ -82,6 +82,7 @@ class TestSimChamber(unittest.TestCase):
         self.assertDictEqual(info['fracs'], {'temperature': 2, 'humidity': 2})
         self.assertDictEqual(info['temperature']['ratings'], {'min': float('-inf'), 'max': float('+inf'), 'unit': 'c'})
         self.assertDictEqual(info['temperature']['slewrate'], {'rise': float('+inf'), 'fall': float('-inf'), 'unit': 'c/min'})
+        self.assertDictEqual(info['commands'], {'get': 0, 'set': 0})
         self.assertEqual(info['name'], "SIM")
     #*****************************
     
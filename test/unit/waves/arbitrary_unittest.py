@@ -0,0 +1,141 @@
+# -*- coding: utf-8 -*-
+"""
+@author:        Andreas Kaeberlein
+@copyright:     Copyright 2026
+@credits:       AKAE
+
+@license:       GPLv3
+@maintainer:    Andreas Kaeberlein
+@email:         andreas.kaeberlein@web.de
+
+@file:          arbitrary_unittest.py
+@date:          2026-10-17
+
+@note           Unittest for arbitrary.py
+                  run ./test/unit/waves/arbitrary_unittest.py
+"""
+
+
+
+#------------------------------------------------------------------------------
+# Standard
+import sys        # python path handling
+import os         # platform independent paths
+import unittest   # performs test
+import tempfile   # breakpoint files
+from array import array     # loaded columns
+# Self
+sys.path.append(os.path.abspath((os.path.dirname(os.path.abspath(__file__)) + "/../../../")))  # add project root to lib search path
+from ATWG.waves import arbitrary                                                              # Python Script under test
+from ATWG.waves.waves import waves                                                            # waveform generator
+#------------------------------------------------------------------------------
+
+
+
+#------------------------------------------------------------------------------
+class TestArbitrary(unittest.TestCase):
+
+    #*****************************
+    def setUp(self):
+        """
+        @note   set-ups test, writes profile in all formats
+        """
+        self.tmp = tempfile.TemporaryDirectory()
+        self.time = [0, 10, 20, 40]
+        self.temp = [20, 30, 30, 10]
+        self.files = {}
+        # csv
+        self.files['csv'] = os.path.join(self.tmp.name, "profile.csv")
+        with open(self.files['csv'], 'w') as fH:
+            fH.write("time;temp\n")
+            for t, v in zip(self.time, self.temp):
+                fH.write(str(t) + ";" + str(v) + "\n")
+        # yaml
+        self.files['yml'] = os.path.join(self.tmp.name, "profile.yml")
+        with open(self.files['yml'], 'w') as fH:
+            fH.write("time: " + str(self.time) + "\ntemp: " + str(self.temp) + "\n")
+        # binary
+        self.files['bin'] = os.path.join(self.tmp.name, "profile.bin")
+        arbitrary.save_bin(self.files['bin'], self.time, self.temp)
+    #*****************************
+
+
+    #*****************************
+    def tearDown(self):
+        """
+        @note   removes profile files
+        """
+        self.tmp.cleanup()
+    #*****************************
+
+
+    #*****************************
+    def test_load(self):
+        """
+        @note   tests breakpoint loader
+        """
+        for file in self.files.values():
+            (time, temp) = arbitrary.load(file)
+            self.assertEqual(list(time), self.time)
+            self.assertEqual(list(temp), self.temp)
+        # yaml list of pairs and further entries
+        with open(self.files['yml'], 'w') as fH:
+            fH.write("note: [profile, v1]\n")
+            fH.write("time: [0, 10]\n")
+            fH.write("temp:\n  - 20\n  - 30\n")
+        self.assertEqual(arbitrary.load(self.files['yml']), (array('d', [0, 10]), array('d', [20, 30])))
+        with open(self.files['yml'], 'w') as fH:
+            fH.writelines("- [" + str(t) + ", " + str(v) + "]\n" for t, v in zip(self.time, self.temp))
+        self.assertEqual(arbitrary.load(self.files['yml']), (array('d', self.time), array('d', self.temp)))
+        with open(self.files['yml'], 'w') as fH:
+            fH.write("- [0, 20]\n- [10]\n")
+        with self.assertRaises(ValueError) as cm:
+            arbitrary.load(self.files['yml'])
+        self.assertEqual(str(cm.exception), "Breakpoint with less than two values in yaml file")
+        # exceptions
+        with self.assertRaises(FileNotFoundError):
+            arbitrary.load(os.path.join(self.tmp.name, "missing.csv"))
+        with self.assertRaises(ValueError) as cm:
+            arbitrary.load(__file__)
+        self.assertEqual(str(cm.exception), "Unsupported breakpoint file format '.py'")
+    #*****************************
+
+
+    #*****************************
+    def test_wave(self):
+        """
+        @note   tests arbitrary waveform
+        """
+        dut = waves()
+        self.assertTrue(dut.set(wave="arbitrary", file=self.files['csv'], ts=2))
+        self.assertEqual(dut.waveDescr['x']['n'], 20)
+        exp = [20, 22, 24, 26, 28, 30, 30, 30, 30, 30, 30, 28, 26, 24, 22, 20, 18, 16, 14, 12]
+        for i in range(2*len(exp)):
+            self.assertEqual(dut.next()['val'], exp[i % len(exp)])  # repeated after last breakpoint
+        self.assertDictEqual(dut.at(t=5), {'val': 25, 'grad': 1})
+        self.assertDictEqual(dut.at(t=30), {'val': 20, 'grad': -1})
+        # block from negative fractional iterator, same as step function
+        iterator = -0.5
+        blk = dut.block(start=iterator, count=4)
+        for i in range(4):
+            (iterator, new) = dut.evalFunc(iterator, dut.waveDescr)
+            self.assertEqual(blk['val'][i], new['val'])
+            self.assertEqual(blk['grad'][i], new['grad'])
+        # start position
+        self.assertTrue(dut.set(wave="arbitrary", file=self.files['bin'], initVal=25, pSlope=False))
+        self.assertDictEqual(dut.next(), {'val': 25, 'grad': -1})
+        self.assertTrue(dut.set(wave="arbitrary", file=self.files['yml'], initVal=25))
+        self.assertDictEqual(dut.next(), {'val': 25, 'grad': 1})
+        # fences
+        self.assertTrue(dut.set(wave="arbitrary", points=(self.time, self.temp), lowVal=15, highVal=25))
+        self.assertEqual(max(dut.render(40)['val']), 25)
+        self.assertEqual(min(dut.render(40)['val']), 15.5)   # last sample before repeat
+    #*****************************
+
+#------------------------------------------------------------------------------
+
+
+#------------------------------------------------------------------------------
+if __name__ == '__main__':
+    unittest.main()
+#------------------------------------------------------------------------------
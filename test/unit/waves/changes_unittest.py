@@ -0,0 +1,69 @@
+# -*- coding: utf-8 -*-
+"""
+@author:        Andreas Kaeberlein
+@copyright:     Copyright 2026
+@credits:       AKAE
+
+@license:       GPLv3
+@maintainer:    Andreas Kaeberlein
+@email:         andreas.kaeberlein@web.de
+
+@file:          changes_unittest.py
+@date:          2026-10-17
+
+@note           Unittest for changes.py
+                  run ./test/unit/waves/changes_unittest.py
+"""
+
+
+
+#------------------------------------------------------------------------------
+# Standard
+import sys        # python path handling
+import os         # platform independent paths
+import unittest   # performs test
+# Self
+sys.path.append(os.path.abspath((os.path.dirname(os.path.abspath(__file__)) + "/../../../")))  # add project root to lib search path
+from ATWG.waves import changes                                                                # Python Script under test
+from ATWG.waves.waves import waves                                                            # waveform generator
+#------------------------------------------------------------------------------
+
+
+
+#------------------------------------------------------------------------------
+class TestChanges(unittest.TestCase):
+
+    #*****************************
+    def test_compress(self):
+        """
+        @note   tests change points against quantized samples
+        """
+        dut = waves()
+        dut.set(wave="sine", ts=1, tp=86400, lowVal=10, highVal=60)
+        ref = [round(v*10)/10 for v in dut.block(start=dut.iterInit, count=86400)['val']]
+        tbl = changes.compress(wave=dut, fracs=1, chunk=5000)
+        self.assertEqual(tbl.samples, 86400)
+        self.assertEqual(len(tbl), 1 + sum(1 for a, b in zip(ref, ref[1:]) if a != b))
+        self.assertGreater(tbl.ratio(), 80)
+        for t in (0, 1, 999, 21600, 50000, 86399, 86400+7):
+            self.assertEqual(tbl.lookup(t), ref[t % 86400])
+        self.assertEqual(tbl.time[0], 0)
+        # coarse resolution
+        self.assertEqual(list(changes.compress(wave=dut, fracs=-1).val), [40, 50, 60, 50, 40, 30, 20, 10, 20, 30])     # sine starts with 35
+        # exceptions
+        dut.set(wave="expr", expr="t")
+        with self.assertRaises(ValueError) as cm:
+            changes.compress(wave=dut)
+        self.assertEqual(str(cm.exception), "Compression requires finite waveform")
+        with self.assertRaises(ValueError) as cm:
+            changes.changeTable().lookup(0)
+        self.assertEqual(str(cm.exception), "Empty change table")
+    #*****************************
+
+#------------------------------------------------------------------------------
+
+
+#------------------------------------------------------------------------------
+if __name__ == '__main__':
+    unittest.main()
+#------------------------------------------------------------------------------
@@ -0,0 +1,161 @@
+# -*- coding: utf-8 -*-
+"""
+@author:        Andreas Kaeberlein
+@copyright:     Copyright 2026
+@credits:       AKAE
+
+@license:       GPLv3
+@maintainer:    Andreas Kaeberlein
+@email:         andreas.kaeberlein@web.de
+
+@file:          composite_unittest.py
+@date:          2026-10-17
+
+@note           Unittest for composite.py
+                  run ./test/unit/waves/composite_unittest.py
+"""
+
+
+
+#------------------------------------------------------------------------------
+# Standard
+import sys        # python path handling
+import os         # platform independent paths
+import unittest   # performs test
+import tempfile   # node tree file
+# Self
+sys.path.append(os.path.abspath((os.path.dirname(os.path.abspath(__file__)) + "/../../../")))  # add project root to lib search path
+from ATWG.waves.waves import waves                                                            # Python Script under test
+#------------------------------------------------------------------------------
+
+
+
+#------------------------------------------------------------------------------
+class TestComposite(unittest.TestCase):
+
+    #*****************************
+    def setUp(self):
+        """
+        @note   set-ups test, reference waveforms
+        """
+        self.sine = {'wave': "sine", 'tp': 40, 'lowVal': 10, 'highVal': 30}
+        self.trap = {'wave': "trapezoid", 'tp': 60, 'tr': 10, 'tf': 10, 'dutyCycle': 0.5, 'lowVal': 0, 'highVal': 5}
+        self.ref = []
+        for args in (self.sine, self.trap):
+            ref = waves()
+            ref.set(ts=1, **args)
+            self.ref.append([ref.next() for i in range(240)])
+    #*****************************
+
+
+    #*****************************
+    def test_ops(self):
+        """
+        @note   tests node operations against child waveforms
+        """
+        dut = waves()
+        (sine, trap) = self.ref
+        # sum, common period
+        self.assertTrue(dut.set(wave="composite", nodes={'op': "sum", 'args': [self.sine, self.trap, {'const': 1}]}))
+        self.assertEqual(dut.waveDescr['x']['n'], 120)
+        for i in range(240):
+            new = dut.next()
+            self.assertEqual(new['val'], sine[i]['val'] + trap[i]['val'] + 1)
+            self.assertEqual(new['grad'], sine[i]['grad'] + trap[i]['grad'])
+        # product, scaling
+        self.assertTrue(dut.set(wave="composite", nodes={'op': "product", 'args': [self.sine, 0.5]}, block=7))
+        for i in range(30):
+            self.assertDictEqual(dut.next(), {'val': sine[i]['val'] * 0.5, 'grad': sine[i]['grad'] * 0.5})
+        # min/max
+        self.assertTrue(dut.set(wave="composite", nodes={'op': "max", 'args': [self.sine, {'const': 20}]}))
+        for i in range(40):
+            self.assertEqual(dut.next()['val'], max(sine[i]['val'], 20))
+        # clamp
+        self.assertTrue(dut.set(wave="composite", nodes={'op': "clamp", 'low': 15, 'high': 25, 'args': [self.sine]}))
+        val = dut.render(40)['val']
+        self.assertEqual(min(val), 15)
+        self.assertEqual(max(val), 25)
+        self.assertEqual(dut.at(idx=10)['grad'], 0)
+        # fractional child period 81/2 repeats after 81 samples
+        self.assertTrue(dut.set(wave="composite", nodes={'op': "sum", 'args': [dict(self.sine, tp=40.5), self.trap]}))
+        self.assertEqual(dut.waveDescr['x']['n'], 81*20)
+        self.assertEqual(dut.at(idx=0), dut.at(idx=81*20))
+        # endless child
+        self.assertTrue(dut.set(wave="composite", nodes={'op': "sum", 'args': [self.sine, {'wave': "expr", 'expr': "t"}]}))
+        self.assertEqual(dut.waveDescr['x']['n'], float('inf'))
+        # exceptions
+        with self.assertRaises(ValueError) as cm:
+            dut.set(wave="composite", nodes={'op': "div", 'args': [1]})
+        self.assertEqual(str(cm.exception), "Unsupported composite node '{'op': 'div', 'args': [1]}'")
+        with self.assertRaises(ValueError) as cm:
+            dut.set(wave="composite", nodes={'op': "clamp", 'args': [1, 2]})
+        self.assertEqual(str(cm.exception), "Composite node 'clamp' requires one arg")
+        with self.assertRaises(ValueError) as cm:
+            dut.set(wave="composite", nodes={'op': "sum", 'args': [dict(self.sine, tp=9973), dict(self.sine, tp=9967), dict(self.trap, tp=9949)]})
+        self.assertEqual(str(cm.exception), "Composite period of 988939464559 samples exceeds limit of 10000000, align child periods")
+        with self.assertRaises(ValueError) as cm:
+            dut.set(wave="composite", nodes={'op': "sum", 'args': [{'wave': "expr", 'expr': "t"}]}, initVal=5)
+        self.assertEqual(str(cm.exception), "Composite start value requires finite period")
+    #*****************************
+
+
+    #*****************************
+    def test_access(self):
+        """
+        @note   tests block and random access against next()
+        """
+        dut = waves()
+        nodes = {'op': "min", 'args': [{'op': "sum", 'args': [self.sine, self.trap]}, {'const': 33}]}
+        self.assertTrue(dut.set(wave="composite", nodes=nodes, block=16))
+        seq = [dut.next() for i in range(200)]
+        blk = dut.block(start=0, count=200)
+        self.assertEqual(list(blk['val']), [new['val'] for new in seq])
+        self.assertEqual(list(blk['grad']), [new['grad'] for new in seq])
+        self.assertDictEqual(dut.at(idx=150), seq[150])
+        self.assertDictEqual(dut.at(t=3), seq[3])
+        self.assertTrue(dut.seek(idx=77))
+        self.assertDictEqual(dut.next(), seq[77])
+    #*****************************
+
+
+    #*****************************
+    def test_start(self):
+        """
+        @note   start value and slope select first crossing
+        """
+        dut = waves()
+        nodes = {'op': "sum", 'args': [self.sine, self.trap]}
+        for (initVal, pSlope) in ((20, True), (20, False), (33, True), (12, False)):
+            self.assertTrue(dut.set(wave="composite", nodes=nodes, initVal=initVal, pSlope=pSlope))
+            cur = dut.next()
+            nxt = dut.next()
+            self.assertLessEqual(abs(cur['val'] - initVal), abs(nxt['val'] - cur['val']))
+            self.assertEqual(pSlope, nxt['val'] > cur['val'])
+        # no crossing starts with period
+        self.assertTrue(dut.set(wave="composite", nodes=nodes, initVal=50))
+        self.assertEqual(dut.iterator, 0)
+    #*****************************
+
+
+    #*****************************
+    def test_file(self):
+        """
+        @note   tests yaml node tree with time strings
+        """
+        with tempfile.TemporaryDirectory() as tmp:
+            file = os.path.join(tmp, "composite.yml")
+            with open(file, 'w') as fH:
+                fH.write("op: sum\nargs:\n  - {wave: sine, tp: 1m, lowVal: 10, highVal: 30}\n  - {const: 5}\n")
+            dut = waves()
+            self.assertTrue(dut.set(wave="composite", file=file, highVal=40))
+            self.assertEqual(dut.waveDescr['x']['tp'], 60)
+            self.assertEqual(max(dut.render(60)['val']), 35)
+    #*****************************
+
+#------------------------------------------------------------------------------
+
+
+#------------------------------------------------------------------------------
+if __name__ == '__main__':
+    unittest.main()
+#------------------------------------------------------------------------------
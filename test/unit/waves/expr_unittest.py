@@ -0,0 +1,106 @@
+# -*- coding: utf-8 -*-
+"""
+@author:        Andreas Kaeberlein
+@copyright:     Copyright 2026
+@credits:       AKAE
+
+@license:       GPLv3
+@maintainer:    Andreas Kaeberlein
+@email:         andreas.kaeberlein@web.de
+
+@file:          expr_unittest.py
+@date:          2026-10-17
+
+@note           Unittest for expr.py
+                  run ./test/unit/waves/expr_unittest.py
+"""
+
+
+
+#------------------------------------------------------------------------------
+# Standard
+import sys        # python path handling
+import os         # platform independent paths
+import math       # reference values
+import unittest   # performs test
+try:
+    import numpy      # optional, vector function
+except ImportError:
+    numpy = None
+# Self
+sys.path.append(os.path.abspath((os.path.dirname(os.path.abspath(__file__)) + "/../../../")))  # add project root to lib search path
+from ATWG.waves import expr                                                                   # Python Script under test
+from ATWG.waves.waves import waves                                                            # waveform generator
+#------------------------------------------------------------------------------
+
+
+
+#------------------------------------------------------------------------------
+class TestExpr(unittest.TestCase):
+
+    #*****************************
+    def test_compile(self):
+        """
+        @note   tests parser, whitelist and cache
+        """
+        (f, vec) = expr.compile_expr("25 + 10*sin(2*pi*t/1h) + 3*max(t, 1.5m)")
+        self.assertEqual(f(900), 25 + 10*math.sin(2*math.pi*900/3600) + 3*900)
+        self.assertEqual(f(0), 25 + 3*90)
+        self.assertIs(expr.compile_expr("25 + 10*sin(2*pi*t/1h) + 3*max(t, 1.5m)")[0], f)    # cached
+        # rejected
+        for src, msg in (("__import__('os')", "Unsupported call in expression"),
+                         ("t.real", "Unsupported element 'Attribute' in expression"),
+                         ("1 + (lambda: 1)", "Unsupported element 'Lambda' in expression"),
+                         ("pi(1)", "Unsupported call in expression"),
+                         ("'a'", "Unsupported constant 'a' in expression"),
+                         ("x + 1", "Unsupported name 'x' in expression"),
+                         ("__pow(9, 9)", "Unsupported call in expression"),
+                         ("1 +", "Invalid expression '1 +'")):
+            with self.assertRaises(ValueError) as cm:
+                expr.compile_expr(src)
+            self.assertEqual(str(cm.exception), msg)
+        # powers in float, overflow raised instead of endless integer power
+        (f, vec) = expr.compile_expr("2**t + t**0.5 + 2**-1")
+        self.assertEqual(f(4), 16 + 2 + 0.5)
+        if ( None != vec ):
+            self.assertEqual(list(vec(numpy.array([0.0, 4.0]))), [1.5, 18.5])
+        with self.assertRaises(ValueError) as cm:
+            waves().set(wave="expr", expr="9**9**9**9")
+        self.assertEqual(str(cm.exception), "Expression not evaluable at t=0: math range error")
+        # min/max with more than two arguments
+        (f, vec) = expr.compile_expr("min(t, 5, 3) + max(t, 1, 2, 0)")
+        self.assertEqual(f(4), 3 + 4)
+        if ( None != vec ):
+            self.assertEqual(list(vec(numpy.array([0.0, 4.0, 9.0]))), [0 + 2, 3 + 4, 3 + 9])
+    #*****************************
+
+
+    #*****************************
+    def test_wave(self):
+        """
+        @note   tests waveform access
+        """
+        dut = waves()
+        self.assertTrue(dut.set(wave="expr", expr="20 + 0.5*t", ts=2, highVal=30))
+        seq = [dut.next() for i in range(12)]
+        self.assertEqual([new['val'] for new in seq], [20, 21, 22, 23, 24, 25, 26, 27, 28, 29, 30, 30])
+        self.assertAlmostEqual(seq[0]['grad'], 0.5)
+        self.assertEqual(seq[11]['grad'], 0)
+        blk = dut.block(start=0, count=12)
+        self.assertEqual(list(blk['val']), [new['val'] for new in seq])
+        self.assertEqual(list(blk['grad']), [new['grad'] for new in seq])
+        self.assertDictEqual(dut.at(t=10), seq[5])
+        # periodic
+        self.assertTrue(dut.set(wave="expr", expr="t", tp=4))
+        self.assertEqual([dut.next()['val'] for i in range(6)], [0, 1, 2, 3, 0, 1])
+        self.assertEqual(list(dut.block(start=dut.position(idx=3), count=3)['val']), [3, 0, 1])
+        self.assertEqual(dut.at(idx=9)['val'], 1)
+    #*****************************
+
+#------------------------------------------------------------------------------
+
+
+#------------------------------------------------------------------------------
+if __name__ == '__main__':
+    unittest.main()
+#------------------------------------------------------------------------------
@@ -0,0 +1,88 @@
+# -*- coding: utf-8 -*-
+"""
+@author:        Andreas Kaeberlein
+@copyright:     Copyright 2026
+@credits:       AKAE
+
+@license:       GPLv3
+@maintainer:    Andreas Kaeberlein
+@email:         andreas.kaeberlein@web.de
+
+@file:          phasor_unittest.py
+@date:          2026-10-17
+
+@note           Unittest for phasor.py
+                  run ./test/unit/waves/phasor_unittest.py
+                  long run accuracy see ./test/benchmark/phasor_benchmark.py
+"""
+
+
+
+#------------------------------------------------------------------------------
+# Standard
+import sys        # python path handling
+import os         # platform independent paths
+import unittest   # performs test
+# Self
+sys.path.append(os.path.abspath((os.path.dirname(os.path.abspath(__file__)) + "/../../../")))  # add project root to lib search path
+from ATWG.waves.phasor import phasor                                                          # Python Script under test
+from ATWG.waves.waves import waves                                                            # reference
+#------------------------------------------------------------------------------
+
+
+
+#------------------------------------------------------------------------------
+class TestPhasor(unittest.TestCase):
+
+    #*****************************
+    def setUp(self):
+        """
+        @note   set-ups test
+        """
+    #*****************************
+
+
+    #*****************************
+    def test_init(self):
+        """
+        @note   tests exception handling
+        """
+        with self.assertRaises(ValueError) as cm:
+            phasor()
+        self.assertEqual(str(cm.exception), "No sine descriptor provided")
+        with self.assertRaises(ValueError) as cm:
+            waves().set(wave="trapezoid", dutyCycle=0.5, phasor=True)
+        self.assertEqual(str(cm.exception), "Phasor stepping requires sine waveform")
+    #*****************************
+
+
+    #*****************************
+    def test_step(self):
+        """
+        @note   compares phasor with closed form sine
+        """
+        args = {'wave': "sine", 'ts': 1, 'tp': 100000, 'lowVal': -40, 'highVal': 150, 'initVal': 25}
+        ref = waves()
+        dut = waves()
+        self.assertTrue(ref.set(**args))
+        self.assertTrue(dut.set(phasor=True, **args))
+        # more then one period, includes period sync
+        for i in range(250000):
+            a = ref.next()
+            b = dut.next()
+            self.assertAlmostEqual(a['val'], b['val'], places=10)
+            self.assertAlmostEqual(a['grad'], b['grad'], places=10)
+            self.assertEqual(ref.iterator, dut.iterator)
+        # jump, falls back to closed form
+        self.assertTrue(dut.seek(idx=12345))
+        self.assertTrue(ref.seek(idx=12345))
+        self.assertDictEqual(dut.next(), ref.next())
+    #*****************************
+
+#------------------------------------------------------------------------------
+
+
+#------------------------------------------------------------------------------
+if __name__ == '__main__':
+    unittest.main()
+#------------------------------------------------------------------------------
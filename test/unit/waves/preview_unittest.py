@@ -0,0 +1,101 @@
+# -*- coding: utf-8 -*-
+"""
+@author:        Andreas Kaeberlein
+@copyright:     Copyright 2026
+@credits:       AKAE
+
+@license:       GPLv3
+@maintainer:    Andreas Kaeberlein
+@email:         andreas.kaeberlein@web.de
+
+@file:          preview_unittest.py
+@date:          2026-10-17
+
+@note           Unittest for preview.py
+                  run ./test/unit/waves/preview_unittest.py
+"""
+
+
+
+#------------------------------------------------------------------------------
+# Standard
+import sys        # python path handling
+import os         # platform independent paths
+import unittest   # performs test
+import tempfile   # output files
+import xml.etree.ElementTree as ET  # svg check
+# Self
+sys.path.append(os.path.abspath((os.path.dirname(os.path.abspath(__file__)) + "/../../../")))  # add project root to lib search path
+from ATWG.waves import preview                                                                # Python Script under test
+from ATWG.waves.waves import waves                                                            # waveform generator
+#------------------------------------------------------------------------------
+
+
+
+#------------------------------------------------------------------------------
+class TestPreview(unittest.TestCase):
+
+    #*****************************
+    def test_downsample(self):
+        """
+        @note   tests min/max buckets against full period
+        """
+        dut = waves()
+        self.assertTrue(dut.set(wave="trapezoid", ts=1, tp=100000, lowVal=-40, highVal=85, tr=3, tf=30001, dutyCycle=0.5))
+        full = dut.block(start=0, count=100000)['val']
+        (time, val) = preview.downsample(wave=dut, points=200)
+        self.assertLessEqual(len(time), 200)
+        self.assertEqual(len(time), len(val))
+        self.assertEqual(list(time), sorted(time))                          # time order
+        self.assertEqual((min(val), max(val)), (min(full), max(full)))      # peaks kept
+        for t, v in zip(time, val):
+            self.assertEqual(full[int(t)], v)                               # original samples
+        self.assertIn(3, time)                                              # short rise edge kept
+        # blockwise same as single block
+        self.assertEqual(preview.downsample(wave=dut, points=200, chunk=1000), (time, val))
+        self.assertEqual(preview.downsample(wave=dut, points=200, chunk=1), (time, val))
+        # short period kept
+        self.assertTrue(dut.set(wave="sine", ts=2, tp=200, lowVal=0, highVal=1))
+        (time, val) = preview.downsample(wave=dut, points=1000)
+        self.assertEqual(list(time), [2.0*i for i in range(100)])
+        # exceptions
+        with self.assertRaises(ValueError) as cm:
+            preview.downsample(wave=dut, points=1)
+        self.assertEqual(str(cm.exception), "At least two preview points required")
+    #*****************************
+
+
+    #*****************************
+    def test_write(self):
+        """
+        @note   tests csv and svg output
+        """
+        dut = waves()
+        self.assertTrue(dut.set(wave="sine", ts=1, tp=86400, lowVal=10, highVal=60))
+        with tempfile.TemporaryDirectory() as tmp:
+            # csv, readable as arbitrary waveform
+            file = os.path.join(tmp, "preview.csv")
+            self.assertEqual(preview.write(wave=dut, file=file, points=500), 500)
+            ref = waves()
+            self.assertTrue(ref.set(wave="arbitrary", file=file, ts=1))
+            self.assertAlmostEqual(ref.at(t=21600)['val'], 60, places=2)
+            # svg
+            file = os.path.join(tmp, "preview.svg")
+            self.assertEqual(preview.write(wave=dut, file=file, points=500, title="sine"), 500)
+            root = ET.parse(file).getroot()
+            line = root.find("{http://www.w3.org/2000/svg}polyline")
+            self.assertEqual(len(line.get('points').split()), 500)
+            self.assertIn("time [h]", [elem.text for elem in root.iter("{http://www.w3.org/2000/svg}text")])
+            # exceptions
+            with self.assertRaises(ValueError) as cm:
+                preview.write(wave=dut, file=os.path.join(tmp, "preview.png"))
+            self.assertEqual(str(cm.exception), "Unsupported preview format '.png', use .csv, .svg")
+    #*****************************
+
+#------------------------------------------------------------------------------
+
+
+#------------------------------------------------------------------------------
+if __name__ == '__main__':
+    unittest.main()
+#------------------------------------------------------------------------------
@@ -0,0 +1,134 @@
+# -*- coding: utf-8 -*-
+"""
+@author:        Andreas Kaeberlein
+@copyright:     Copyright 2026
+@credits:       AKAE
+
+@license:       GPLv3
+@maintainer:    Andreas Kaeberlein
+@email:         andreas.kaeberlein@web.de
+
+@file:          resample_unittest.py
+@date:          2026-10-17
+
+@note           Unittest for resample.py
+                  run ./test/unit/waves/resample_unittest.py
+"""
+
+
+
+#------------------------------------------------------------------------------
+# Standard
+import sys        # python path handling
+import os         # platform independent paths
+import math       # reference values
+import tempfile   # log files
+import unittest   # performs test
+# Self
+sys.path.append(os.path.abspath((os.path.dirname(os.path.abspath(__file__)) + "/../../../")))  # add project root to lib search path
+from ATWG.waves import resample                                                               # Python Script under test
+from ATWG.waves import arbitrary                                                              # binary log files
+from ATWG.waves.waves import waves                                                            # waveform generator
+#------------------------------------------------------------------------------
+
+
+
+#------------------------------------------------------------------------------
+class TestResample(unittest.TestCase):
+
+    #*****************************
+    def test_upsample(self):
+        """
+        @note   tests interpolation and chunk independence
+        """
+        time = [60*i for i in range(61)]
+        temp = [25 + 10*math.sin(2*math.pi*t/3600) for t in time]
+        for method, tol in (("linear", 0.02), ("cubic", 0.005)):
+            (t0, ts, val, stats) = resample.resample(points=(time, temp), ts=1, method=method)
+            self.assertEqual(len(val), 3601)
+            self.assertEqual((t0, ts), (0, 1))
+            self.assertEqual(stats['output'], 3601)
+            self.assertLess(max(abs(v - (25 + 10*math.sin(2*math.pi*k/3600))) for k, v in enumerate(val)), tol)
+            # chunks
+            dut = resample.resampler(ts=1, method=method)
+            out = []
+            for i in range(0, len(time), 7):
+                out.extend(dut.push(time[i:i+7], temp[i:i+7]))
+            out.extend(dut.flush())
+            self.assertEqual(out, list(val))
+        # monotone cubic keeps steps flat
+        (t0, ts, val, stats) = resample.resample(points=([0, 10, 20, 30], [0, 0, 1, 1]), ts=1, method="cubic")
+        self.assertTrue(all(0 <= v <= 1 for v in val))
+        self.assertEqual(list(val[:11]), [0]*11)
+    #*****************************
+
+
+    #*****************************
+    def test_decimate(self):
+        """
+        @note   tests anti-aliasing mean of fast logs
+        """
+        time = [0.1*i + 0.02*math.sin(i) for i in range(36000)]     # irregular 10 Hz
+        temp = [25 + 10*math.sin(2*math.pi*t/600) + 2*math.sin(2*math.pi*t/0.3) for t in time]
+        dut = resample.resampler(ts=1)
+        out = list(dut.push(time[:10000], temp[:10000])) + list(dut.push(time[10000:], temp[10000:])) + list(dut.flush())
+        self.assertTrue(dut.decimate)
+        self.assertEqual(len(out), 3600)
+        self.assertLess(max(abs(v - (25 + 10*math.sin(2*math.pi*k/600))) for k, v in enumerate(out[1:-1], 1)), 0.3)
+        # without mean the 3.3Hz disturbance aliases
+        (t0, ts, val, stats) = resample.resample(points=(time, temp), ts=1, decimate=False)
+        self.assertGreater(max(abs(v - (25 + 10*math.sin(2*math.pi*k/600))) for k, v in enumerate(val)), 1)
+    #*****************************
+
+
+    #*****************************
+    def test_gap(self):
+        """
+        @note   tests gap handling and cleaning
+        """
+        (t0, ts, val, stats) = resample.resample(points=([0, 1, 2, 10, 11], [0, 1, 2, 10, 11]), ts=1, gap=5)
+        self.assertEqual(list(val), [0, 1, 2, 2, 2, 2, 2, 2, 2, 2, 10, 11])
+        self.assertEqual(stats['gaps'], 1)
+        (t0, ts, val, stats) = resample.resample(points=([0, 1, 2, 10, 11], [0, 1, 2, 10, 11]), ts=1, gap=5, fill="linear")
+        self.assertEqual(list(val), list(range(12)))
+        (t0, ts, val, stats) = resample.resample(points=([0, 1, 1, 0.5, 2, 3, float('nan')], [0, 1, 5, 5, float('nan'), 3, 4]), ts=1)
+        self.assertEqual(list(val), [0, 1, 2, 3])
+        self.assertEqual(stats['dropped'], 4)
+        with self.assertRaises(ValueError) as cm:
+            resample.resampler(method="spline")
+        self.assertEqual(str(cm.exception), "Unsupported resample method 'spline'")
+    #*****************************
+
+
+    #*****************************
+    def test_file(self):
+        """
+        @note   tests streamed log file as arbitrary waveform
+        """
+        time = [0.5*i for i in range(2001)]
+        temp = [20 + 0.01*t for t in time]
+        with tempfile.TemporaryDirectory() as tmp:
+            arbitrary.save_bin(os.path.join(tmp, "log.bin"), time, temp)
+            with open(os.path.join(tmp, "log.csv"), 'w') as fH:
+                fH.write("time,temp\n")
+                fH.writelines(str(t) + "," + str(v) + "\n" for t, v in zip(time, temp))
+            for name in ("log.bin", "log.csv"):
+                (t0, ts, val, stats) = resample.resample(file=os.path.join(tmp, name), ts=2, chunk=300)
+                self.assertEqual(len(val), 501)
+                self.assertAlmostEqual(val[250], 25, places=9)
+                self.assertEqual(stats['input'], 2001)
+            dut = waves()
+            self.assertTrue(dut.set(wave="arbitrary", file=os.path.join(tmp, "log.bin"), ts=10, resample={'method': "cubic"}))
+            self.assertEqual(dut.waveDescr['x']['n'], 100)
+            self.assertAlmostEqual(dut.at(idx=50)['val'], 25, places=9)
+            self.assertEqual(dut.waveDescr['resample']['output'], 101)
+            self.assertEqual(len(dut.waveDescr['seg'].val), 101)      # values only
+    #*****************************
+
+#------------------------------------------------------------------------------
+
+
+#------------------------------------------------------------------------------
+if __name__ == '__main__':
+    unittest.main()
+#------------------------------------------------------------------------------
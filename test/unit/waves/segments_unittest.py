@@ -0,0 +1,184 @@
+# -*- coding: utf-8 -*-
+"""
+@author:        Andreas Kaeberlein
+@copyright:     Copyright 2026
+@credits:       AKAE
+
+@license:       GPLv3
+@maintainer:    Andreas Kaeberlein
+@email:         andreas.kaeberlein@web.de
+
+@file:          segments_unittest.py
+@date:          2026-10-17
+
+@note           Unittest for segments.py
+                  run ./test/unit/waves/segments_unittest.py
+"""
+
+
+
+#------------------------------------------------------------------------------
+# Standard
+import sys        # python path handling
+import os         # platform independent paths
+import unittest   # performs test
+from array import array     # table columns
+try:
+    import numpy      # optional, block evaluation
+except ImportError:
+    numpy = None
+# Self
+sys.path.append(os.path.abspath((os.path.dirname(os.path.abspath(__file__)) + "/../../../")))  # add project root to lib search path
+from ATWG.waves.segments import segmentTable                                                  # Python Script under test
+from ATWG.waves.segments import gridTable                                                     # uniform samples
+#------------------------------------------------------------------------------
+
+
+
+#------------------------------------------------------------------------------
+class TestSegments(unittest.TestCase):
+
+    #*****************************
+    def setUp(self):
+        """
+        @note   set-ups test
+        """
+    #*****************************
+
+
+    #*****************************
+    def test_append(self):
+        """
+        @note   tests building of segment table
+        """
+        dut = segmentTable(ts=2)
+        self.assertTrue(dut.append(length=10, val=0, grad=1))
+        self.assertFalse(dut.append(length=0, val=5, grad=0))   # skipped
+        self.assertTrue(dut.append(length=5, val=10, grad=-2))
+        self.assertEqual(len(dut), 2)
+        self.assertEqual(list(dut.start), [0, 10])
+        self.assertEqual(list(dut.gradSec), [0.5, -1])
+        self.assertEqual(dut.end, 15)
+        # exception
+        with self.assertRaises(ValueError) as cm:
+            dut.append(length=-1)
+        self.assertEqual(str(cm.exception), "Negative segment length")
+        with self.assertRaises(ValueError) as cm:
+            segmentTable().find(0)
+        self.assertEqual(str(cm.exception), "Empty segment table")
+    #*****************************
+
+
+    #*****************************
+    def test_grid(self):
+        """
+        @note   tests uniform table against segment table
+        """
+        val = [-20, 20, 20, 18.5, 30]
+        dut = gridTable(x0=100, dx=10, val=array('d', val))
+        ref = segmentTable(ts=1)
+        ref.points(x=array('d', [100, 110, 120, 130, 140]), val=array('d', val))
+        self.assertEqual((len(dut), dut.end), (4, 140))
+        for x in (90, 100, 102.5, 110, 119.9, 125, 140, 150):
+            (v, g) = dut.eval(x)
+            self.assertAlmostEqual(v, ref.eval(x)[0], places=12)
+            self.assertAlmostEqual(g, ref.eval(x)[1], places=12)
+        if ( None != numpy ):
+            x = numpy.arange(90, 150, 0.5)
+            (v, g) = dut.block(x)
+            for i in range(len(x)):
+                self.assertEqual((v[i], g[i]), dut.eval(float(x[i])))
+        with self.assertRaises(ValueError) as cm:
+            gridTable(val=array('d', [1]))
+        self.assertEqual(str(cm.exception), "At least two points required")
+    #*****************************
+
+
+    #*****************************
+    def test_find(self):
+        """
+        @note   tests segment lookup, sequential and random
+        """
+        # many segments
+        dut = segmentTable()
+        for i in range(1000):
+            dut.append(length=3, val=i, grad=0)
+        # sequential
+        for x in range(3000):
+            self.assertEqual(dut.find(x), x//3)
+            self.assertEqual(dut.cursor, x//3)
+        # random
+        for x in (2999, 0, 1500.5, 77, 2):
+            self.assertEqual(dut.find(x), int(x//3))
+        # outside
+        self.assertEqual(dut.find(-5), 0)
+        self.assertEqual(dut.find(5000), 999)
+    #*****************************
+
+
+    #*****************************
+    def test_eval(self):
+        """
+        @note   tests value calculation
+        """
+        dut = segmentTable(ts=1)
+        dut.append(length=10, val=-20, grad=4)
+        dut.append(length=10, val=20, grad=0)
+        self.assertEqual(dut.eval(0), (-20, 4))
+        self.assertEqual(dut.eval(2.5), (-10, 4))
+        self.assertEqual(dut.eval(15), (20, 0))
+    #*****************************
+
+
+    #*****************************
+    @unittest.skipIf(None == numpy, "requires numpy")
+    def test_block(self):
+        """
+        @note   tests vectorized evaluation against eval()
+        """
+        dut = segmentTable(ts=2)
+        dut.append(length=10, val=-20, grad=4)
+        dut.append(length=10, val=20, grad=0)
+        dut.append(length=5, val=20, grad=-0.3)
+        x = numpy.arange(-2, 30, 0.25)
+        self.assertEqual(list(dut.index(x)[[0, 8, 47, 48, 88, 127]]), [0, 0, 0, 1, 2, 2])    # outside assigned to first/last
+        (val, grad) = dut.block(x)
+        for i in range(len(x)):
+            self.assertEqual((val[i], grad[i]), dut.eval(float(x[i])))
+        with self.assertRaises(ValueError) as cm:
+            segmentTable().block(x)
+        self.assertEqual(str(cm.exception), "Empty segment table")
+    #*****************************
+
+
+    #*****************************
+    def test_grid(self):
+        """
+        @note   tests uniform table against segment table
+        """
+        val = [-20, 20, 20, 18.5, 30]
+        dut = gridTable(x0=100, dx=10, val=array('d', val))
+        ref = segmentTable(ts=1)
+        ref.points(x=array('d', [100, 110, 120, 130, 140]), val=array('d', val))
+        self.assertEqual((len(dut), dut.end), (4, 140))
+        for x in (90, 100, 102.5, 110, 119.9, 125, 140, 150):
+            (v, g) = dut.eval(x)
+            self.assertAlmostEqual(v, ref.eval(x)[0], places=12)
+            self.assertAlmostEqual(g, ref.eval(x)[1], places=12)
+        if ( None != numpy ):
+            x = numpy.arange(90, 150, 0.5)
+            (v, g) = dut.block(x)
+            for i in range(len(x)):
+                self.assertEqual((v[i], g[i]), dut.eval(float(x[i])))
+        with self.assertRaises(ValueError) as cm:
+            gridTable(val=array('d', [1]))
+        self.assertEqual(str(cm.exception), "At least two points required")
+    #*****************************
+
+#------------------------------------------------------------------------------
+
+
+#------------------------------------------------------------------------------
+if __name__ == '__main__':
+    unittest.main()
+#------------------------------------------------------------------------------
@@ -0,0 +1,152 @@
+# -*- coding: utf-8 -*-
+"""
+@author:        Andreas Kaeberlein
+@copyright:     Copyright 2026
+@credits:       AKAE
+
+@license:       GPLv3
+@maintainer:    Andreas Kaeberlein
+@email:         andreas.kaeberlein@web.de
+
+@file:          sequence_unittest.py
+@date:          2026-10-17
+
+@note           Unittest for sequence.py
+                  run ./test/unit/waves/sequence_unittest.py
+"""
+
+
+
+#------------------------------------------------------------------------------
+# Standard
+import sys        # python path handling
+import os         # platform independent paths
+import unittest   # performs test
+import tempfile   # sequence file
+from array import array   # segment columns
+try:
+    import numpy      # optional, block rendering
+except ImportError:
+    numpy = None
+# Self
+sys.path.append(os.path.abspath((os.path.dirname(os.path.abspath(__file__)) + "/../../../")))  # add project root to lib search path
+from ATWG.waves import sequence                                                               # Python Script under test
+from ATWG.waves.waves import waves                                                            # waveform generator
+#------------------------------------------------------------------------------
+
+
+
+#------------------------------------------------------------------------------
+class TestSequence(unittest.TestCase):
+
+    #*****************************
+    def assertSample(self, first, second):
+        """
+        @note   blocks are bit identical without numpy, vectorized sin/cos can differ in the last bit
+        """
+        if ( None == numpy ):
+            self.assertEqual(first, second)
+        else:
+            self.assertAlmostEqual(first, second, places=9)
+    #*****************************
+
+
+    #*****************************
+    def test_steps(self):
+        """
+        @note   tests compiled steps
+        """
+        dut = waves()
+        steps = [{'ramp': {'to': -40, 'rate': "5C/min"}},       # 13min
+                 {'soak': "1h"},
+                 {'sine': {'lowVal': -40, 'highVal': 80, 'tp': "1h", 'cycles': 2}},
+                 {'repeat': 2, 'steps': [{'trapezoid': {'lowVal': -40, 'highVal': 80, 'tp': 400, 'tr': 100, 'tf': "120C/100s"}}]},
+                 {'hold': {'temp': 25, 'time': "10m"}}]
+        self.assertTrue(dut.set(wave="sequence", steps=steps, start=25, lowVal=-40, highVal=80))
+        self.assertEqual(dut.waveDescr['x']['tp'], 780+3600+7200+800+600)
+        self.assertEqual(len(dut.waveDescr['seg']), 1+1+1+2*4+1+1)  # last temperature is kept
+        # ramp, soak
+        self.assertDictEqual(dut.next(), {'val': 25, 'grad': -65/780})
+        self.assertDictEqual(dut.at(t=390), {'val': -7.5, 'grad': -65/780})
+        self.assertDictEqual(dut.at(t=780), {'val': -40, 'grad': 0})
+        # sine
+        self.assertAlmostEqual(dut.at(t=4380+900)['val'], 20)
+        self.assertAlmostEqual(dut.at(t=4380+1800)['val'], 80)
+        self.assertAlmostEqual(dut.at(t=4380+5400)['val'], 80)
+        # trapezoid
+        self.assertDictEqual(dut.at(t=11580+50), {'val': 20, 'grad': 1.2})
+        self.assertDictEqual(dut.at(t=11580+400+150), {'val': 80, 'grad': 0})
+        self.assertDictEqual(dut.at(t=11580+400+250), {'val': 20, 'grad': -1.2})
+        # hold, kept after end
+        self.assertDictEqual(dut.at(t=12380+300), {'val': 25, 'grad': 0})
+        self.assertDictEqual(dut.at(t=86400), {'val': 25, 'grad': 0})
+        self.assertTrue(dut.seek(t=12380+599))
+        self.assertEqual([dut.next()['val'] for i in range(3)], [25, 25, 25])
+        # block rendering
+        ref = waves()
+        ref.set(wave="sequence", steps=steps, start=25, lowVal=-40, highVal=80)
+        blk = ref.block(start=0, count=12380+100)
+        for i in range(0, 12380+100, 7):
+            self.assertSample(blk['val'][i], ref.at(idx=i)['val'])
+            self.assertSample(blk['grad'][i], ref.at(idx=i)['grad'])
+    #*****************************
+
+
+    #*****************************
+    def test_file(self):
+        """
+        @note   tests sequence file and exceptions
+        """
+        with tempfile.TemporaryDirectory() as tmp:
+            file = os.path.join(tmp, "sequence.yml")
+            with open(file, 'w') as fH:
+                fH.write("start: 20\nsteps:\n  - repeat: 1000\n    steps:\n      - ramp: {to: 30, time: 10s}\n      - ramp: {to: 20, rate: 1C/s}\n")
+            dut = waves()
+            self.assertTrue(dut.set(wave="sequence", file=file))
+            self.assertEqual(len(dut.waveDescr['seg']), 2001)
+            self.assertEqual(dut.waveDescr['x']['n'], 20000)
+            self.assertEqual(list(dut.render(count=21)['val']), list(range(20, 30)) + list(range(30, 20, -1)) + [20])
+            self.assertDictEqual(dut.at(idx=19995), {'val': 25, 'grad': -1})
+            # limits, start from initVal
+            with self.assertRaises(ValueError) as cm:
+                dut.set(wave="sequence", file=file, highVal=25)
+            self.assertEqual(str(cm.exception), "Sequence temperature range [20.0, 30.0] exceeds limits")
+        with self.assertRaises(ValueError) as cm:
+            sequence.init(dut, steps=[{'soak': 10}])
+        self.assertEqual(str(cm.exception), "Sequence requires start temperature")
+        self.assertEqual(sequence.init(dut, steps=[{'soak': 10}], initVal=5)[1]['seg'].val[0], 5)
+        with self.assertRaises(ValueError) as cm:
+            sequence.init(dut, steps=[{'cool': 10}], start=0)
+        self.assertEqual(str(cm.exception), "Unsupported sequence step '{'cool': 10}'")
+        with self.assertRaises(ValueError) as cm:
+            sequence.init(dut, steps=[{'hold': {'time': 10}}], start=0)
+        self.assertEqual(str(cm.exception), "Sequence step 'hold' requires 'temp'")
+        with self.assertRaises(ValueError) as cm:
+            sequence.init(dut, steps=[{'ramp': {'to': 10, 'rate': 2}}], start=0)
+        self.assertEqual(str(cm.exception), "Sequence step 'ramp' requires rate with unit, f.e. '2C/min'")
+    #*****************************
+
+
+    #*****************************
+    def test_repeat(self):
+        """
+        @note   copied passes are identical to unrolled steps
+        """
+        body = [{'soak': 60}, {'ramp': {'to': 40, 'rate': "2C/min"}}, {'repeat': 3, 'steps': [{'hold': {'temp': 35, 'time': 30}}, {'ramp': {'to': 45, 'time': 45}}]}]
+        unrolled = [{'soak': 60}, {'ramp': {'to': 40, 'rate': "2C/min"}}] + 3*[{'hold': {'temp': 35, 'time': 30}}, {'ramp': {'to': 45, 'time': 45}}]
+        dut = sequence.init(waves(), steps=[{'repeat': 4, 'steps': body}], start=20)[1]
+        ref = sequence.init(waves(), steps=4*unrolled, start=20)[1]
+        for key in ('start', 'val', 'grad'):
+            self.assertEqual(getattr(dut['seg'], key), getattr(ref['seg'], key))
+        self.assertEqual(dut['seg'].end, ref['seg'].end)
+        self.assertEqual(dut['seg'].val[0:3], array('d', [20, 20, 35]))      # first pass starts at start temperature
+        self.assertEqual(dut['seg'].val[8:10], array('d', [45, 45]))         # later passes at end temperature
+    #*****************************
+
+#------------------------------------------------------------------------------
+
+
+#------------------------------------------------------------------------------
+if __name__ == '__main__':
+    unittest.main()
+#------------------------------------------------------------------------------
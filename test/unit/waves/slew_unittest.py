@@ -0,0 +1,109 @@
+# -*- coding: utf-8 -*-
+"""
+@author:        Andreas Kaeberlein
+@copyright:     Copyright 2026
+@credits:       AKAE
+
+@license:       GPLv3
+@maintainer:    Andreas Kaeberlein
+@email:         andreas.kaeberlein@web.de
+
+@file:          slew_unittest.py
+@date:          2026-10-17
+
+@note           Unittest for slew.py
+                  run ./test/unit/waves/slew_unittest.py
+"""
+
+
+
+#------------------------------------------------------------------------------
+# Standard
+import sys        # python path handling
+import os         # platform independent paths
+import unittest   # performs test
+# Self
+sys.path.append(os.path.abspath((os.path.dirname(os.path.abspath(__file__)) + "/../../../")))  # add project root to lib search path
+from ATWG.waves import slew                                                                   # Python Script under test
+from ATWG.waves.waves import waves                                                            # waveform generator
+#------------------------------------------------------------------------------
+
+
+
+#------------------------------------------------------------------------------
+class TestSlew(unittest.TestCase):
+
+    #*****************************
+    def setUp(self):
+        """
+        @note   set-ups test, trapezoid 10..60 with 1 C/s ramps
+        """
+        self.args = {'wave': "trapezoid", 'ts': 1, 'tp': 200, 'tr': 50, 'tf': 25, 'dutyCycle': 0.5, 'lowVal': 10, 'highVal': 60}
+    #*****************************
+
+
+    #*****************************
+    def test_check(self):
+        """
+        @note   tests feasibility check
+        """
+        dut = waves()
+        dut.set(**self.args)
+        # feasible
+        rpt = slew.check(wave=dut, rise=1.0, fall=-2.0, low=10, high=60)
+        self.assertTrue(rpt['feasible'])
+        self.assertEqual((rpt['samples'], rpt['min'], rpt['max']), (200, 10, 60))
+        self.assertEqual((rpt['rise']['max'], rpt['fall']['min']), (1, -2))
+        # violations, small blocks
+        for chunk in (7, 1<<16):
+            rpt = slew.check(wave=dut, rise=0.5, fall=-1.0, low=20, high=60, chunk=chunk)
+            self.assertFalse(rpt['feasible'])
+            self.assertEqual(rpt['rise']['violations'], 50)
+            self.assertEqual(rpt['rise']['first'], 0)
+            self.assertEqual(rpt['fall']['violations'], 25)
+            self.assertEqual(rpt['fall']['first'], 112)
+            self.assertEqual(rpt['below'], 10+4+63)
+            self.assertEqual(rpt['above'], 0)
+        # endless waveform
+        dut.set(wave="expr", expr="t")
+        with self.assertRaises(ValueError) as cm:
+            slew.check(wave=dut)
+        self.assertEqual(str(cm.exception), "Feasibility check requires finite waveform")
+    #*****************************
+
+
+    #*****************************
+    def test_limiter(self):
+        """
+        @note   tests slew limited stepping
+        """
+        dut = waves()
+        ref = waves()
+        ref.set(**self.args)
+        dut.set(slew={'rise': 0.5, 'fall': -0.5}, **self.args)
+        self.assertFalse(slew.check(wave=dut, rise=0.5, fall=-0.5)['feasible'])  # check sees unlimited waveform
+        seq = [dut.next() for i in range(400)]
+        val = [new['val'] for new in seq]
+        self.assertTrue(all(-0.5 <= b-a <= 0.5 for a, b in zip(val, val[1:])))
+        self.assertDictEqual(seq[10], {'val': 15, 'grad': 0.5})
+        self.assertEqual(max(val), 60)
+        self.assertEqual(min(val[1:]), 10.5)     # rise starts before setpoint reaches low value
+        # setpoint catches up with waveform
+        self.assertDictEqual(seq[110], ref.at(idx=110))
+        # start at measured value
+        dut.limit.reset(val=30)
+        dut.seek(idx=0)
+        self.assertDictEqual(dut.next(), {'val': 29.5, 'grad': -0.5})
+        # exception
+        with self.assertRaises(ValueError) as cm:
+            dut.set(slew={'rise': 0.5, 'fall': 0.5}, **self.args)
+        self.assertEqual(str(cm.exception), "Positive rise and negative fall slew rate required")
+    #*****************************
+
+#------------------------------------------------------------------------------
+
+
+#------------------------------------------------------------------------------
+if __name__ == '__main__':
+    unittest.main()
+#------------------------------------------------------------------------------
@@ -0,0 +1,121 @@
+# -*- coding: utf-8 -*-
+"""
+@author:        Andreas Kaeberlein
+@copyright:     Copyright 2026
+@credits:       AKAE
+
+@license:       GPLv3
+@maintainer:    Andreas Kaeberlein
+@email:         andreas.kaeberlein@web.de
+
+@file:          stochastic_unittest.py
+@date:          2026-10-17
+
+@note           Unittest for stochastic.py
+                  run ./test/unit/waves/stochastic_unittest.py
+"""
+
+
+
+#------------------------------------------------------------------------------
+# Standard
+import sys        # python path handling
+import os         # platform independent paths
+import unittest   # performs test
+# Self
+sys.path.append(os.path.abspath((os.path.dirname(os.path.abspath(__file__)) + "/../../../")))  # add project root to lib search path
+from ATWG.waves import stochastic                                                             # Python Script under test
+from ATWG.waves import slew                                                                   # bounds and slew check
+from ATWG.waves.waves import waves                                                            # waveform generator
+#------------------------------------------------------------------------------
+
+
+
+#------------------------------------------------------------------------------
+class TestStochastic(unittest.TestCase):
+
+    #*****************************
+    def test_uniform(self):
+        """
+        @note   tests counter based random numbers
+        """
+        u = list(stochastic.uniform(seed=7, stream=1, count=1000))
+        self.assertEqual(u[:10], list(stochastic.uniform(seed=7, stream=1, count=10)))       # prefix stable
+        self.assertNotEqual(u[:10], list(stochastic.uniform(seed=8, stream=1, count=10)))
+        self.assertNotEqual(u[:10], list(stochastic.uniform(seed=7, stream=2, count=10)))
+        self.assertTrue(all(0 <= v < 1 for v in u))
+        self.assertAlmostEqual(sum(u)/len(u), 0.5, delta=0.05)
+        # numpy and python path
+        key = stochastic.mix((7 * stochastic.GOLDEN + 1) & stochastic.MASK)
+        self.assertEqual(u[2], (stochastic.mix((key + 3*stochastic.GOLDEN) & stochastic.MASK) >> 11) * 2.0**-53)
+    #*****************************
+
+
+    #*****************************
+    def test_shapes(self):
+        """
+        @note   tests range, slew, reproducibility and random access
+        """
+        for shape, kwargs in (("randwalk", {'tk': 30}), ("noise", {'tmin': 1800}), ("dwell", {'td': 3600, 'levels': 6})):
+            dut = waves()
+            self.assertTrue(dut.set(wave=shape, seed="42", ts=1, tp=14400, lowVal=-40, highVal=85, tr=1250, tf=2500, **kwargs))
+            seq = [dut.next() for i in range(1000)]
+            blk = dut.block(start=0, count=14400)
+            for i in (0, 1, 555, 999):
+                self.assertAlmostEqual(blk['val'][i], seq[i]['val'], places=9)
+                self.assertAlmostEqual(blk['grad'][i], seq[i]['grad'], places=9)
+            self.assertAlmostEqual(dut.at(idx=12345)['val'], blk['val'][12345], places=9)
+            self.assertAlmostEqual(dut.at(idx=14400+7)['val'], blk['val'][7], places=9)         # periodic
+            rpt = slew.check(wave=dut, rise=0.1*1.000001, fall=-0.05*1.000001, low=-40, high=85)
+            self.assertTrue(rpt['feasible'], shape)
+            self.assertGreater(rpt['max'] - rpt['min'], 10, shape)                              # not flat
+            # same seed, same profile
+            ref = waves()
+            ref.set(wave=shape, seed=42, ts=1, tp=14400, lowVal=-40, highVal=85, tr=1250, tf=2500, **kwargs)
+            self.assertEqual(list(ref.block(start=0, count=14400)['val']), list(blk['val']))
+            ref.set(wave=shape, seed=43, ts=1, tp=14400, lowVal=-40, highVal=85, tr=1250, tf=2500, **kwargs)
+            self.assertNotEqual(list(ref.block(start=0, count=14400)['val']), list(blk['val']))
+    #*****************************
+
+
+    #*****************************
+    def test_randwalk(self):
+        """
+        @note   tests reflection and start value
+        """
+        dut = waves()
+        self.assertTrue(dut.set(wave="randwalk", seed=1, ts=1, tp=3600, lowVal=20, highVal=21, initVal=20.5, tk=10))
+        self.assertEqual(dut.next()['val'], 20.5)
+        blk = dut.block(start=0, count=3600)
+        self.assertTrue(all(20 <= v <= 21 for v in blk['val']))
+        self.assertEqual(dut.at(idx=3600)['val'], 20.5)   # closes period
+    #*****************************
+
+
+    #*****************************
+    def test_dwell(self):
+        """
+        @note   tests levels and ramp check
+        """
+        dut = waves()
+        self.assertTrue(dut.set(wave="dwell", seed=3, ts=60, tp=86400, lowVal=0, highVal=100, td=3600, levels=5))
+        self.assertTrue(set(dut.block(start=0, count=1440)['val']) <= {0, 25, 50, 75, 100})     # jumps without tr/tf
+        # dwell time raised until ramps fit, ramps at limit are feasible
+        self.assertTrue(dut.set(wave="dwell", seed=3, ts=60, tp=86400, lowVal=0, highVal=100, tr=7200, td=3600, levels=5))
+        self.assertGreater(dut.waveDescr['y']['td'], 3600)
+        self.assertLessEqual(max(dut.waveDescr['y']['ramp']), dut.waveDescr['y']['td'])
+        self.assertTrue(slew.check(wave=dut, rise=100/7200, fall=-float('inf'))['feasible'])
+        self.assertTrue(dut.set(wave="dwell", seed=3, ts=60, tp=3600, lowVal=0, highVal=100, tr=7200, td=600))
+        self.assertEqual(dut.waveDescr['y']['td'], 3600)        # single level
+        with self.assertRaises(ValueError) as cm:
+            dut.set(wave="noise", lowVal=10, highVal=10)
+        self.assertEqual(str(cm.exception), "Random waveform requires lowVal < highVal")
+    #*****************************
+
+#------------------------------------------------------------------------------
+
+
+#------------------------------------------------------------------------------
+if __name__ == '__main__':
+    unittest.main()
+#------------------------------------------------------------------------------
@@ -0,0 +1,166 @@
+# -*- coding: utf-8 -*-
+"""
+@author:        Andreas Kaeberlein
+@copyright:     Copyright 2026
+@credits:       AKAE
+
+@license:       GPLv3
+@maintainer:    Andreas Kaeberlein
+@email:         andreas.kaeberlein@web.de
+
+@file:          store_unittest.py
+@date:          2026-10-17
+
+@note           Unittest for store.py
+                  run ./test/unit/waves/store_unittest.py
+"""
+
+
+
+#------------------------------------------------------------------------------
+# Standard
+import sys        # python path handling
+import os         # platform independent paths
+import unittest   # performs test
+import tempfile   # cache directory
+import struct     # file format
+# Self
+sys.path.append(os.path.abspath((os.path.dirname(os.path.abspath(__file__)) + "/../../../")))  # add project root to lib search path
+from ATWG.waves.store import waveStore                                                        # Python Script under test
+from ATWG.waves.waves import waves                                                            # waveform generator
+#------------------------------------------------------------------------------
+
+
+
+#------------------------------------------------------------------------------
+class TestStore(unittest.TestCase):
+
+    #*****************************
+    def setUp(self):
+        """
+        @note   set-ups test
+        """
+        self.tmp = tempfile.TemporaryDirectory()
+        self.args = {'wave': "sine", 'ts': 2, 'tp': 1800, 'lowVal': -20, 'highVal': 20, 'initVal': 5}
+    #*****************************
+
+
+    #*****************************
+    def tearDown(self):
+        """
+        @note   removes cache
+        """
+        self.tmp.cleanup()
+    #*****************************
+
+
+    #*****************************
+    def test_build(self):
+        """
+        @note   tests store build and reuse
+        """
+        store = waveStore(path=self.tmp.name, chunk=100)
+        self.assertEqual(None, store.lookup(self.args))
+        # first run builds
+        dut = waves()
+        self.assertTrue(dut.set(store=store, **self.args))
+        self.assertEqual(len(os.listdir(self.tmp.name)), 1)
+        # second run reuses
+        self.assertNotEqual(None, store.lookup(self.args))
+        dut2 = waves()
+        self.assertTrue(dut2.set(store=store, **self.args))
+        self.assertEqual(len(os.listdir(self.tmp.name)), 1)
+        # compare with closed form, quantized
+        ref = waves()
+        self.assertTrue(ref.set(**self.args))
+        for i in range(2000):
+            a = dut2.next()
+            b = ref.next()
+            self.assertTrue(abs(a['val']-b['val']) <= 0.05+1e-9)
+            self.assertTrue(abs(a['grad']-b['grad']) <= 0.5e-4+1e-12)
+        self.assertTrue(dut2.seek(idx=123))
+        self.assertTrue(ref.seek(idx=123))
+        self.assertAlmostEqual(dut2.next()['val'], ref.next()['val'], delta=0.05+1e-9)
+        # blocks are slices, wrapped with period
+        pos = dut2.position(idx=850)
+        blk = dut2.block(start=pos, count=2000)
+        seq = [dut2.at(idx=850+i) for i in range(2000)]
+        self.assertEqual(list(blk['val']), [new['val'] for new in seq])
+        self.assertEqual(list(blk['grad']), [new['grad'] for new in seq])
+        self.assertEqual(dut2.render_block(start=pos, count=2000)[0], dut2.advance(pos, 2000))
+        # little-endian int16 columns
+        with open(store.file(self.args), 'rb') as fH:
+            raw = fH.read()
+        self.assertEqual(struct.unpack_from("<h", raw, waveStore.HEADER.size)[0] * 0.1, dut2.at(idx=0)['val'])
+        # other args, other file
+        self.assertTrue(dut.set(store=store, **dict(self.args, initVal=0)))
+        self.assertEqual(len(os.listdir(self.tmp.name)), 2)
+    #*****************************
+
+
+    #*****************************
+    def test_float(self):
+        """
+        @note   float64 store is identical to closed form
+        """
+        store = waveStore(path=self.tmp.name, dtype='d')
+        dut = waves()
+        ref = waves()
+        self.assertTrue(dut.set(store=store, **self.args))
+        self.assertTrue(ref.set(**self.args))
+        for i in range(2000):
+            self.assertDictEqual(dut.next(), ref.next())
+    #*****************************
+
+
+    #*****************************
+    def test_fraction(self):
+        """
+        @note   negative fractional iterators interpolate over period wrap
+        """
+        args = {'wave': "trapezoid", 'ts': 1, 'tp': 10, 'lowVal': 0, 'highVal': 10, 'tr': 2, 'tf': 2, 'dutyCycle': 0.5}
+        dut = waves()
+        ref = waves()
+        self.assertTrue(dut.set(store=waveStore(path=self.tmp.name, dtype='d'), **args))
+        self.assertTrue(ref.set(**args))
+        self.assertEqual(dut.position(t=9.5), -0.5)
+        self.assertEqual(dut.at(t=9.5), {'val': 0.0, 'grad': 0.0})
+        for t in [k+0.5 for k in range(25)]:
+            self.assertAlmostEqual(dut.at(t=t)['val'], ref.at(t=t)['val'])
+            self.assertAlmostEqual(dut.at(t=t)['grad'], ref.at(t=t)['grad'])
+        blk = dut.block(start=dut.position(t=9.5), count=25)
+        seq = ref.block(start=ref.position(t=9.5), count=25)
+        for i in range(25):
+            self.assertAlmostEqual(blk['val'][i], seq['val'][i])
+            self.assertAlmostEqual(blk['grad'][i], seq['grad'][i])
+    #*****************************
+
+
+    #*****************************
+    def test_evict(self):
+        """
+        @note   tests size limit
+        """
+        store = waveStore(path=self.tmp.name, maxBytes=3000)   # fits one store file
+        dut = waves()
+        for init in (0, 5, 10):
+            self.assertTrue(dut.set(store=store, **dict(self.args, initVal=init)))
+            self.assertEqual(len(os.listdir(self.tmp.name)), 1)
+        self.assertNotEqual(None, store.lookup(dict(self.args, initVal=10)))   # latest survives
+        # exceptions
+        with self.assertRaises(ValueError) as cm:
+            waveStore(path=self.tmp.name, dtype='q')
+        self.assertEqual(str(cm.exception), "Unsupported store type 'q'")
+        with self.assertRaises(ValueError) as cm:
+            dut.set(store=waveStore(path=self.tmp.name, valRes=1e-4), **self.args)
+        self.assertEqual(str(cm.exception), "Sample exceeds int16 store range, increase resolution")
+        self.assertEqual(len(os.listdir(self.tmp.name)), 1)     # no temporary file left
+    #*****************************
+
+#------------------------------------------------------------------------------
+
+
+#------------------------------------------------------------------------------
+if __name__ == '__main__':
+    unittest.main()
+#------------------------------------------------------------------------------
@@ -0,0 +1,78 @@
+# -*- coding: utf-8 -*-
+"""
+@author:        Andreas Kaeberlein
+@copyright:     Copyright 2026
+@credits:       AKAE
+
+@license:       GPLv3
+@maintainer:    Andreas Kaeberlein
+@email:         andreas.kaeberlein@web.de
+
+@file:          units_unittest.py
+@date:          2026-10-17
+
+@note           Unittest for units.py
+                  run ./test/unit/waves/units_unittest.py
+"""
+
+
+
+#------------------------------------------------------------------------------
+# Standard
+import sys        # python path handling
+import os         # platform independent paths
+import unittest   # performs test
+# Self
+sys.path.append(os.path.abspath((os.path.dirname(os.path.abspath(__file__)) + "/../../../")))  # add project root to lib search path
+from ATWG.waves import units                                                                  # Python Script under test
+#------------------------------------------------------------------------------
+
+
+
+#------------------------------------------------------------------------------
+class TestUnits(unittest.TestCase):
+
+    #*****************************
+    def test_time_to_sec(self):
+        """
+        @note   tests time string conversion
+        """
+        self.assertEqual(units.time_to_sec(60), 60)
+        self.assertEqual(units.time_to_sec("01:02:30"), 3750)
+        self.assertEqual(units.time_to_sec("1.5day 2.5h"), 138600)
+        self.assertEqual(units.time_to_sec("100ms"), 0.1)
+        with self.assertRaises(ValueError) as cm:
+            units.time_to_sec("1h!")
+        self.assertEqual(str(cm.exception), "Unrecognized time string '1h!'")
+    #*****************************
+
+
+    #*****************************
+    def test_temp_grad_to_time(self):
+        """
+        @note   tests gradient conversion
+        """
+        self.assertEqual(units.temp_grad_to_time(gradient="5sec"), 5)
+        self.assertEqual(units.temp_grad_to_time(gradient="2K/min", deltaTemp=10), 300)
+        with self.assertRaises(ValueError) as cm:
+            units.temp_grad_to_time(gradient="2K/min")
+        self.assertEqual(str(cm.exception), "Low/High Temperature value for total slew time required")
+    #*****************************
+
+
+    #*****************************
+    def test_no_generator(self):
+        """
+        @note   waveforms convert strings without importing the generator
+        """
+        from ATWG.waves import composite, sequence
+        self.assertNotIn("ATWG.ATWG", sys.modules)
+    #*****************************
+
+#------------------------------------------------------------------------------
+
+
+#------------------------------------------------------------------------------
+if __name__ == '__main__':
+    unittest.main()
+#------------------------------------------------------------------------------
@@ -23,6 +23,10 @@ import sys        # python path handling
 import os         # platform independent paths
 import unittest   # performs test
 import math       # check nan
+try:
+    import numpy      # optional, block rendering
+except ImportError:
+    numpy = None
 # Self
 sys.path.append(os.path.abspath((os.path.dirname(os.path.abspath(__file__)) + "/../../../")))  # add project root to lib search path
 from ATWG.waves.waves import waves                                                             # Python Script under test
@@ -109,6 +113,11 @@ class TestWaves(unittest.TestCase):
         self.assertEqual(wave['y']['amp'], 20)
         self.assertEqual(wave['y']['ofs'], 0)
         self.assertEqual(iter, 1/2 * (period / sample))
+        # Init below middle value on falling slope, phase=210deg
+        (iter, wave) = dut.sine(ts=sample, tp=period, lowVal=lowVal, highVal=highVal, initVal=-10, pSlope=False)
+        self.assertEqual(iter, 7/12 * (period / sample))
+        (iter, wave) = dut.sine(ts=sample, tp=period, lowVal=lowVal, highVal=highVal, initVal=-10, pSlope=True)
+        self.assertEqual(iter, 11/12 * (period / sample))
     #*****************************
 
 
@@ -136,16 +145,22 @@ class TestWaves(unittest.TestCase):
             # check only in 90 degree grid to numeric resolution
             if ( i == int(0 * (period / sample)) ):
                 self.assertEqual(round(newVal['val'], 10), ampVal)                                      # round to numeric noise, 10digits
-                self.assertEqual(round(newVal['grad'], 10), round(ampVal*2*math.pi*sample/period, 10))  # highest slew rate
+                self.assertEqual(round(newVal['grad'], 10), round(ampVal*2*math.pi/period, 10))  # highest slew rate per sec
             elif ( i == int(0.25 * (period / sample)) ):
                 self.assertEqual(round(newVal['val'], 10), highVal)
                 self.assertEqual(round(newVal['grad'], 10), float(0))   # round to numeric noise, 10digits
             elif ( i == int(0.5 * (period / sample)) ):
                 self.assertEqual(round(newVal['val'], 10), ampVal)                                          # round to numeric noise, 10digits
-                self.assertEqual(round(newVal['grad'], 10), round(-ampVal*2*math.pi*sample/period, 10))     # highest slew rate
+                self.assertEqual(round(newVal['grad'], 10), round(-ampVal*2*math.pi/period, 10))     # highest slew rate per sec
             elif ( i == int(0.75 * (period / sample)) ):
                 self.assertEqual(round(newVal['val'], 10), lowVal)
                 self.assertEqual(round(newVal['grad'], 10), float(0))   # round to numeric noise, 10digits
+        # gradient per sec independent of sample time
+        for ts in (0.1, 1, 2):
+            for phasor in (False, True):
+                self.assertTrue(dut.set(wave="sine", ts=ts, tp=period, lowVal=lowVal, highVal=highVal, phasor=phasor))
+                self.assertAlmostEqual(dut.next()['grad'], ampVal*2*math.pi/period, places=12)
+            self.assertAlmostEqual(dut.block(start=0, count=1)['grad'][0], ampVal*2*math.pi/period, places=12)
     #*****************************
 
 
@@ -274,6 +289,59 @@ class TestWaves(unittest.TestCase):
     #*****************************
 
 
+    #*****************************
+    def test_subsecond(self):
+        """
+        @note   sample time below one second and period no multiple of it
+        """
+        dut = waves()
+        # period multiple of sample time
+        self.assertTrue(dut.set(wave="sine", ts=0.1, tp=3600, lowVal=-1, highVal=1))
+        self.assertEqual(dut.waveDescr['x']['n'], 36000)
+        self.assertDictEqual(dut.at(t=0.3), dut.at(idx=3))
+        # remainder is kept, no accumulated period error
+        self.assertTrue(dut.set(wave="sine", ts=0.7, tp=3600, lowVal=-1, highVal=1))
+        self.assertAlmostEqual(dut.waveDescr['x']['n'], 3600/0.7)
+        for k in range(100000):
+            val = dut.next()['val']
+        self.assertAlmostEqual(val, math.sin(2*math.pi*(100000-1)*0.7/3600), places=9)
+        self.assertAlmostEqual(dut.at(idx=1000000)['val'], math.sin(2*math.pi*1000000*0.7/3600), places=9)
+        self.assertTrue(dut.set(wave="trapezoid", ts=0.3, tp=10, tr=3, tf=3, dutyCycle=0.5, lowVal=0, highVal=10))
+        self.assertEqual(len(dut.render(1000)['val']), 1000)
+        self.assertAlmostEqual(dut.at(idx=67)['val'], 1/3)      # 0.1s into third rise
+    #*****************************
+
+
+    #*****************************
+    def test_register(self):
+        """
+        @note   tests registration of user waveform
+        """
+        # user shape, constant value
+        def const_init(self, ts=1, val=0):
+            return (0, {'x': {'ts': ts, 'n': 1}, 'y': {'val': val}})
+        def const_step(self, iterator, wave):
+            return (iterator, {'val': wave['y']['val'], 'grad': 0})
+        self.assertTrue(waves.register(name="const", init=const_init, step=const_step, help="constant value"))
+        try:
+            # exceptions
+            with self.assertRaises(ValueError) as cm:
+                waves.register(name="const", init=const_init, step=const_step)
+            self.assertEqual(str(cm.exception), "Waveform 'const' already registered")
+            with self.assertRaises(ValueError) as cm:
+                waves.register(name="foo")
+            self.assertEqual(str(cm.exception), "Waveform requires name, init and step function")
+            # use
+            dut = waves()
+            self.assertTrue(dut.set(wave="const", val=5))
+            self.assertDictEqual(dut.next(), {'val': 5, 'grad': 0})
+            self.assertDictEqual(dut.at(t=100), {'val': 5, 'grad': 0})
+            self.assertEqual(list(dut.render(3)['val']), [5, 5, 5])
+        finally:
+            del waves.shapes['const']
+    #*****************************
+
+
     #*****************************
     def test_next_exception(self):
         """
@@ -322,6 +390,107 @@ class TestWaves(unittest.TestCase):
             self.assertEqual(dut.iterator, cnt)
         #*****************************
 
+
+    #*****************************
+    def test_at_seek(self):
+        """
+        @note   tests random access of waveform
+        """
+        # init values
+        sample = 2      # sample time in seconds
+        period = 1802   # period in seconds, quarter iterators
+        for args in ({'wave': "sine", 'ts': sample, 'tp': period, 'lowVal': -20, 'highVal': 20, 'initVal': 15, 'pSlope': False},
+                     {'wave': "trapezoid", 'ts': sample, 'tp': period, 'lowVal': -20, 'highVal': 20, 'dutyCycle': 0.5, 'tr': 80, 'tf': 120, 'initVal': 0}):
+            dut = waves()
+            ref = waves()
+            self.assertTrue(dut.set(**args))
+            self.assertTrue(ref.set(**args))
+            # compare with stepping
+            for i in range(3*int(period/sample)):
+                val = ref.next()
+                if ( 0 == i % 7 ):
+                    self.assertDictEqual(dut.at(idx=i), val)
+                    self.assertDictEqual(dut.at(t=i*sample), val)
+            self.assertEqual(dut.iterator, dut.iterInit)    # at() keeps state
+            # jump and continue
+            self.assertTrue(dut.seek(t=3*period))
+            self.assertEqual(dut.iterator, ref.iterator)
+            self.assertDictEqual(dut.next(), ref.next())
+            # between samples
+            self.assertTrue(args['lowVal'] <= dut.at(t=sample/2)['val'] <= args['highVal'])
+        # exceptions
+        with self.assertRaises(ValueError) as cm:
+            dut.at()
+        self.assertEqual(str(cm.exception), "Either time or sample index required")
+        with self.assertRaises(ValueError) as cm:
+            dut.seek(idx=-1)
+        self.assertEqual(str(cm.exception), "Only non-negative time allowed")
+        with self.assertRaises(ValueError) as cm:
+            waves().at(t=0)
+        self.assertEqual(str(cm.exception), "Uninitialized waveform")
+    #*****************************
+
+
+    #*****************************
+    def assertSample(self, first, second):
+        """
+        @note   blocks are bit identical without numpy, vectorized sin/cos can differ in the last bit
+        """
+        if ( None == numpy ):
+            self.assertEqual(first, second)
+        else:
+            self.assertAlmostEqual(first, second, places=9)
+    #*****************************
+
+
+    #*****************************
+    def test_render(self):
+        """
+        @note   tests block rendering against single steps
+        """
+        # init values
+        sample = 2      # sample time in seconds
+        period = 1800   # period in seconds
+        count = 2000    # more then one period
+        for args in ({'wave': "sine", 'ts': sample, 'tp': period, 'lowVal': -20, 'highVal': 20, 'initVal': 5, 'pSlope': False},
+                     {'wave': "trapezoid", 'ts': sample, 'tp': period, 'lowVal': -20, 'highVal': 20, 'dutyCycle': 0.5, 'tr': 80, 'tf': 120, 'initVal': 0}):
+            dut = waves()
+            ref = waves()
+            self.assertTrue(dut.set(**args))
+            self.assertTrue(ref.set(**args))
+            # block does not change state
+            blk = dut.block(start=dut.iterator, count=count)
+            self.assertEqual(dut.iterator, ref.iterator)
+            # render advances wave
+            new = dut.render(count)
+            self.assertEqual(len(new['val']), count)
+            self.assertEqual(len(new['grad']), count)
+            for i in range(count):
+                val = ref.next()
+                self.assertSample(new['val'][i], val['val'])
+                self.assertSample(new['grad'][i], val['grad'])
+                self.assertSample(blk['val'][i], val['val'])
+            self.assertEqual(dut.iterator, ref.iterator)
+            # empty block
+            self.assertEqual(len(dut.render(0)['val']), 0)
+            # fractional period and random access start
+            self.assertTrue(dut.set(**dict(args, tp=period+1)))
+            for start in (-0.5, dut.position(t=5), dut.position(idx=899)):
+                blk = dut.block(start=start, count=count)
+                (iterator, step) = (start, [])
+                for i in range(count):
+                    (iterator, new) = dut.evalFunc(iterator, dut.waveDescr)
+                    step.append(new)
+                for i in range(count):
+                    self.assertSample(blk['val'][i], step[i]['val'])
+                    self.assertSample(blk['grad'][i], step[i]['grad'])
+                self.assertEqual(dut.render_block(start=start, count=count)[0], iterator)
+        # exception
+        with self.assertRaises(ValueError) as cm:
+            waves().render(10)
+        self.assertEqual(str(cm.exception), "Uninitialized waveform")
+    #*****************************
+
 #------------------------------------------------------------------------------
 
 